@@ -0,0 +1,43 @@
+"""Add composite lookup index on email_otps
+
+Every OTP send/verify filters on (email, purpose) and the live-code
+predicate (verified_at IS NULL AND expires_at > now). The single-column
+`email` index made each verify walk the address's whole OTP history; the
+composite index narrows the probe to one (email, purpose) range ordered by
+expiry. MySQL has no partial indexes, so the table is kept small by the
+`audit_cleanup` worker pruning rows expired for more than a day.
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, table, name):
+    return conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.statistics "
+        "WHERE table_schema=DATABASE() AND table_name=:t AND index_name=:n"
+    ), {"t": table, "n": name}).scalar() > 0
+
+
+def upgrade():
+    conn = op.get_bind()
+    if not _index_exists(conn, 'email_otps', 'ix_email_otps_lookup'):
+        op.create_index(
+            'ix_email_otps_lookup',
+            'email_otps',
+            ['email', 'purpose', 'expires_at'],
+        )
+
+
+def downgrade():
+    op.drop_index('ix_email_otps_lookup', table_name='email_otps')
@@ -0,0 +1,77 @@
+"""Store knowledge-base embeddings as packed float32 instead of JSON
+
+`kb_prompts`, `kb_documents`, `kb_document_chunks` and `kb_faqs` kept each
+embedding as a JSON array of floats: ~20KB of text per 1536-dim vector,
+re-parsed into Python floats on every RAG query. They now hold the raw
+little-endian float32 bytes (4·dim bytes) read back with one
+`np.frombuffer` — see `app.db.types.Vector`.
+
+MySQL has no pgvector equivalent for ANN indexing, so similarity is still
+computed in-process; this migration only removes the JSON decode/storage
+overhead. Existing rows are converted in place.
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-16
+"""
+import json
+import struct
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '033'
+down_revision = '032'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('kb_prompts', 'kb_documents', 'kb_document_chunks', 'kb_faqs')
+
+
+def _pack(values):
+    return struct.pack(f'<{len(values)}f', *values)
+
+
+def _unpack(blob):
+    return list(struct.unpack(f'<{len(blob) // 4}f', blob))
+
+
+def _swap_column(table, new_type, convert):
+    """Add `embedding_tmp`, copy converted values, then replace `embedding`."""
+    bind = op.get_bind()
+    op.add_column(table, sa.Column('embedding_tmp', new_type, nullable=True))
+
+    rows = bind.execute(sa.text(
+        f"SELECT id, embedding FROM {table} WHERE embedding IS NOT NULL"
+    )).fetchall()
+    for row_id, value in rows:
+        bind.execute(
+            sa.text(f"UPDATE {table} SET embedding_tmp = :v WHERE id = :i"),
+            {"v": convert(value), "i": row_id},
+        )
+
+    op.drop_column(table, 'embedding')
+    op.alter_column(
+        table, 'embedding_tmp',
+        new_column_name='embedding',
+        existing_type=new_type,
+        existing_nullable=True,
+    )
+
+
+def upgrade():
+    def to_blob(value):
+        if isinstance(value, (bytes, str)):
+            value = json.loads(value)
+        return _pack(value)
+
+    for table in TABLES:
+        _swap_column(table, sa.LargeBinary(), to_blob)
+
+
+def downgrade():
+    for table in TABLES:
+        _swap_column(table, sa.JSON(), lambda blob: json.dumps(_unpack(blob)))
@@ -0,0 +1,53 @@
+"""Add int8-quantized embedding_q copies for first-stage KB recall
+
+Adds `embedding_q` (float32 scale + one int8 code per dimension, ~1/4 the
+bytes of the float32 vector) to `kb_prompts`, `kb_document_chunks` and
+`kb_faqs`, and backfills it from the existing `embedding` column. Semantic
+search scores every candidate against this column and only reads the
+float32 `embedding` of the top few for an exact rerank — see
+`app.db.types.QuantizedVector`.
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-16
+"""
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '034'
+down_revision = '033'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('kb_prompts', 'kb_document_chunks', 'kb_faqs')
+
+
+def _quantize(blob):
+    arr = np.frombuffer(blob, dtype='<f4')
+    peak = float(np.max(np.abs(arr))) if arr.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    codes = np.clip(np.rint(arr / scale), -127, 127).astype(np.int8)
+    return np.array([scale], dtype='<f4').tobytes() + codes.tobytes()
+
+
+def upgrade():
+    bind = op.get_bind()
+    for table in TABLES:
+        op.add_column(table, sa.Column('embedding_q', sa.LargeBinary(), nullable=True))
+        rows = bind.execute(sa.text(
+            f"SELECT id, embedding FROM {table} WHERE embedding IS NOT NULL"
+        )).fetchall()
+        for row_id, blob in rows:
+            bind.execute(
+                sa.text(f"UPDATE {table} SET embedding_q = :q WHERE id = :i"),
+                {"q": _quantize(blob), "i": row_id},
+            )
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_column(table, 'embedding_q')
@@ -0,0 +1,49 @@
+"""Index active lounge memberships and queued notifications
+
+`lounge_memberships` is almost always filtered by `lounge_id = ? AND
+left_at IS NULL` (member counts, capacity checks). MySQL can't build the
+partial `WHERE left_at IS NULL` index, but a composite `(lounge_id,
+left_at)` index keeps each lounge's active members in one contiguous
+range, so the COUNT(*) is index-only and skips churned members' rows.
+
+The same idea for the notification worker: `(status, user_id)` turns the
+`status = 'queued'` scan into a single index range.
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '035'
+down_revision = '034'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_lounge_memberships_active', 'lounge_memberships', ['lounge_id', 'left_at']),
+    ('ix_notifications_status_user', 'notifications', ['status', 'user_id']),
+)
+
+
+def _index_exists(conn, table, name):
+    return conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.statistics "
+        "WHERE table_schema=DATABASE() AND table_name=:t AND index_name=:n"
+    ), {"t": table, "n": name}).scalar() > 0
+
+
+def upgrade():
+    conn = op.get_bind()
+    for name, table, columns in INDEXES:
+        if not _index_exists(conn, table, name):
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
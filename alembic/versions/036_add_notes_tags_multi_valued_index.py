@@ -0,0 +1,45 @@
+"""Add a multi-valued index on notes.tags
+
+Tag filters on notes now compile to `:tag MEMBER OF(tags)` (see
+`app.db.expressions.json_array_has`) instead of a LIKE over the serialized
+JSON, so a MySQL 8.0.17+ multi-valued index can answer them — MySQL's
+counterpart to a Postgres GIN index on a JSONB array. MySQL's native JSON
+type is already stored in a parsed binary format, so there is no
+JSON -> JSONB column conversion to do.
+
+KB tag columns are only ever read back whole, never filtered on, so they
+don't get an index (it would only add write cost).
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '036'
+down_revision = '035'
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(conn, table, name):
+    return conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.statistics "
+        "WHERE table_schema=DATABASE() AND table_name=:t AND index_name=:n"
+    ), {"t": table, "n": name}).scalar() > 0
+
+
+def upgrade():
+    conn = op.get_bind()
+    if not _index_exists(conn, 'notes', 'ix_notes_tags_mv'):
+        op.execute(
+            "CREATE INDEX ix_notes_tags_mv ON notes "
+            "((CAST(tags AS CHAR(255) ARRAY)))"
+        )
+
+
+def downgrade():
+    op.drop_index('ix_notes_tags_mv', table_name='notes')
@@ -0,0 +1,50 @@
+"""Add composite RAG filter indexes on knowledge-base tables
+
+Every retrieval narrows candidates by `lounge_id` (or NULL for global),
+`is_active` and — for prompts/FAQs — `is_included_in_rag` before any
+vector is scored. With only the single-column `lounge_id` index, MySQL
+fetched every row for the lounge and filtered the flags afterwards; the
+composite indexes turn that into one range scan. `kb_document_chunks`
+also gets an explicitly named `document_id` index (InnoDB's implicit FK
+index is dropped automatically once this one exists).
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '037'
+down_revision = '036'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_kb_prompts_rag_filter', 'kb_prompts', ['lounge_id', 'is_active', 'is_included_in_rag']),
+    ('ix_kb_documents_rag_filter', 'kb_documents', ['lounge_id', 'is_active']),
+    ('ix_kb_document_chunks_doc', 'kb_document_chunks', ['document_id']),
+    ('ix_kb_faqs_rag_filter', 'kb_faqs', ['lounge_id', 'is_active', 'is_included_in_rag']),
+)
+
+
+def _index_exists(conn, table, name):
+    return conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.statistics "
+        "WHERE table_schema=DATABASE() AND table_name=:t AND index_name=:n"
+    ), {"t": table, "n": name}).scalar() > 0
+
+
+def upgrade():
+    conn = op.get_bind()
+    for name, table, columns in INDEXES:
+        if not _index_exists(conn, table, name):
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
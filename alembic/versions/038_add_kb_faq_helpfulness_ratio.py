@@ -0,0 +1,40 @@
+"""Add cached helpfulness ratio to kb_faqs
+
+`KBFaq.helpfulness_ratio` was only computable per row in Python (or as an
+unindexable expression in ORDER BY). The ratio is now stored in
+`helpfulness_ratio_cached`, kept current by the FAQ feedback UPDATE, and
+indexed so "most helpful first" pagination is an index scan.
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '038'
+down_revision = '037'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('kb_faqs', sa.Column(
+        'helpfulness_ratio_cached', sa.Float(),
+        nullable=False, server_default='0',
+    ))
+    op.execute(
+        "UPDATE kb_faqs SET helpfulness_ratio_cached = "
+        "helpful_count / (helpful_count + not_helpful_count) "
+        "WHERE helpful_count + not_helpful_count > 0"
+    )
+    op.create_index(
+        'ix_kb_faqs_helpfulness_ratio_cached', 'kb_faqs', ['helpfulness_ratio_cached']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_kb_faqs_helpfulness_ratio_cached', table_name='kb_faqs')
+    op.drop_column('kb_faqs', 'helpfulness_ratio_cached')
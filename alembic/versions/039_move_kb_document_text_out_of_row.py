@@ -0,0 +1,44 @@
+"""Move kb_documents.extracted_text into kb_document_texts
+
+Extracted document bodies can run to several MB and lived inline on
+`kb_documents`, so every document listing pulled them off disk. They now
+live in a one-to-one sibling table keyed by document id.
+
+Revision ID: 039
+Revises: 038
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = '039'
+down_revision = '038'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'kb_document_texts',
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('body', mysql.MEDIUMTEXT(), nullable=False),
+        sa.ForeignKeyConstraint(['document_id'], ['kb_documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('document_id'),
+    )
+    op.execute(
+        "INSERT INTO kb_document_texts (document_id, body) "
+        "SELECT id, extracted_text FROM kb_documents WHERE extracted_text IS NOT NULL"
+    )
+    op.drop_column('kb_documents', 'extracted_text')
+
+
+def downgrade():
+    op.add_column('kb_documents', sa.Column('extracted_text', sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE kb_documents d JOIN kb_document_texts t ON t.document_id = d.id "
+        "SET d.extracted_text = t.body"
+    )
+    op.drop_table('kb_document_texts')
@@ -0,0 +1,72 @@
+"""Add stored word_count to notes
+
+Note content is encrypted at rest, so every listing decrypted and split
+each note just to report its word count. The count is now computed from the
+plaintext when a note is written and stored alongside it.
+
+Existing rows are backfilled here in keyset-paginated batches: the words
+can't be counted in SQL because the content is encrypted, so each batch is
+decrypted in Python and written back with one executemany UPDATE. Notes
+that can't be decrypted (no key configured) keep 0 and are counted in the
+migration output.
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.encryption import decrypt_content
+
+
+# revision identifiers, used by Alembic.
+revision = '040'
+down_revision = '039'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    op.add_column('notes', sa.Column(
+        'word_count', sa.Integer(), nullable=False, server_default='0'
+    ))
+
+    conn = op.get_bind()
+    last_id = 0
+    undecryptable = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, content FROM notes WHERE id > :last_id "
+                "ORDER BY id LIMIT :batch_size"
+            ),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        counts = []
+        for note_id, content in rows:
+            plaintext = decrypt_content(content) if content else ""
+            if plaintext.startswith("enc::"):
+                undecryptable += 1
+                continue
+            word_count = len(plaintext.split())
+            if word_count:
+                counts.append({"id": note_id, "word_count": word_count})
+        if counts:
+            conn.execute(
+                sa.text("UPDATE notes SET word_count = :word_count WHERE id = :id"),
+                counts,
+            )
+
+    if undecryptable:
+        print(f"040: {undecryptable} notes could not be decrypted; word_count left at 0")
+
+
+def downgrade():
+    op.drop_column('notes', 'word_count')
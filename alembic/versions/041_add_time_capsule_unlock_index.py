@@ -0,0 +1,28 @@
+"""Add (status, unlock_at) index to time_capsules
+
+The unlock worker looks for locked capsules whose unlock_at has passed.
+With only single-column indexes this scanned every capsule ever created;
+the composite index turns it into a range scan over the locked, due ones.
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '041'
+down_revision = '040'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_time_capsules_status_unlock', 'time_capsules', ['status', 'unlock_at']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_time_capsules_status_unlock', table_name='time_capsules')
@@ -0,0 +1,54 @@
+"""Move KB chunk embeddings into kb_document_chunk_embeddings
+
+`kb_document_chunks` held both the chunk text and its float32/int8
+embeddings, so the similarity scan read wide rows to score vectors and
+context assembly read vectors it never used. Embeddings now live in a
+narrow one-to-one table keyed by chunk id; search scans that table and
+loads chunk text only for the top hits.
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '042'
+down_revision = '041'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'kb_document_chunk_embeddings',
+        sa.Column('chunk_id', sa.Integer(), nullable=False),
+        sa.Column('embedding', sa.LargeBinary(), nullable=False),
+        sa.Column('embedding_q', sa.LargeBinary(), nullable=True),
+        sa.Column('embedding_model', sa.String(100), nullable=True),
+        sa.ForeignKeyConstraint(['chunk_id'], ['kb_document_chunks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('chunk_id'),
+    )
+    op.execute(
+        "INSERT INTO kb_document_chunk_embeddings "
+        "(chunk_id, embedding, embedding_q, embedding_model) "
+        "SELECT id, embedding, embedding_q, embedding_model "
+        "FROM kb_document_chunks WHERE embedding IS NOT NULL"
+    )
+    op.drop_column('kb_document_chunks', 'embedding_model')
+    op.drop_column('kb_document_chunks', 'embedding_q')
+    op.drop_column('kb_document_chunks', 'embedding')
+
+
+def downgrade():
+    op.add_column('kb_document_chunks', sa.Column('embedding', sa.LargeBinary(), nullable=True))
+    op.add_column('kb_document_chunks', sa.Column('embedding_q', sa.LargeBinary(), nullable=True))
+    op.add_column('kb_document_chunks', sa.Column('embedding_model', sa.String(100), nullable=True))
+    op.execute(
+        "UPDATE kb_document_chunks c JOIN kb_document_chunk_embeddings e ON e.chunk_id = c.id "
+        "SET c.embedding = e.embedding, c.embedding_q = e.embedding_q, "
+        "c.embedding_model = e.embedding_model"
+    )
+    op.drop_table('kb_document_chunk_embeddings')
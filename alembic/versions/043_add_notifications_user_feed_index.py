@@ -0,0 +1,29 @@
+"""Add (user_id, created_at) feed index to notifications
+
+The in-app feed lists one user's notifications newest first. The only
+user_id index was the implicit foreign-key one, so MySQL read every row
+for the user and then sorted them. The composite index returns them
+already in order.
+
+Revision ID: 043
+Revises: 042
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '043'
+down_revision = '042'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_notifications_user_feed', 'notifications', ['user_id', 'created_at']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_feed', table_name='notifications')
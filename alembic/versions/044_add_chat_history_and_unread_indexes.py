@@ -0,0 +1,41 @@
+"""Add public chat history and unread-notification indexes
+
+- public_chat_messages: (session_id, created_at) replaces the single
+  session_id index, so "latest N messages of a session" is an index range
+  read instead of a filesort.
+- notifications: (user_id, read_at, channel) serves the unread badge
+  count and mark-all-read, which filter on `read_at IS NULL`.
+
+Revision ID: 044
+Revises: 043
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '044'
+down_revision = '043'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_public_chat_messages_session_created', 'public_chat_messages',
+        ['session_id', 'created_at']
+    )
+    op.drop_index('ix_public_chat_messages_session_id', table_name='public_chat_messages')
+    op.create_index(
+        'ix_notifications_user_unread', 'notifications', ['user_id', 'read_at', 'channel']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
+    op.create_index(
+        'ix_public_chat_messages_session_id', 'public_chat_messages', ['session_id']
+    )
+    op.drop_index(
+        'ix_public_chat_messages_session_created', table_name='public_chat_messages'
+    )
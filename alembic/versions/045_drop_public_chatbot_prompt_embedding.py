@@ -0,0 +1,31 @@
+"""Drop the public chatbot system-prompt embedding
+
+`public_chatbot_config.system_prompt_embedding` (and its
+`embedding_model`) were written on every config save, at the cost of an
+embeddings API call, but nothing ever read them: public chatbot RAG
+searches the knowledge base with the user's query.
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '045'
+down_revision = '044'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_column('public_chatbot_config', 'system_prompt_embedding')
+    op.drop_column('public_chatbot_config', 'embedding_model')
+
+
+def downgrade():
+    # Re-created empty, with the types 011 gave them
+    op.add_column('public_chatbot_config', sa.Column('embedding_model', sa.String(100), nullable=True))
+    op.add_column('public_chatbot_config', sa.Column('system_prompt_embedding', sa.JSON(), nullable=True))
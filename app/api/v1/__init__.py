@@ -0,0 +1,45 @@
+"""
+API v1 routers
+
+`ROUTERS` is the single registration table used by `app.main`: one
+(module name, path segment, OpenAPI tag) entry per router module. An empty
+segment mounts the router directly under the API prefix (those routers
+carry their own path prefixes).
+
+Entries name modules rather than holding router objects so that importing
+one v1 module (tests, scripts, workers) does not import every other
+router and its dependencies; `register_routers` imports them when the
+application is assembled.
+"""
+import importlib
+from typing import List, Tuple
+
+from fastapi import FastAPI
+
+ROUTERS: List[Tuple[str, str, str]] = [
+    ("auth", "auth", "Authentication"),
+    ("users", "users", "Users"),
+    ("mentors", "mentors", "Mentors"),
+    ("lounges", "lounges", "Lounges"),
+    ("chat", "chat", "Chat"),
+    ("notes", "notes", "Notes"),
+    ("capsules", "capsules", "Time Capsules"),
+    ("billing", "billing", "Billing"),
+    ("notifications", "notifications", "Notifications"),
+    ("cms", "cms", "CMS"),
+    ("admin", "admin", "Admin"),
+    ("knowledge_base", "knowledge-base", "Knowledge Base"),
+    ("contact", "contact", "Contact"),
+    ("public_chatbot", "", "Public Chatbot"),
+    ("newsletter", "", "Newsletter"),
+    ("landing", "landing", "Landing Page & Dashboard"),
+    ("support_styles", "support-styles", "Support Styles"),
+]
+
+
+def register_routers(app: FastAPI, api_prefix: str) -> None:
+    """Import every v1 router module and mount it on `app`"""
+    for module_name, segment, tag in ROUTERS:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        prefix = f"{api_prefix}/{segment}" if segment else api_prefix
+        app.include_router(module.router, prefix=prefix, tags=[tag])
@@ -2,19 +2,22 @@
 Admin API endpoints
 Handles admin dashboard, user management, and analytics
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, BackgroundTasks, Request, Response
 from app.services import audit_log_service as audit_log
 from app.services.audit_log_service import AuditAction
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, and_, text
 from typing import List, Optional
 from datetime import datetime, timedelta
+import orjson
 import psutil
 import time
 
 from app.db.session import get_db
 from app.core.timezone import now_naive
 from app.core.jwt import get_current_admin, get_current_admin_mfa
+from app.core.responses import ORJSONResponse
+from app.services.settings_cache import TTLCache
 from app.db.models.user import User, UserRole
 from app.db.models.mentor import Mentor
 from app.db.models.lounge import Lounge, LoungeMembership, AccessType, LoungeConfigVersion
@@ -45,8 +48,9 @@ from app.schemas.admin import (
     PaginatedSubscriptionsResponse,
     ContactMessageResponse,
     PaginatedContactMessagesResponse,
-    UpdateContactMessageStatusRequest
+    UpdateContactMessageStatusRequest,
 )
+from app.schemas._common import page_count, paginated_json
 from app.core.security import hash_password
 from app.services.file_service import file_service, display_filename
 from app.services.billing_service import billing_service
@@ -55,7 +59,8 @@ from app.services.lounge_resource_service import lounge_resource_service
 from app.schemas.lounge_resource import (
     LoungeResourceResponse,
     LoungeResourceListResponse,
-    LoungeResourcesListResponse
+    LoungeResourcesListResponse,
+    resources_page_json,
 )
 from app.schemas.mentor import CategoryCreate, CategoryUpdate
 import logging
@@ -77,6 +82,9 @@ async def get_lounge_profile_image_url(lounge: Lounge, db: Session):
 # Track app start time for uptime
 app_start_time = time.time()
 
+# Serialised /stats and /health bodies, reused for a few seconds
+_admin_metrics_cache = TTLCache(maxsize=8, ttl=5.0)
+
 
 @router.get("/stats", response_model=SystemStatsResponse)
 async def get_system_stats(
@@ -89,65 +97,71 @@ async def get_system_stats(
     - Requires admin role
     - Returns platform-wide metrics
     """
-    # Total counts
-    total_users = db.query(func.count(User.id)).scalar()
+    # Polled by the dashboard; the aggregates are served from a short-lived
+    # per-process cache of the serialised body.
+    def _load() -> bytes:
+        # Total counts
+        total_users = db.query(func.count(User.id)).scalar()
     
-    total_mentors = db.query(func.count(Mentor.id)).scalar()
+        total_mentors = db.query(func.count(Mentor.id)).scalar()
     
-    total_lounges = db.query(func.count(Lounge.id)).scalar()
+        total_lounges = db.query(func.count(Lounge.id)).scalar()
     
-    total_subscriptions = db.query(func.count(Subscription.id)).filter(
-        Subscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
-    ).scalar()
+        total_subscriptions = db.query(func.count(Subscription.id)).filter(
+            Subscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
+        ).scalar()
     
-    # Revenue from payments
-    payment_revenue = db.query(func.sum(Payment.amount_cents)).filter(
-        Payment.status == PaymentStatus.SUCCEEDED
-    ).scalar() or 0
-
-    # Revenue from active lounge subscriptions
-    # Count by plan type and multiply by fixed prices: monthly = $25 (2500 cents), yearly = $240 (24000 cents)
-    monthly_sub_count = db.query(func.count(LoungeSubscription.id)).filter(
-        LoungeSubscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]),
-        LoungeSubscription.plan_type == LoungePlanType.MONTHLY
-    ).scalar() or 0
-
-    yearly_sub_count = db.query(func.count(LoungeSubscription.id)).filter(
-        LoungeSubscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]),
-        LoungeSubscription.plan_type == LoungePlanType.YEARLY
-    ).scalar() or 0
-
-    lounge_subscription_revenue = (monthly_sub_count * 2500) + (yearly_sub_count * 24000)
-
-    total_revenue = payment_revenue + lounge_subscription_revenue
+        # Revenue from payments
+        payment_revenue = db.query(func.sum(Payment.amount_cents)).filter(
+            Payment.status == PaymentStatus.SUCCEEDED
+        ).scalar() or 0
+
+        # Revenue from active lounge subscriptions
+        # Count by plan type and multiply by fixed prices: monthly = $25 (2500 cents), yearly = $240 (24000 cents)
+        monthly_sub_count = db.query(func.count(LoungeSubscription.id)).filter(
+            LoungeSubscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]),
+            LoungeSubscription.plan_type == LoungePlanType.MONTHLY
+        ).scalar() or 0
+
+        yearly_sub_count = db.query(func.count(LoungeSubscription.id)).filter(
+            LoungeSubscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]),
+            LoungeSubscription.plan_type == LoungePlanType.YEARLY
+        ).scalar() or 0
+
+        lounge_subscription_revenue = (monthly_sub_count * 2500) + (yearly_sub_count * 24000)
+
+        total_revenue = payment_revenue + lounge_subscription_revenue
     
-    # Active users (last 30 days)
-    thirty_days_ago = now_naive() - timedelta(days=30)
-    active_users = db.query(func.count(func.distinct(ChatMessage.user_id))).filter(
-        ChatMessage.created_at >= thirty_days_ago
-    ).scalar()
+        # Active users (last 30 days)
+        thirty_days_ago = now_naive() - timedelta(days=30)
+        active_users = db.query(func.count(func.distinct(ChatMessage.user_id))).filter(
+            ChatMessage.created_at >= thirty_days_ago
+        ).scalar()
     
-    # New users (last 7 days)
-    seven_days_ago = now_naive() - timedelta(days=7)
-    new_users = db.query(func.count(User.id)).filter(
-        User.created_at >= seven_days_ago
-    ).scalar()
+        # New users (last 7 days)
+        seven_days_ago = now_naive() - timedelta(days=7)
+        new_users = db.query(func.count(User.id)).filter(
+            User.created_at >= seven_days_ago
+        ).scalar()
     
-    # Growth rates (simplified)
-    user_growth_rate = 0.0
-    revenue_growth_rate = 0.0
+        # Growth rates (simplified)
+        user_growth_rate = 0.0
+        revenue_growth_rate = 0.0
     
-    return SystemStatsResponse(
-        total_users=total_users,
-        total_mentors=total_mentors,
-        total_lounges=total_lounges,
-        total_subscriptions=total_subscriptions,
-        total_revenue_cents=total_revenue,
-        active_users_30d=active_users,
-        new_users_7d=new_users,
-        user_growth_rate=user_growth_rate,
-        revenue_growth_rate=revenue_growth_rate
-    )
+        return orjson.dumps(SystemStatsResponse(
+            total_users=total_users,
+            total_mentors=total_mentors,
+            total_lounges=total_lounges,
+            total_subscriptions=total_subscriptions,
+            total_revenue_cents=total_revenue,
+            active_users_30d=active_users,
+            new_users_7d=new_users,
+            user_growth_rate=user_growth_rate,
+            revenue_growth_rate=revenue_growth_rate
+        ).model_dump())
+
+    body = _admin_metrics_cache.get("stats", _load)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/health", response_model=PlatformHealthResponse)
@@ -161,34 +175,40 @@ async def get_platform_health(
     - Requires admin role
     - Returns system health metrics
     """
-    # Calculate uptime
-    uptime = int(time.time() - app_start_time)
+    def _load() -> bytes:
+        # Calculate uptime
+        uptime = int(time.time() - app_start_time)
     
-    # Check database
-    try:
-        db.execute("SELECT 1")
-        db_status = "healthy"
-    except:
-        db_status = "unhealthy"
+        # Check database
+        try:
+            db.execute(text("SELECT 1"))
+            db_status = "healthy"
+        except Exception:
+            db_status = "unhealthy"
     
-    # System resources
-    cpu_usage = psutil.cpu_percent(interval=1)
-    memory = psutil.virtual_memory()
-    memory_usage = memory.percent
+        # System resources
+        # Non-blocking: usage since the previous call (interval=1 stalled the
+        # event loop for a full second on every request)
+        cpu_usage = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        memory_usage = memory.percent
     
-    # API response time (simplified)
-    api_response_time = 50.0  # ms
+        # API response time (simplified)
+        api_response_time = 50.0  # ms
     
-    return PlatformHealthResponse(
-        status="healthy" if db_status == "healthy" else "degraded",
-        uptime_seconds=uptime,
-        database_status=db_status,
-        redis_status="unknown",  # Would check Redis if configured
-        s3_status="unknown",  # Would check S3 if configured
-        api_response_time_ms=api_response_time,
-        cpu_usage_percent=cpu_usage,
-        memory_usage_percent=memory_usage
-    )
+        return orjson.dumps(PlatformHealthResponse(
+            status="healthy" if db_status == "healthy" else "degraded",
+            uptime_seconds=uptime,
+            database_status=db_status,
+            redis_status="unknown",  # Would check Redis if configured
+            s3_status="unknown",  # Would check S3 if configured
+            api_response_time_ms=api_response_time,
+            cpu_usage_percent=cpu_usage,
+            memory_usage_percent=memory_usage
+        ).model_dump())
+
+    body = _admin_metrics_cache.get("health", _load)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/users", response_model=PaginatedUsersResponse)
@@ -225,47 +245,58 @@ async def list_users(
     skip = (page - 1) * limit
 
     users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    user_ids = [user.id for user in users]
 
-    items = []
-    for user in users:
-        # Get stats
-        lounge_count = db.query(func.count(LoungeMembership.id)).filter(
-            LoungeMembership.user_id == user.id,
-            LoungeMembership.left_at.is_(None)
-        ).scalar()
-
-        note_count = db.query(func.count(Note.id)).filter(
-            Note.user_id == user.id
-        ).scalar()
+    # Per-page aggregates in three grouped queries instead of three per row
+    lounge_counts = dict(db.query(
+        LoungeMembership.user_id, func.count(LoungeMembership.id)
+    ).filter(
+        LoungeMembership.user_id.in_(user_ids),
+        LoungeMembership.left_at.is_(None)
+    ).group_by(LoungeMembership.user_id).all()) if user_ids else {}
 
-        subscription = db.query(Subscription).filter(
-            Subscription.user_id == user.id,
+    note_counts = dict(db.query(
+        Note.user_id, func.count(Note.id)
+    ).filter(
+        Note.user_id.in_(user_ids)
+    ).group_by(Note.user_id).all()) if user_ids else {}
+
+    subscription_statuses = {}
+    if user_ids:
+        for sub_user_id, sub_status in db.query(
+            Subscription.user_id, Subscription.status
+        ).filter(
+            Subscription.user_id.in_(user_ids),
             Subscription.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
-        ).first()
-
-        items.append(UserManagementResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            role=user.role.value,
-            avatar_url=user.avatar_url,
-            email_verified_at=user.email_verified_at,
-            created_at=user.created_at,
-            lounge_count=lounge_count,
-            note_count=note_count,
-            subscription_status=subscription.status.value if subscription else None
-        ))
+        ):
+            subscription_statuses.setdefault(sub_user_id, sub_status.value)
 
-    # Calculate total pages
-    pages = (total + limit - 1) // limit if total > 0 else 1
+    # Rows are built as plain dicts in `UserManagementResponse` shape and
+    # serialised by orjson in one pass; every value already has the schema's
+    # type, so per-row model construction would only re-check them.
+    items = [
+        {
+            "id": user.id,
+            "email": user.email,
+            "name": user.name,
+            "role": user.role.value,
+            "avatar_url": user.avatar_url,
+            "email_verified_at": user.email_verified_at,
+            "created_at": user.created_at,
+            "lounge_count": lounge_counts.get(user.id, 0),
+            "note_count": note_counts.get(user.id, 0),
+            "subscription_status": subscription_statuses.get(user.id),
+        }
+        for user in users
+    ]
 
-    return PaginatedUsersResponse(
-        items=items,
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
-    )
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "pages": page_count(total, limit)
+    })
 
 
 @router.put("/users/{user_id}/role", response_model=UserManagementResponse)
@@ -290,15 +321,7 @@ async def update_user_role(
             detail="User not found"
         )
     
-    # Validate role
-    try:
-        new_role = UserRole(role_update.role)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role: {role_update.role}"
-        )
-    
+    new_role = role_update.role
     old_role = user.role.value if user.role else None
     user.role = new_role
 
@@ -359,7 +382,12 @@ async def delete_user(
     - Requires admin role
     - Permanently deletes user and data
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    # User collections are raise_on_sql; load them up front so the ORM
+    # delete cascade can walk them.
+    user = db.query(User).options(*[
+        selectinload(getattr(User, rel.key))
+        for rel in User.__mapper__.relationships if rel.uselist
+    ]).filter(User.id == user_id).first()
 
     if not user:
         raise HTTPException(
@@ -541,7 +569,9 @@ async def get_all_mentors(
             'status': mentor.status.value
         })
 
-    return result
+    # Returning the response directly skips jsonable_encoder's walk over
+    # every row; orjson serialises the plain dicts in one pass.
+    return ORJSONResponse(result)
 
 
 @router.get("/mentors/pending")
@@ -573,8 +603,9 @@ async def get_pending_mentors(
             'experience_years': mentor.experience_years,
             'created_at': mentor.created_at
         })
-    
-    return result
+
+    # orjson serialises `created_at` natively (see get_all_mentors)
+    return ORJSONResponse(result)
 
 
 @router.get("/export/users")
@@ -588,7 +619,12 @@ async def export_users(
     - Requires admin role
     - Returns CSV download
     """
-    users = db.query(User).all()
+    # Plain row tuples: a full-table export doesn't need identity-mapped
+    # User instances (each carries its own __dict__ and instance state)
+    users = db.query(
+        User.id, User.email, User.name, User.role,
+        User.created_at, User.email_verified_at
+    ).yield_per(1000)
     
     # Build CSV
     csv_data = "id,email,name,role,created_at,email_verified\n"
@@ -1613,14 +1649,7 @@ async def create_user(
             detail="Email already registered"
         )
 
-    # Validate role
-    try:
-        role = UserRole(user_data.role)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role: {user_data.role}"
-        )
+    role = user_data.role
 
     # Create user
     user = User(
@@ -1737,13 +1766,7 @@ async def update_user(
         user.name = user_data.name
 
     if user_data.role is not None:
-        try:
-            user.role = UserRole(user_data.role)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid role: {user_data.role}"
-            )
+        user.role = user_data.role
 
     if user_data.email_verified is not None:
         user.email_verified_at = now_naive() if user_data.email_verified else None
@@ -2253,15 +2276,11 @@ async def get_user_subscriptions(
             canceled_at=sub.canceled_at
         ))
 
-    # Calculate total pages
-    pages = (total + limit - 1) // limit if total > 0 else 1
-
-    return PaginatedSubscriptionsResponse(
-        items=items,
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
+    return Response(
+        content=paginated_json(
+            UserSubscriptionResponse, items, total=total, page=page, limit=limit
+        ),
+        media_type="application/json"
     )
 
 
@@ -2383,14 +2402,9 @@ async def get_all_lounge_resources(
             created_at=resource.created_at
         ))
 
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-
-    return LoungeResourcesListResponse(
-        resources=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    return Response(
+        content=resources_page_json(items, total=total, page=page, page_size=page_size),
+        media_type="application/json"
     )
 
 
@@ -2577,7 +2591,7 @@ async def delete_lounge_resource(
 
 from app.services.public_chatbot_service import public_chatbot_service
 from app.db.models.public_chatbot import PublicChatbotConfig
-from pydantic import BaseModel as PydanticBaseModel
+from pydantic import BaseModel as PydanticBaseModel, ConfigDict
 
 
 class ChatbotConfigUpdate(PydanticBaseModel):
@@ -2604,8 +2618,7 @@ class ChatbotConfigResponse(PydanticBaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 @router.get("/chatbot/config", response_model=ChatbotConfigResponse)
@@ -2798,7 +2811,13 @@ async def export_newsletter_subscribers(
         elif status_filter == "unsubscribed":
             query = query.filter(NewsletterSubscriber.status == SubscriberStatus.UNSUBSCRIBED)
 
-    subscribers = query.order_by(NewsletterSubscriber.subscribed_at.desc()).all()
+    subscribers = query.with_entities(
+        NewsletterSubscriber.email,
+        NewsletterSubscriber.status,
+        NewsletterSubscriber.subscribed_at,
+        NewsletterSubscriber.unsubscribed_at,
+        NewsletterSubscriber.source
+    ).order_by(NewsletterSubscriber.subscribed_at.desc()).yield_per(1000)
 
     # Create CSV in memory
     output = io.StringIO()
@@ -2868,29 +2887,29 @@ async def list_contact_messages(
 
     # Get total count
     total = query.count()
-    pages = (total + limit - 1) // limit
 
     # Get paginated results
     messages = query.order_by(ContactMessage.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
 
-    return PaginatedContactMessagesResponse(
-        items=[ContactMessageResponse(
-            id=msg.id,
-            name=msg.name,
-            email=msg.email,
-            subject=msg.subject,
-            message=msg.message,
-            status=msg.status.value,
-            ip_address=msg.ip_address,
-            user_agent=msg.user_agent,
-            created_at=msg.created_at,
-            read_at=msg.read_at,
-            replied_at=msg.replied_at
-        ) for msg in messages],
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
+    items = [ContactMessageResponse(
+        id=msg.id,
+        name=msg.name,
+        email=msg.email,
+        subject=msg.subject,
+        message=msg.message,
+        status=msg.status,
+        ip_address=msg.ip_address,
+        user_agent=msg.user_agent,
+        created_at=msg.created_at,
+        read_at=msg.read_at,
+        replied_at=msg.replied_at
+    ) for msg in messages]
+
+    return Response(
+        content=paginated_json(
+            ContactMessageResponse, items, total=total, page=page, limit=limit
+        ),
+        media_type="application/json"
     )
 
 
@@ -2925,7 +2944,7 @@ async def get_contact_message(
         email=message.email,
         subject=message.subject,
         message=message.message,
-        status=message.status.value,
+        status=message.status,
         ip_address=message.ip_address,
         user_agent=message.user_agent,
         created_at=message.created_at,
@@ -2953,13 +2972,8 @@ async def update_contact_message_status(
             detail="Contact message not found"
         )
 
-    try:
-        new_status = ContactMessageStatus(request.status)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Must be one of: new, read, replied, archived"
-        )
+    # Already a ContactMessageStatus, validated by the request schema
+    new_status = request.status
 
     message.status = new_status
 
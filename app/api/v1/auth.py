@@ -260,8 +260,7 @@ async def verify_registration_otp(
         EmailOTP.email == email,
         EmailOTP.otp == otp,
         EmailOTP.purpose == "registration",
-        EmailOTP.verified_at.is_(None),
-        EmailOTP.expires_at > now_naive()
+        EmailOTP.is_valid
     ).first()
 
     if not email_otp:
@@ -692,8 +691,7 @@ async def verify_password_reset_otp(
         EmailOTP.email == email,
         EmailOTP.otp == otp,
         EmailOTP.purpose == "password_reset",
-        EmailOTP.verified_at.is_(None),
-        EmailOTP.expires_at > now_naive()
+        EmailOTP.is_valid
     ).first()
 
     if not email_otp:
@@ -1136,8 +1134,7 @@ async def verify_email_change_otp(
         EmailOTP.email == data.new_email,
         EmailOTP.otp == data.otp,
         EmailOTP.purpose == "email_change",
-        EmailOTP.verified_at.is_(None),
-        EmailOTP.expires_at > now_naive()
+        EmailOTP.is_valid
     ).first()
 
     if not email_otp:
@@ -76,7 +76,6 @@ async def list_plans(
     
     result = []
     for plan in plans:
-        price_display = f"${plan.price_cents / 100:.2f}/{plan.billing_interval}"
         features = plan.features if isinstance(plan.features, list) else []
         
         result.append(SubscriptionPlanResponse(
@@ -87,8 +86,7 @@ async def list_plans(
             price_cents=plan.price_cents,
             billing_interval=plan.billing_interval,
             features=features,
-            is_active=plan.is_active,
-            price_display=price_display
+            is_active=plan.is_active
         ))
     
     return result
@@ -272,8 +270,6 @@ async def list_payments(
     
     result = []
     for payment in payments:
-        amount_display = f"${payment.amount_cents / 100:.2f} {payment.currency}"
-        
         result.append(PaymentResponse(
             id=payment.id,
             user_id=payment.user_id,
@@ -282,8 +278,7 @@ async def list_payments(
             amount_cents=payment.amount_cents,
             currency=payment.currency,
             status=payment.status.value,
-            created_at=payment.created_at,
-            amount_display=amount_display
+            created_at=payment.created_at
         ))
 
     return result
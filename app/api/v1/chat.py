@@ -640,7 +640,6 @@ async def upload_file(
             storage_path=file_record.storage_path,
             mime_type=file_record.mime_type,
             size_bytes=file_record.size_bytes,
-            size_mb=file_record.size_mb,
             created_at=file_record.created_at,
             is_image=file_record.is_image,
             is_video=file_record.is_video,
@@ -2,7 +2,7 @@
 Knowledge Base API endpoints
 Admin-only endpoints for managing KB content (prompts, documents, FAQs)
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -26,6 +26,7 @@ from app.schemas.knowledge_base import (
     # Stats
     KBStatsResponse
 )
+from app.schemas._common import paginated_json
 
 router = APIRouter()
 
@@ -213,17 +214,15 @@ async def list_prompts(
     prompts, total = await knowledge_base_service.get_prompts_paginated(
         db, page, limit, category_id, search, is_active, lounge_id, include_global
     )
-    pages = (total + limit - 1) // limit if total > 0 else 1
-
     items = []
     for p in prompts:
         lounge_image = await get_lounge_image(p, db)
-        items.append(KBPromptResponse(
+        items.append(KBPromptResponse.from_trusted(
             id=p.id,
             title=p.title,
             content=p.content,
             description=p.description,
-            tags=p.tags,
+            tags=tuple(p.tags or ()),
             is_active=p.is_active,
             is_included_in_rag=p.is_included_in_rag,
             usage_count=p.usage_count,
@@ -240,8 +239,9 @@ async def list_prompts(
             created_by_name=p.created_by.name if p.created_by else None
         ))
 
-    return PaginatedPromptsResponse(
-        items=items, total=total, page=page, limit=limit, pages=pages
+    return Response(
+        content=paginated_json(KBPromptResponse, items, total=total, page=page, limit=limit),
+        media_type="application/json"
     )
 
 
@@ -326,7 +326,7 @@ async def get_prompt(
         title=prompt.title,
         content=prompt.content,
         description=prompt.description,
-        tags=prompt.tags,
+        tags=tuple(prompt.tags or ()),
         is_active=prompt.is_active,
         is_included_in_rag=prompt.is_included_in_rag,
         usage_count=prompt.usage_count,
@@ -507,25 +507,23 @@ async def list_documents(
     documents, total = await knowledge_base_service.get_documents_paginated(
         db, page, limit, category_id, search, is_active, is_processed, lounge_id, include_global
     )
-    pages = (total + limit - 1) // limit if total > 0 else 1
-
     items = []
     for d in documents:
         lounge_image = await get_lounge_image(d, db)
-        items.append(KBDocumentResponse(
+        items.append(KBDocumentResponse.from_trusted(
             id=d.id,
             title=d.title,
             description=d.description,
             original_filename=d.original_filename,
             file_type=d.file_type,
             file_size_bytes=d.file_size_bytes,
-            tags=d.tags,
+            tags=tuple(d.tags or ()),
             is_active=d.is_active,
             is_processed=d.is_processed,
             processing_error=d.processing_error,
             summary=d.summary,
             has_embedding=d.embedding is not None,
-            chunk_count=len(d.chunks) if d.chunks else 0,
+            chunk_count=d.chunk_count,
             created_at=d.created_at,
             updated_at=d.updated_at,
             category_id=d.category_id,
@@ -538,8 +536,9 @@ async def list_documents(
             created_by_name=d.created_by.name if d.created_by else None
         ))
 
-    return PaginatedDocumentsResponse(
-        items=items, total=total, page=page, limit=limit, pages=pages
+    return Response(
+        content=paginated_json(KBDocumentResponse, items, total=total, page=page, limit=limit),
+        media_type="application/json"
     )
 
 
@@ -606,13 +605,13 @@ async def upload_document(
         original_filename=document.original_filename,
         file_type=document.file_type,
         file_size_bytes=document.file_size_bytes,
-        tags=document.tags,
+        tags=tuple(document.tags or ()),
         is_active=document.is_active,
         is_processed=document.is_processed,
         processing_error=document.processing_error,
         summary=document.summary,
         has_embedding=document.embedding is not None,
-        chunk_count=len(document.chunks) if document.chunks else 0,
+        chunk_count=document.chunk_count,
         created_at=document.created_at,
         updated_at=document.updated_at,
         category_id=document.category_id,
@@ -646,13 +645,13 @@ async def get_document(
         original_filename=document.original_filename,
         file_type=document.file_type,
         file_size_bytes=document.file_size_bytes,
-        tags=document.tags,
+        tags=tuple(document.tags or ()),
         is_active=document.is_active,
         is_processed=document.is_processed,
         processing_error=document.processing_error,
         summary=document.summary,
         has_embedding=document.embedding is not None,
-        chunk_count=len(document.chunks) if document.chunks else 0,
+        chunk_count=document.chunk_count,
         created_at=document.created_at,
         updated_at=document.updated_at,
         category_id=document.category_id,
@@ -689,13 +688,13 @@ async def update_document(
         original_filename=document.original_filename,
         file_type=document.file_type,
         file_size_bytes=document.file_size_bytes,
-        tags=document.tags,
+        tags=tuple(document.tags or ()),
         is_active=document.is_active,
         is_processed=document.is_processed,
         processing_error=document.processing_error,
         summary=document.summary,
         has_embedding=document.embedding is not None,
-        chunk_count=len(document.chunks) if document.chunks else 0,
+        chunk_count=document.chunk_count,
         created_at=document.created_at,
         updated_at=document.updated_at,
         category_id=document.category_id,
@@ -740,13 +739,13 @@ async def reprocess_document(
         original_filename=document.original_filename,
         file_type=document.file_type,
         file_size_bytes=document.file_size_bytes,
-        tags=document.tags,
+        tags=tuple(document.tags or ()),
         is_active=document.is_active,
         is_processed=document.is_processed,
         processing_error=document.processing_error,
         summary=document.summary,
         has_embedding=document.embedding is not None,
-        chunk_count=len(document.chunks) if document.chunks else 0,
+        chunk_count=document.chunk_count,
         created_at=document.created_at,
         updated_at=document.updated_at,
         category_id=document.category_id,
@@ -784,23 +783,22 @@ async def list_faqs(
     is_active: Optional[bool] = None,
     lounge_id: Optional[int] = Query(None, description="Filter by lounge ID (null = global only)"),
     include_global: bool = Query(True, description="Include global FAQs when lounge_id is set"),
+    sort_by: Optional[str] = Query(None, pattern="^helpfulness$", description="Sort by helpfulness ratio instead of sort order"),
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_current_admin)
 ):
     """List KB FAQs with pagination and filters (admin only)"""
     faqs, total = await knowledge_base_service.get_faqs_paginated(
-        db, page, limit, category_id, search, is_active, lounge_id, include_global
+        db, page, limit, category_id, search, is_active, lounge_id, include_global, sort_by
     )
-    pages = (total + limit - 1) // limit if total > 0 else 1
-
     items = []
     for f in faqs:
         lounge_image = await get_lounge_image(f, db)
-        items.append(KBFaqResponse(
+        items.append(KBFaqResponse.from_trusted(
             id=f.id,
             question=f.question,
             answer=f.answer,
-            tags=f.tags,
+            tags=tuple(f.tags or ()),
             sort_order=f.sort_order,
             is_active=f.is_active,
             is_included_in_rag=f.is_included_in_rag,
@@ -820,8 +818,9 @@ async def list_faqs(
             created_by_name=f.created_by.name if f.created_by else None
         ))
 
-    return PaginatedFaqsResponse(
-        items=items, total=total, page=page, limit=limit, pages=pages
+    return Response(
+        content=paginated_json(KBFaqResponse, items, total=total, page=page, limit=limit),
+        media_type="application/json"
     )
 
 
@@ -839,7 +838,7 @@ async def create_faq(
         id=faq.id,
         question=faq.question,
         answer=faq.answer,
-        tags=faq.tags,
+        tags=tuple(faq.tags or ()),
         sort_order=faq.sort_order,
         is_active=faq.is_active,
         is_included_in_rag=faq.is_included_in_rag,
@@ -876,7 +875,7 @@ async def get_faq(
         id=faq.id,
         question=faq.question,
         answer=faq.answer,
-        tags=faq.tags,
+        tags=tuple(faq.tags or ()),
         sort_order=faq.sort_order,
         is_active=faq.is_active,
         is_included_in_rag=faq.is_included_in_rag,
@@ -917,7 +916,7 @@ async def update_faq(
         id=faq.id,
         question=faq.question,
         answer=faq.answer,
-        tags=faq.tags,
+        tags=tuple(faq.tags or ()),
         sort_order=faq.sort_order,
         is_active=faq.is_active,
         is_included_in_rag=faq.is_included_in_rag,
@@ -989,7 +988,9 @@ async def get_rag_context(
         max_items=data.max_items,
         entity_types=data.entity_types,
         lounge_id=data.lounge_id,
-        include_global=data.include_global
+        include_global=data.include_global,
+        # Admin test queries aren't real views
+        record_views=False
     )
 
     return KBRAGContextResponse(
@@ -95,7 +95,7 @@ async def get_featured_lounges(
     db: Session = Depends(get_db)
 ):
     """Get featured/highlighted lounges for the landing page."""
-    lounges = db.query(Lounge).filter(
+    lounges = db.query(Lounge, Lounge.member_count).filter(
         Lounge.is_public_listing == True,
         Lounge.is_featured == True
     ).limit(limit).all()
@@ -108,11 +108,11 @@ async def get_featured_lounges(
             "description": l.description,
             "brand_color": l.brand_color,
             "access_type": l.access_type.value if l.access_type else None,
-            "member_count": l.member_count,
+            "member_count": member_count,
             "mentor_name": l.mentor.user.name if l.mentor and l.mentor.user else None,
             "category_name": l.category.name if l.category else None,
         }
-        for l in lounges
+        for l, member_count in lounges
     ]
 
 
@@ -202,7 +202,7 @@ async def get_recommended_lounges(
     ]
 
     # Get lounges user is NOT subscribed to
-    query = db.query(Lounge).filter(
+    query = db.query(Lounge, Lounge.member_count).filter(
         Lounge.is_public_listing == True,
     )
     if subscribed_ids:
@@ -222,11 +222,11 @@ async def get_recommended_lounges(
             "description": l.description,
             "brand_color": l.brand_color,
             "access_type": l.access_type.value if l.access_type else None,
-            "member_count": l.member_count,
+            "member_count": member_count,
             "mentor_name": l.mentor.user.name if l.mentor and l.mentor.user else None,
             "category_name": l.category.name if l.category else None,
         }
-        for l in lounges
+        for l, member_count in lounges
     ]
 
 
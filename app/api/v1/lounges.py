@@ -2,7 +2,7 @@
 Lounge API endpoints
 Handles lounge CRUD, membership, and discovery
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 from typing import List, Optional
@@ -40,7 +40,8 @@ from app.db.models.lounge_resource import LoungeResource
 from app.db.models.file import File as FileModel
 from app.schemas.lounge_resource import (
     LoungeResourceListResponse,
-    LoungeResourcesListResponse
+    LoungeResourcesListResponse,
+    resources_page_json,
 )
 
 router = APIRouter()
@@ -69,13 +70,14 @@ async def get_my_lounges(
     - Requires authentication
     - Returns lounges user has joined or subscribed to
     """
-    # Get user's memberships
-    memberships = db.query(LoungeMembership).filter(
-        LoungeMembership.user_id == current_user.id,
-        LoungeMembership.left_at.is_(None)
-    ).offset(skip).limit(limit).all()
-
-    lounge_ids = [m.lounge_id for m in memberships]
+    # Get user's memberships (only the ids are needed, so skip building
+    # ORM instances)
+    lounge_ids = [
+        lounge_id for (lounge_id,) in db.query(LoungeMembership.lounge_id).filter(
+            LoungeMembership.user_id == current_user.id,
+            LoungeMembership.left_at.is_(None)
+        ).offset(skip).limit(limit)
+    ]
 
     if not lounge_ids:
         return {
@@ -1059,12 +1061,7 @@ async def get_lounge_resources(
             created_at=resource.created_at
         ))
 
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-
-    return LoungeResourcesListResponse(
-        resources=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    return Response(
+        content=resources_page_json(items, total=total, page=page, page_size=page_size),
+        media_type="application/json"
     )
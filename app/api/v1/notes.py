@@ -13,6 +13,7 @@ from app.core.jwt import get_current_active_user
 from app.core.encryption import decrypt_content
 from app.db.models.user import User
 from app.db.models.note import Note, TimeCapsule, CapsuleStatus
+from app.db.expressions import json_array_has
 from app.schemas.note import (
     NoteCreate,
     NoteUpdate,
@@ -58,7 +59,7 @@ async def list_notes(
     if tags:
         tag_list = [t.strip().lower() for t in tags.split(',')]
         for tag in tag_list:
-            query = query.filter(Note.tags.contains([tag]))
+            query = query.filter(json_array_has(Note.tags, tag))
 
     # Get total count for pagination
     total = query.count()
@@ -75,8 +76,6 @@ async def list_notes(
     items = []
     for note in notes:
         content_preview = decrypt_content(note.content)[:200] + "..." if len(decrypt_content(note.content)) > 200 else note.content
-        word_count = len(decrypt_content(note.content).split())
-
         items.append({
             "id": note.id,
             "user_uuid": note.user.user_uuid if note.user else None,
@@ -90,7 +89,7 @@ async def list_notes(
             "created_at": note.created_at,
             "updated_at": note.updated_at,
             "content_preview": content_preview,
-            "word_count": word_count
+            "word_count": note.word_count
         })
 
     # Calculate total pages
@@ -131,8 +130,6 @@ async def create_note(
             tags=note_data.tags
         )
 
-        word_count = len(decrypt_content(note.content).split())
-
         return NoteResponse(
             id=note.id,
             user_id=note.user_id,
@@ -144,7 +141,7 @@ async def create_note(
             tags=note.tags or [],
             created_at=note.created_at,
             updated_at=note.updated_at,
-            word_count=word_count
+            word_count=note.word_count
         )
     
     except Exception as e:
@@ -177,8 +174,6 @@ async def get_note(
             detail="Note not found"
         )
     
-    word_count = len(decrypt_content(note.content).split())
-
     return NoteResponse(
         id=note.id,
         user_id=note.user_id,
@@ -190,7 +185,7 @@ async def get_note(
         tags=note.tags or [],
         created_at=note.created_at,
         updated_at=note.updated_at,
-        word_count=word_count
+        word_count=note.word_count
     )
 
 
@@ -219,8 +214,6 @@ async def update_note(
             tags=update_data.tags
         )
         
-        word_count = len(decrypt_content(note.content).split())
-
         return NoteResponse(
             id=note.id,
             user_id=note.user_id,
@@ -232,7 +225,7 @@ async def update_note(
             tags=note.tags or [],
             created_at=note.created_at,
             updated_at=note.updated_at,
-            word_count=word_count
+            word_count=note.word_count
         )
 
     except ValueError as e:
@@ -308,8 +301,6 @@ async def search_notes(
             else:
                 content_preview = ""
             
-            word_count = len(decrypt_content(note.content).split())
-            
             result.append(NoteListResponse(
                 id=note.id,
                 user_id=note.user_id,
@@ -320,7 +311,7 @@ async def search_notes(
                 created_at=note.created_at,
                 updated_at=note.updated_at,
                 content_preview=content_preview,
-                word_count=word_count
+                word_count=note.word_count
             ))
         
         return result
@@ -379,8 +370,6 @@ async def get_pinned_notes(
         result = []
         for note in notes:
             content_preview = decrypt_content(note.content)[:200] + "..." if len(decrypt_content(note.content)) > 200 else note.content
-            word_count = len(decrypt_content(note.content).split())
-            
             result.append(NoteListResponse(
                 id=note.id,
                 user_id=note.user_id,
@@ -391,7 +380,7 @@ async def get_pinned_notes(
                 created_at=note.created_at,
                 updated_at=note.updated_at,
                 content_preview=content_preview,
-                word_count=word_count
+                word_count=note.word_count
             ))
         
         return result
@@ -440,7 +429,7 @@ async def list_capsules(
                 title=capsule.title,
                 content=decrypt_content(capsule.content) if is_unlocked else None,
                 unlock_at=capsule.unlock_at,
-                status=capsule.status.value,
+                status=capsule.status,
                 created_at=capsule.created_at,
                 updated_at=capsule.updated_at,
                 is_unlocked=is_unlocked,
@@ -490,7 +479,7 @@ async def create_capsule(
             title=capsule.title,
             content=None,  # Hidden until unlocked
             unlock_at=capsule.unlock_at,
-            status=capsule.status.value,
+            status=capsule.status,
             created_at=capsule.created_at,
             updated_at=capsule.updated_at,
             is_unlocked=False,
@@ -539,7 +528,7 @@ async def get_capsule(
         title=capsule.title,
         content=decrypt_content(capsule.content) if is_unlocked else None,
         unlock_at=capsule.unlock_at,
-        status=capsule.status.value,
+        status=capsule.status,
         created_at=capsule.created_at,
         updated_at=capsule.updated_at,
         is_unlocked=is_unlocked,
@@ -581,7 +570,7 @@ async def update_capsule(
             title=capsule.title,
             content=None,
             unlock_at=capsule.unlock_at,
-            status=capsule.status.value,
+            status=capsule.status,
             created_at=capsule.created_at,
             updated_at=capsule.updated_at,
             is_unlocked=False,
@@ -660,7 +649,7 @@ async def unlock_capsule(
             title=capsule.title,
             content=decrypt_content(capsule.content),
             unlock_at=capsule.unlock_at,
-            status=capsule.status.value,
+            status=capsule.status,
             created_at=capsule.created_at,
             updated_at=capsule.updated_at,
             is_unlocked=True,
@@ -187,7 +187,7 @@ async def create_test_notification(
         user_id=current_user.id,
         type=notification_data.type,
         data=notification_data.data,
-        channel=NotificationChannel(notification_data.channel),
+        channel=notification_data.channel,
         status=NotificationStatus.SENT,
         sent_at=now_naive()
     )
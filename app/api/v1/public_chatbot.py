@@ -10,6 +10,7 @@ import json
 
 from app.db.session import get_db
 from app.services.public_chatbot_service import public_chatbot_service
+from app.services.settings_cache import get_chatbot_config as get_cached_chatbot_config
 
 router = APIRouter(prefix="/public-chatbot", tags=["Public Chatbot"])
 
@@ -52,7 +53,7 @@ async def get_chatbot_config(db: Session = Depends(get_db)):
 
     Returns the chatbot settings for display on the frontend
     """
-    config = await public_chatbot_service.get_config(db)
+    config = get_cached_chatbot_config(db)
 
     if not config:
         raise HTTPException(
@@ -201,10 +201,20 @@ async def get_user_activity(
     - Returns recent user activities
     - Includes lounge memberships, notes, capsules, etc.
     """
+    from sqlalchemy.orm import joinedload
+    from app.db.models.lounge import LoungeMembership
+    from app.db.models.chat import ChatThread
+    from app.db.models.note import Note, TimeCapsule
+
     activity = []
     
     # Get lounge memberships
-    for membership in current_user.lounge_memberships[:limit]:
+    memberships = db.query(LoungeMembership).options(
+        joinedload(LoungeMembership.lounge)
+    ).filter(
+        LoungeMembership.user_id == current_user.id
+    ).order_by(LoungeMembership.joined_at.desc()).limit(limit).all()
+    for membership in memberships:
         activity.append({
             "id": membership.id,
             "action": "joined_lounge" if membership.left_at is None else "left_lounge",
@@ -216,7 +226,10 @@ async def get_user_activity(
         })
     
     # Get recent chat threads
-    for thread in current_user.chat_threads[:limit]:
+    threads = db.query(ChatThread).filter(
+        ChatThread.user_id == current_user.id
+    ).order_by(ChatThread.created_at.desc()).limit(limit).all()
+    for thread in threads:
         activity.append({
             "id": thread.id,
             "action": "created_chat_thread",
@@ -229,7 +242,10 @@ async def get_user_activity(
         })
     
     # Get recent notes
-    for note in current_user.notes[:limit]:
+    notes = db.query(Note).filter(
+        Note.user_id == current_user.id
+    ).order_by(Note.created_at.desc()).limit(limit).all()
+    for note in notes:
         activity.append({
             "id": note.id,
             "action": "created_note",
@@ -241,7 +257,10 @@ async def get_user_activity(
         })
     
     # Get recent time capsules
-    for capsule in current_user.time_capsules[:limit]:
+    capsules = db.query(TimeCapsule).filter(
+        TimeCapsule.user_id == current_user.id
+    ).order_by(TimeCapsule.created_at.desc()).limit(limit).all()
+    for capsule in capsules:
         activity.append({
             "id": capsule.id,
             "action": "created_capsule",
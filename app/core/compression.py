@@ -0,0 +1,156 @@
+"""
+Response compression middleware
+
+Replaces Starlette's `GZipMiddleware`. Encodings are negotiated from
+`Accept-Encoding` in the order zstd → br → gzip. zstd and Brotli give
+noticeably smaller JSON payloads than gzip, and zstd is also much cheaper to
+produce. Compression runs in a worker thread so large bodies don't stall
+the event loop.
+
+Only complete, buffered responses are compressed. Streamed responses (chat
+SSE, file downloads) pass through untouched so tokens still reach the
+client as they are produced. `zstandard` and `brotli` are optional: if they
+are not installed the middleware quietly offers only gzip.
+"""
+import asyncio
+import gzip
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Bodies below one Ethernet MTU fit in a single packet anyway
+DEFAULT_MINIMUM_SIZE = 1500
+
+# Above this the compressor runs in a worker thread instead of inline
+THREAD_THRESHOLD = 64 * 1024
+
+_ENCODERS: Dict[str, Callable[[bytes], bytes]] = {}
+
+try:
+    import zstandard
+
+    # A ZstdCompressor must not be used from two threads at once, and large
+    # bodies are compressed in worker threads: keep one per thread
+    _zstd_local = threading.local()
+
+    def _zstd_compress(data: bytes) -> bytes:
+        compressor = getattr(_zstd_local, "compressor", None)
+        if compressor is None:
+            compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+        return compressor.compress(data)
+
+    _ENCODERS["zstd"] = _zstd_compress
+except ImportError:
+    logger.info("zstandard not installed — zstd response compression disabled")
+
+try:
+    import brotli
+
+    _ENCODERS["br"] = lambda data: brotli.compress(data, quality=4)
+except ImportError:
+    logger.info("brotli not installed — br response compression disabled")
+
+_ENCODERS["gzip"] = lambda data: gzip.compress(data, compresslevel=6)
+
+# Server preference order, best first
+_PREFERENCE: List[str] = [name for name in ("zstd", "br", "gzip") if name in _ENCODERS]
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the preferred encoding the client accepts, or None.
+
+    Codings the client marks with `q=0` are excluded. Otherwise the
+    server's order wins over the client's q-values.
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+    for name in _PREFERENCE:
+        if name in accepted:
+            return name
+    return None
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware; add with `app.add_middleware(CompressionMiddleware)`"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = DEFAULT_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self.app, encoding, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class _CompressingResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        # None until the first body message decides; then True/False
+        self.compress: Optional[bool] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Hold the headers back until we know whether to compress
+            self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.compress is False:
+            await self.send(message)
+            return
+
+        if self.compress is None:
+            headers = Headers(raw=self.start_message["headers"])
+            body = message.get("body", b"")
+            self.compress = (
+                not message.get("more_body", False)
+                and len(body) >= self.minimum_size
+                and "content-encoding" not in headers
+                and not headers.get("content-type", "").startswith("text/event-stream")
+            )
+            if not self.compress:
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            encoder = _ENCODERS[self.encoding]
+            if len(body) >= THREAD_THRESHOLD:
+                compressed = await asyncio.to_thread(encoder, body)
+            else:
+                compressed = encoder(body)
+
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": compressed})
@@ -34,6 +34,10 @@ class Settings(BaseSettings):
     AWS_KMS_KEY_ID: Optional[str] = None
     AWS_KMS_DATA_KEY_CIPHERTEXT: Optional[str] = None
 
+    # List endpoints build KB item responses from ORM rows with
+    # `model_construct` (no validation). Turn on in staging to validate them.
+    VALIDATE_TRUSTED_RESPONSES: bool = False
+
     # Timezone
     TIMEZONE: str = "Australia/Sydney"  # Australian Eastern Time (AEST/AEDT)
 
@@ -47,6 +51,19 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DB_ECHO: bool = False
+    # Size of SQLAlchemy's engine-wide compiled-SQL LRU cache. Hot point
+    # lookups (session validation, OTP verify, payment status) reuse the
+    # cached compiled form instead of recompiling per request. PyMySQL has
+    # no server-side prepared statements, so this is the plan/parse reuse
+    # we can get on the client side.
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Connection pool, per process. Gunicorn runs 4 workers (Dockerfile.prod)
+    # plus the cron workers, so 4 x (5 + 10) stays well under MySQL's default
+    # max_connections of 151. Set DB_USE_NULL_POOL when a connection pooler
+    # (e.g. ProxySQL) sits in front of MySQL and owns pooling instead.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_USE_NULL_POOL: bool = False
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -94,6 +111,9 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     OPENAI_MODEL: str = "gpt-4-turbo-preview"
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    # Byte budget of the in-process RAG embedding cache, per worker
+    # (app.services.rag_cache); least recently used scopes are evicted past it
+    RAG_CACHE_MAX_MB: int = 256
     # Optional explicit org id — required for opt-out to bind to the right
     # OpenAI organisation when one API key has access to several orgs.
     OPENAI_ORG_ID: Optional[str] = None
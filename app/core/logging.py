@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
+import orjson
+
 from app.core.config import settings
 
 
@@ -70,8 +72,6 @@ class JSONFormatter(logging.Formatter):
     """JSON formatter for production logs"""
 
     def format(self, record: logging.LogRecord) -> str:
-        import json
-
         log_data = {
             "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
@@ -96,7 +96,8 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        # `default=str` keeps a non-JSON extra value from dropping the record
+        return orjson.dumps(log_data, default=str).decode()
 
 
 def setup_logging(
@@ -222,6 +223,18 @@ def log_api_request(
     error: Optional[str] = None
 ):
     """Log an API request with all relevant details"""
+    # Determine log level based on status code
+    if status_code >= 500:
+        level = logging.ERROR
+    elif status_code >= 400:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+
+    # Skip building the record entirely when this level is filtered out
+    if not logger.isEnabledFor(level):
+        return
+
     extra = {
         'method': method,
         'endpoint': path,
@@ -235,18 +248,18 @@ def log_api_request(
     if ip_address:
         extra['ip_address'] = ip_address
 
-    # Determine log level based on status code
-    if status_code >= 500:
-        level = logging.ERROR
-        msg = f"{method} {path} -> {status_code} ({duration_ms:.2f}ms) ERROR: {error or 'Internal Server Error'}"
-    elif status_code >= 400:
-        level = logging.WARNING
-        msg = f"{method} {path} -> {status_code} ({duration_ms:.2f}ms)"
+    if level == logging.ERROR:
+        logger.log(
+            level, "%s %s -> %s (%.2fms) ERROR: %s",
+            method, path, status_code, duration_ms, error or 'Internal Server Error',
+            extra=extra
+        )
     else:
-        level = logging.INFO
-        msg = f"{method} {path} -> {status_code} ({duration_ms:.2f}ms)"
-
-    logger.log(level, msg, extra=extra)
+        logger.log(
+            level, "%s %s -> %s (%.2fms)",
+            method, path, status_code, duration_ms,
+            extra=extra
+        )
 
 
 def _mask_email_for_log(email: Optional[str]) -> Optional[str]:
@@ -0,0 +1,28 @@
+"""
+Response classes
+
+`ORJSONResponse` is the application's default response class (see
+`app.main`). orjson serialises straight to bytes in C, which is several
+times faster than `json.dumps` followed by an encode. It also handles
+datetimes and NumPy arrays natively.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_UTC_Z
+    | orjson.OPT_SERIALIZE_NUMPY
+    # jsonable_encoder leaves int dict keys as ints; json.dumps accepted them
+    | orjson.OPT_NON_STR_KEYS
+)
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
@@ -3,12 +3,14 @@ Timezone utilities for the application
 Uses Australia/Sydney timezone by default
 """
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
 def get_timezone() -> ZoneInfo:
-    """Get the configured timezone"""
+    """Get the configured timezone (resolved once per process)"""
     return ZoneInfo(settings.TIMEZONE)
 
 
@@ -21,6 +23,12 @@ def now_naive() -> datetime:
     """
     Get current datetime in the configured timezone as a naive datetime.
     Useful for database columns that don't store timezone info.
+
+    Model timestamp columns use this as a Python-side `default` rather than
+    `server_default=func.now()`: MySQL's NOW() follows the server/session
+    timezone (UTC in our containers), not settings.TIMEZONE, and without
+    INSERT ... RETURNING a server-generated value costs an extra SELECT to
+    read back into the ORM object.
     """
     return datetime.now(get_timezone()).replace(tzinfo=None)
 
@@ -0,0 +1,49 @@
+"""
+Dialect-aware SQL expressions shared by queries
+"""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.expression import bindparam
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.types import Boolean, String
+
+
+class json_array_has(ColumnElement):
+    """
+    `value` is an element of the JSON array stored in `column`.
+
+    On MySQL this compiles to `:value MEMBER OF(column)`, which the
+    multi-valued index on the column (`CAST(col AS CHAR(255) ARRAY)`) can
+    answer directly — unlike the LIKE that `JSON.contains()` renders, which
+    forces a full scan and only matches a serialized substring. SQLite (the
+    test harness) uses `json_each` for the same semantics.
+    """
+
+    type = Boolean()
+    inherit_cache = True
+    # Lets the compiled-statement cache key on the column and extract the
+    # bound value, so this stays cacheable like any built-in construct.
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("value", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column, value):
+        self.column = column
+        self.value = bindparam(None, value, type_=String())
+
+
+@compiles(json_array_has)
+def _compile_json_array_has(element, compiler, **kw):
+    return "%s MEMBER OF(%s)" % (
+        compiler.process(element.value, **kw),
+        compiler.process(element.column, **kw),
+    )
+
+
+@compiles(json_array_has, "sqlite")
+def _compile_json_array_has_sqlite(element, compiler, **kw):
+    return "EXISTS (SELECT 1 FROM json_each(%s) WHERE json_each.value = %s)" % (
+        compiler.process(element.column, **kw),
+        compiler.process(element.value, **kw),
+    )
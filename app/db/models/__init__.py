@@ -49,7 +49,9 @@ from app.db.models.knowledge_base import (
     KBCategory,
     KBPrompt,
     KBDocument,
+    KBDocumentText,
     KBDocumentChunk,
+    KBDocumentChunkEmbedding,
     KBFaq
 )
 from app.db.models.background_job import (
@@ -65,6 +67,10 @@ from app.db.models.support_style import (
     SupportStyleConfig,
     SupportStyleVersion,
 )
+from app.db.models.public_chatbot import (
+    PublicChatbotConfig,
+    PublicChatMessage,
+)
 
 __all__ = [
     # User models
@@ -132,7 +138,9 @@ __all__ = [
     "KBCategory",
     "KBPrompt",
     "KBDocument",
+    "KBDocumentText",
     "KBDocumentChunk",
+    "KBDocumentChunkEmbedding",
     "KBFaq",
 
     # Background Job models
@@ -147,4 +155,8 @@ __all__ = [
     # Support Style versioning
     "SupportStyleConfig",
     "SupportStyleVersion",
+
+    # Public chatbot models
+    "PublicChatbotConfig",
+    "PublicChatMessage",
 ]
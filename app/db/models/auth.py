@@ -1,10 +1,12 @@
 """
 OAuth and Session models
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum, Text, Index, and_
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -20,7 +22,7 @@ class OAuthAccount(Base):
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    provider = Column(SQLEnum(OAuthProvider, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    provider = Column(SQLEnum(OAuthProvider, values_callable=enum_values), nullable=False)
     provider_user_id = Column(String(255), nullable=False)
     access_token = Column(Text, nullable=True)
     refresh_token = Column(Text, nullable=True)
@@ -70,6 +72,13 @@ class EmailOTP(Base):
     """Email OTP model for verification codes"""
 
     __tablename__ = "email_otps"
+    # Lookups always filter on (email, purpose) plus the live-OTP predicate,
+    # so the probe stays on a handful of index entries per address. MySQL
+    # has no partial indexes; expired rows are pruned by the
+    # `audit_cleanup` worker instead so the index only covers recent codes.
+    __table_args__ = (
+        Index("ix_email_otps_lookup", "email", "purpose", "expires_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     email = Column(String(255), nullable=False, index=True)
@@ -79,13 +88,19 @@ class EmailOTP(Base):
     verified_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=now_naive, nullable=False)
 
-    @property
+    @hybrid_property
     def is_valid(self) -> bool:
         """Check if OTP is still valid"""
         if self.verified_at:
             return False
         return now_naive() < self.expires_at
 
+    @is_valid.expression
+    def is_valid(cls):
+        # `now_naive()` rather than `func.now()`: timestamps are written in
+        # the app timezone, which need not match the MySQL session timezone.
+        return and_(cls.verified_at.is_(None), cls.expires_at > now_naive())
+
     def __repr__(self):
         return f"<EmailOTP(id={self.id}, email={self.email}, valid={self.is_valid})>"
 
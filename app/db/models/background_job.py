@@ -7,6 +7,7 @@ from sqlalchemy import (
 )
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -33,11 +34,11 @@ class BackgroundJob(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     job_type = Column(
-        SQLEnum(JobType, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(JobType, values_callable=enum_values),
         nullable=False
     )
     status = Column(
-        SQLEnum(JobStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(JobStatus, values_callable=enum_values),
         default=JobStatus.PENDING,
         nullable=False
     )
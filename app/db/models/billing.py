@@ -8,6 +8,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -55,7 +56,7 @@ class SubscriptionPlan(Base):
     slug = Column(String(255), unique=True, nullable=False, index=True)
     stripe_price_id = Column(String(255), nullable=False)
     price_cents = Column(Integer, nullable=False)
-    billing_interval = Column(SQLEnum(BillingInterval, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    billing_interval = Column(SQLEnum(BillingInterval, values_callable=enum_values), nullable=False)
     features = Column(JSON, nullable=True)  # Array of feature strings
     is_active = Column(Boolean, default=True, nullable=False)
     
@@ -95,7 +96,7 @@ class Subscription(Base):
     plan_id = Column(Integer, ForeignKey("subscription_plans.id"), nullable=False)
     stripe_subscription_id = Column(String(255), nullable=False, unique=True)
     status = Column(
-        SQLEnum(SubscriptionStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(SubscriptionStatus, values_callable=enum_values),
         default=SubscriptionStatus.TRIALING,
         nullable=False
     )
@@ -138,12 +139,12 @@ class Payment(Base):
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    provider = Column(SQLEnum(PaymentProvider, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    provider = Column(SQLEnum(PaymentProvider, values_callable=enum_values), nullable=False)
     provider_payment_id = Column(String(255), nullable=False, unique=True)
     amount_cents = Column(Integer, nullable=False)
     currency = Column(String(3), default="USD", nullable=False)
     status = Column(
-        SQLEnum(PaymentStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(PaymentStatus, values_callable=enum_values),
         default=PaymentStatus.PENDING,
         nullable=False
     )
@@ -179,13 +180,13 @@ class LoungeSubscription(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     lounge_id = Column(Integer, ForeignKey("lounges.id"), nullable=False, index=True)
     plan_type = Column(
-        SQLEnum(LoungePlanType, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(LoungePlanType, values_callable=enum_values),
         nullable=False
     )
     stripe_subscription_id = Column(String(255), nullable=False, unique=True, index=True)
     stripe_price_id = Column(String(255), nullable=False)  # The actual Stripe price used
     status = Column(
-        SQLEnum(SubscriptionStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(SubscriptionStatus, values_callable=enum_values),
         default=SubscriptionStatus.ACTIVE,
         nullable=False
     )
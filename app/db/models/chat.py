@@ -10,6 +10,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -46,7 +47,7 @@ class ChatThread(Base):
     lounge_id = Column(Integer, ForeignKey("lounges.id"), nullable=True)
     title = Column(String(255), nullable=True)
     status = Column(
-        SQLEnum(ThreadStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(ThreadStatus, values_callable=enum_values),
         default=ThreadStatus.OPEN,
         nullable=False
     )
@@ -105,7 +106,7 @@ class ChatMessage(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     thread_id = Column(Integer, ForeignKey("chat_threads.id"), nullable=False)
-    sender_type = Column(SQLEnum(SenderType, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    sender_type = Column(SQLEnum(SenderType, values_callable=enum_values), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     reply_to_id = Column(Integer, ForeignKey("chat_messages.id"), nullable=True)  # Reply to another message
     content = Column(Text, nullable=False)
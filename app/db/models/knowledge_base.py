@@ -2,9 +2,12 @@
 Knowledge Base models for managing prompts, documents, and FAQs
 Supports RAG (Retrieval Augmented Generation) with embeddings
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, BigInteger, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, BigInteger, JSON, Index, Float
+from sqlalchemy import event, select, func, inspect
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, object_session
 from app.db.session import Base
+from app.db.types import Vector, QuantizedVector
 from app.core.timezone import now_naive
 
 
@@ -54,8 +57,10 @@ class KBPrompt(Base):
     is_included_in_rag = Column(Boolean, default=True, nullable=False)
     usage_count = Column(Integer, default=0, nullable=False)
 
-    # Embedding for RAG - stored as JSON array
-    embedding = Column(JSON, nullable=True)
+    # Embedding for RAG - packed float32 (see app.db.types.Vector)
+    embedding = Column(Vector(), nullable=True)
+    # Int8 copy for first-stage recall; kept in sync by `_sync_quantized_embedding`
+    embedding_q = Column(QuantizedVector(), nullable=True)
     embedding_model = Column(String(100), nullable=True)
 
     created_at = Column(DateTime, default=now_naive, nullable=False)
@@ -67,6 +72,11 @@ class KBPrompt(Base):
     category = relationship("KBCategory", back_populates="prompts")
     created_by = relationship("User")
 
+    # RAG retrieval filters on all three before scoring any vector.
+    __table_args__ = (
+        Index("ix_kb_prompts_rag_filter", "lounge_id", "is_active", "is_included_in_rag"),
+    )
+
     @property
     def has_embedding(self) -> bool:
         """Check if prompt has embedding"""
@@ -93,8 +103,9 @@ class KBDocument(Base):
     file_type = Column(String(50), nullable=False)
     file_size_bytes = Column(BigInteger, nullable=False)
 
-    # Extracted content for RAG
-    extracted_text = Column(Text, nullable=True)
+    # Extracted content for RAG lives in `kb_document_texts` (see
+    # KBDocumentText) so listing/serialising documents never drags a
+    # multi-MB body across the wire.
     summary = Column(Text, nullable=True)
     tags = Column(JSON, nullable=True)
 
@@ -103,7 +114,7 @@ class KBDocument(Base):
     processing_error = Column(Text, nullable=True)
 
     # Embedding for document-level search
-    embedding = Column(JSON, nullable=True)
+    embedding = Column(Vector(), nullable=True)
     embedding_model = Column(String(100), nullable=True)
 
     created_at = Column(DateTime, default=now_naive, nullable=False)
@@ -115,22 +126,73 @@ class KBDocument(Base):
     category = relationship("KBCategory", back_populates="documents")
     file = relationship("File")
     created_by = relationship("User")
-    chunks = relationship("KBDocumentChunk", back_populates="document", cascade="all, delete-orphan")
+    # Chunks are never loaded through this collection implicitly (a large
+    # PDF has thousands, each with an embedding); query KBDocumentChunk or
+    # use `chunk_count`. Deletes rely on the FK's ON DELETE CASCADE.
+    chunks = relationship(
+        "KBDocumentChunk",
+        back_populates="document",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    # Never loaded implicitly; the row is deleted by the FK's ON DELETE CASCADE.
+    text_row = relationship(
+        "KBDocumentText",
+        uselist=False,
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    # Documents have no `is_included_in_rag` flag; retrieval filters on these two.
+    __table_args__ = (
+        Index("ix_kb_documents_rag_filter", "lounge_id", "is_active"),
+    )
 
     @property
     def has_embedding(self) -> bool:
         """Check if document has embedding"""
         return self.embedding is not None
 
-    @property
+    @hybrid_property
     def chunk_count(self) -> int:
         """Get number of chunks"""
-        return len(self.chunks) if self.chunks else 0
+        session = object_session(self)
+        if session is None or "chunks" not in inspect(self).unloaded:
+            return len(self.chunks) if self.chunks else 0
+        return session.scalar(
+            select(func.count(KBDocumentChunk.id)).where(
+                KBDocumentChunk.document_id == self.id
+            )
+        ) or 0
+
+    @chunk_count.expression
+    def chunk_count(cls):
+        return (
+            select(func.count(KBDocumentChunk.id))
+            .where(KBDocumentChunk.document_id == cls.id)
+            .correlate_except(KBDocumentChunk)
+            .scalar_subquery()
+        )
 
     def __repr__(self):
         return f"<KBDocument(id={self.id}, title={self.title}, file_type={self.file_type})>"
 
 
+class KBDocumentText(Base):
+    """Full extracted text of a KB document, kept out of the hot documents row"""
+
+    __tablename__ = "kb_document_texts"
+
+    document_id = Column(
+        Integer, ForeignKey("kb_documents.id", ondelete="CASCADE"), primary_key=True
+    )
+    # MEDIUMTEXT (~16MB); extracted PDFs routinely exceed TEXT's 64KB.
+    body = Column(Text(length=16_777_215), nullable=False)
+
+    def __repr__(self):
+        return f"<KBDocumentText(document_id={self.document_id})>"
+
+
 class KBDocumentChunk(Base):
     """Document chunk for granular RAG retrieval"""
 
@@ -145,24 +207,47 @@ class KBDocumentChunk(Base):
     end_char = Column(Integer, nullable=True)
     token_count = Column(Integer, nullable=True)
 
-    # Embedding for RAG
-    embedding = Column(JSON, nullable=True)
-    embedding_model = Column(String(100), nullable=True)
-
     created_at = Column(DateTime, default=now_naive, nullable=False)
 
     # Relationships
     document = relationship("KBDocument", back_populates="chunks")
-
-    @property
-    def has_embedding(self) -> bool:
-        """Check if chunk has embedding"""
-        return self.embedding is not None
+    # The embedding lives in `kb_document_chunk_embeddings`; search scans
+    # that narrow table and only loads chunk text for the top hits.
+    embedding_row = relationship(
+        "KBDocumentChunkEmbedding",
+        back_populates="chunk",
+        uselist=False,
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("ix_kb_document_chunks_doc", "document_id"),
+    )
 
     def __repr__(self):
         return f"<KBDocumentChunk(id={self.id}, document_id={self.document_id}, index={self.chunk_index})>"
 
 
+class KBDocumentChunkEmbedding(Base):
+    """Embedding of a document chunk, kept apart from the chunk's text"""
+
+    __tablename__ = "kb_document_chunk_embeddings"
+
+    chunk_id = Column(
+        Integer, ForeignKey("kb_document_chunks.id", ondelete="CASCADE"), primary_key=True
+    )
+    embedding = Column(Vector(), nullable=False)
+    embedding_q = Column(QuantizedVector(), nullable=True)
+    embedding_model = Column(String(100), nullable=True)
+
+    # Relationships
+    chunk = relationship("KBDocumentChunk", back_populates="embedding_row")
+
+    def __repr__(self):
+        return f"<KBDocumentChunkEmbedding(chunk_id={self.chunk_id})>"
+
+
 class KBFaq(Base):
     """Knowledge Base FAQ model - frequently asked questions with RAG support"""
 
@@ -183,9 +268,14 @@ class KBFaq(Base):
     view_count = Column(Integer, default=0, nullable=False)
     helpful_count = Column(Integer, default=0, nullable=False)
     not_helpful_count = Column(Integer, default=0, nullable=False)
+    # helpful / (helpful + not_helpful), maintained by
+    # `KnowledgeBaseService.record_faq_feedback` so sorting by helpfulness
+    # is an index scan instead of a per-row computed expression.
+    helpfulness_ratio_cached = Column(Float, default=0.0, nullable=False, index=True)
 
     # Embedding for RAG (combined question + answer)
-    embedding = Column(JSON, nullable=True)
+    embedding = Column(Vector(), nullable=True)
+    embedding_q = Column(QuantizedVector(), nullable=True)
     embedding_model = Column(String(100), nullable=True)
 
     created_at = Column(DateTime, default=now_naive, nullable=False)
@@ -197,6 +287,10 @@ class KBFaq(Base):
     category = relationship("KBCategory", back_populates="faqs")
     created_by = relationship("User")
 
+    __table_args__ = (
+        Index("ix_kb_faqs_rag_filter", "lounge_id", "is_active", "is_included_in_rag"),
+    )
+
     @property
     def has_embedding(self) -> bool:
         """Check if FAQ has embedding"""
@@ -212,3 +306,13 @@ class KBFaq(Base):
 
     def __repr__(self):
         return f"<KBFaq(id={self.id}, question={self.question[:50]}...)>"
+
+
+def _sync_quantized_embedding(target, value, oldvalue, initiator):
+    """Mirror every write of `embedding` into the int8 `embedding_q` copy."""
+    target.embedding_q = value
+    return value
+
+
+for _model in (KBPrompt, KBDocumentChunkEmbedding, KBFaq):
+    event.listen(_model.embedding, "set", _sync_quantized_embedding, retval=True)
@@ -3,11 +3,14 @@ Lounge and LoungeMembership models
 """
 from sqlalchemy import (
     Column, Integer, String, ForeignKey,
-    Enum as SQLEnum, Text, Boolean, DateTime, JSON
+    Enum as SQLEnum, Text, Boolean, DateTime, JSON,
+    Index, select, func, and_, inspect
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, object_session
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -36,7 +39,7 @@ class Lounge(Base):
     description = Column(Text, nullable=True)
     category_id = Column(Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True)
     access_type = Column(
-        SQLEnum(AccessType, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(AccessType, values_callable=enum_values),
         default=AccessType.FREE,
         nullable=False
     )
@@ -91,17 +94,43 @@ class Lounge(Base):
         cascade="all, delete-orphan"
     )
 
-    @property
+    @hybrid_property
     def member_count(self) -> int:
         """Get count of active members"""
-        return len([m for m in self.memberships if m.left_at is None])
-    
-    @property
+        # Reuse the collection when it's already loaded; otherwise let the DB
+        # count rather than materialising every membership row.
+        session = object_session(self)
+        if session is None or "memberships" not in inspect(self).unloaded:
+            return sum(1 for m in self.memberships if m.left_at is None)
+        return session.scalar(
+            select(func.count(LoungeMembership.id)).where(
+                LoungeMembership.lounge_id == self.id,
+                LoungeMembership.left_at.is_(None)
+            )
+        ) or 0
+
+    @member_count.expression
+    def member_count(cls):
+        return (
+            select(func.count(LoungeMembership.id))
+            .where(
+                LoungeMembership.lounge_id == cls.id,
+                LoungeMembership.left_at.is_(None)
+            )
+            .correlate_except(LoungeMembership)
+            .scalar_subquery()
+        )
+
+    @hybrid_property
     def is_full(self) -> bool:
         """Check if lounge has reached max capacity"""
         if self.max_members is None:
             return False
         return self.member_count >= self.max_members
+
+    @is_full.expression
+    def is_full(cls):
+        return and_(cls.max_members.isnot(None), cls.member_count >= cls.max_members)
     
     def __repr__(self):
         return f"<Lounge(id={self.id}, title={self.title}, mentor_id={self.mentor_id})>"
@@ -116,7 +145,7 @@ class LoungeMembership(Base):
     lounge_id = Column(Integer, ForeignKey("lounges.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     role = Column(
-        SQLEnum(MembershipRole, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(MembershipRole, values_callable=enum_values),
         default=MembershipRole.MEMBER,
         nullable=False
     )
@@ -126,6 +155,14 @@ class LoungeMembership(Base):
     # Relationships
     lounge = relationship("Lounge", back_populates="memberships")
     user = relationship("User", back_populates="lounge_memberships")
+
+    # Active-member counts / capacity checks filter `lounge_id = ? AND
+    # left_at IS NULL`. MySQL has no partial indexes, so index both columns:
+    # the NULL range for a lounge is contiguous and the COUNT(*) is answered
+    # from the index without touching churned members' rows.
+    __table_args__ = (
+        Index("ix_lounge_memberships_active", "lounge_id", "left_at"),
+    )
     
     @property
     def is_active(self) -> bool:
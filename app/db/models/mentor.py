@@ -5,6 +5,7 @@ from sqlalchemy import Column, Integer, String, ForeignKey, Enum as SQLEnum, Tex
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -32,7 +33,7 @@ class Mentor(Base):
     intro_video_url = Column(String(500), nullable=True)
     experience_years = Column(Integer, default=0)
     status = Column(
-        SQLEnum(MentorStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(MentorStatus, values_callable=enum_values),
         default=MentorStatus.PENDING,
         nullable=False
     )
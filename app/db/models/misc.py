@@ -3,11 +3,12 @@ Notification, CMS, and Compliance models
 """
 from sqlalchemy import (
     Column, Integer, String, ForeignKey,
-    Enum as SQLEnum, Text, DateTime, Boolean, JSON
+    Enum as SQLEnum, Text, DateTime, Boolean, JSON, Index
 )
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.base import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -33,9 +34,9 @@ class Notification(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     type = Column(String(100), nullable=False)  # e.g., "capsule_unlocked", "new_message"
     data = Column(JSON, nullable=True)  # Additional notification data
-    channel = Column(SQLEnum(NotificationChannel, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    channel = Column(SQLEnum(NotificationChannel, values_callable=enum_values), nullable=False)
     status = Column(
-        SQLEnum(NotificationStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(NotificationStatus, values_callable=enum_values),
         default=NotificationStatus.QUEUED,
         nullable=False
     )
@@ -45,6 +46,17 @@ class Notification(Base):
     
     # Relationships
     user = relationship("User", back_populates="notifications")
+
+    # Status-leading so the queued-notification scan is a single index range
+    # (MySQL stand-in for a partial `WHERE status = 'queued'` index).
+    # user_id-leading index serves the in-app feed (one user's notifications,
+    # newest first) without a filesort.
+    __table_args__ = (
+        Index("ix_notifications_status_user", "status", "user_id"),
+        Index("ix_notifications_user_feed", "user_id", "created_at"),
+        # Unread badge count / mark-all-read: `read_at IS NULL` per user
+        Index("ix_notifications_user_unread", "user_id", "read_at", "channel"),
+    )
     
     @property
     def is_read(self) -> bool:
@@ -166,9 +178,9 @@ class ComplianceRequest(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    request_type = Column(SQLEnum(RequestType, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    request_type = Column(SQLEnum(RequestType, values_callable=enum_values), nullable=False)
     status = Column(
-        SQLEnum(RequestStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(RequestStatus, values_callable=enum_values),
         default=RequestStatus.PENDING,
         nullable=False
     )
@@ -210,7 +222,7 @@ class ContactMessage(Base):
     subject = Column(String(500), nullable=False)
     message = Column(Text, nullable=False)
     status = Column(
-        SQLEnum(ContactMessageStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(ContactMessageStatus, values_callable=enum_values),
         default=ContactMessageStatus.NEW,
         nullable=False
     )
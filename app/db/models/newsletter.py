@@ -5,6 +5,7 @@ from enum import Enum
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum
 
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -22,7 +23,7 @@ class NewsletterSubscriber(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     status = Column(
-        SQLEnum(SubscriberStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(SubscriberStatus, values_callable=enum_values),
         default=SubscriberStatus.ACTIVE,
         nullable=False
     )
@@ -3,11 +3,14 @@ Note and TimeCapsule models
 """
 from sqlalchemy import (
     Column, Integer, String, ForeignKey,
-    Text, Boolean, DateTime, Enum as SQLEnum, JSON
+    Text, Boolean, DateTime, Enum as SQLEnum, JSON,
+    Index, and_
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -25,6 +28,9 @@ class Note(Base):
     is_pinned = Column(Boolean, default=False, nullable=False)
     is_included_in_rag = Column(Boolean, default=False, nullable=False)
     tags = Column(JSON, nullable=True)  # Array of tags
+    # Computed from the plaintext on write; content is encrypted at rest, so
+    # it can't be recomputed without decrypting every row.
+    word_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=now_naive, nullable=False)
     updated_at = Column(
         DateTime,
@@ -42,11 +48,6 @@ class Note(Base):
         """Get tags as list"""
         return self.tags if self.tags else []
     
-    @property
-    def word_count(self) -> int:
-        """Get approximate word count"""
-        return len(self.content.split())
-    
     def __repr__(self):
         return (
             f"<Note(id={self.id}, "
@@ -74,7 +75,7 @@ class TimeCapsule(Base):
     content = Column(Text, nullable=False)
     unlock_at = Column(DateTime, nullable=False)
     status = Column(
-        SQLEnum(CapsuleStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(CapsuleStatus, values_callable=enum_values),
         default=CapsuleStatus.LOCKED,
         nullable=False
     )
@@ -89,14 +90,25 @@ class TimeCapsule(Base):
     # Relationships
     user = relationship("User", back_populates="time_capsules")
     lounge = relationship("Lounge", back_populates="time_capsules")
+
+    # Serves the unlock worker's "locked and due" scan
+    __table_args__ = (
+        Index("ix_time_capsules_status_unlock", "status", "unlock_at"),
+    )
     
-    @property
+    @hybrid_property
     def is_unlockable(self) -> bool:
         """Check if capsule can be unlocked"""
         return (
             self.status == CapsuleStatus.LOCKED and
             now_naive() >= self.unlock_at
         )
+
+    @is_unlockable.expression
+    def is_unlockable(cls):
+        # now_naive() is bound as a parameter rather than using func.now():
+        # unlock_at is stored in app-local time, not the server's.
+        return and_(cls.status == CapsuleStatus.LOCKED, cls.unlock_at <= now_naive())
     
     @property
     def days_until_unlock(self) -> int:
@@ -1,7 +1,7 @@
 """
 Public Chatbot Configuration model
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index
 from app.db.session import Base
 from app.core.timezone import now_naive
 
@@ -20,10 +20,6 @@ class PublicChatbotConfig(Base):
     # System prompt for AI behavior
     system_prompt = Column(Text, nullable=True)
 
-    # Embedding for RAG
-    system_prompt_embedding = Column(JSON, nullable=True)
-    embedding_model = Column(String(100), nullable=True)
-
     # Placeholder text for input
     input_placeholder = Column(String(255), default="What's on your mind?", nullable=False)
 
@@ -56,7 +52,7 @@ class PublicChatMessage(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # Session identifier (for anonymous users)
-    session_id = Column(String(100), nullable=False, index=True)
+    session_id = Column(String(100), nullable=False)
 
     # Message content
     role = Column(String(20), nullable=False)  # 'user' or 'assistant'
@@ -65,5 +61,11 @@ class PublicChatMessage(Base):
     # Timestamp
     created_at = Column(DateTime, default=now_naive, nullable=False)
 
+    # History reads are "this session, newest first"; the composite index
+    # also covers plain session_id lookups (clear_session).
+    __table_args__ = (
+        Index("ix_public_chat_messages_session_created", "session_id", "created_at"),
+    )
+
     def __repr__(self):
         return f"<PublicChatMessage(id={self.id}, session={self.session_id}, role={self.role})>"
@@ -6,6 +6,7 @@ from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, Boole
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.session import Base
+from app.db.types import enum_values
 from app.core.timezone import now_naive
 
 
@@ -29,7 +30,7 @@ class User(Base):
     avatar_url = Column(String(500), nullable=True)
     stripe_customer_id = Column(String(255), nullable=True, index=True)  # Stripe customer ID for billing
     role = Column(
-        SQLEnum(UserRole, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(UserRole, values_callable=enum_values),
         default=UserRole.MEMBER,
         nullable=False
     )
@@ -77,71 +78,87 @@ class User(Base):
     )
     
     # Relationships
+    # Collections never lazy-load: a user can own thousands of rows in each,
+    # so callers query them (paged) or opt in with selectinload(). The
+    # mentor profile is a cheap 1:1 needed by every mentor-gated request.
     oauth_accounts = relationship(
         "OAuthAccount",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     sessions = relationship(
         "UserSession",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     mentor_profile = relationship(
         "Mentor",
         back_populates="user",
         uselist=False,
+        lazy="joined",
         cascade="all, delete-orphan"
     )
     lounge_memberships = relationship(
         "LoungeMembership",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     chat_threads = relationship(
         "ChatThread",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     files = relationship(
         "File",
         back_populates="owner",
         foreign_keys="File.owner_user_id",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     notes = relationship(
         "Note",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     time_capsules = relationship(
         "TimeCapsule",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     subscriptions = relationship(
         "Subscription",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     payments = relationship(
         "Payment",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     lounge_subscriptions = relationship(
         "LoungeSubscription",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     notifications = relationship(
         "Notification",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     compliance_requests = relationship(
         "ComplianceRequest",
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan"
     )
     
@@ -2,9 +2,12 @@
 Database session management
 Provides database connection and session handling
 """
-from sqlalchemy import create_engine
+from collections import Counter
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.types import TypeDecorator
 from typing import Generator
 from app.core.config import settings
 
@@ -16,13 +19,20 @@ from app.core.config import settings
 _engine_kwargs = {
     "echo": settings.DB_ECHO,
     "pool_pre_ping": True,
+    # Shared by every Session/connection on this engine, so a statement
+    # compiled once is reused across requests.
+    "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
 }
 if not settings.DATABASE_URL.startswith("sqlite"):
-    _engine_kwargs.update({
-        "pool_size": 10,
-        "max_overflow": 20,
-        "pool_recycle": 3600,
-    })
+    if settings.DB_USE_NULL_POOL:
+        # An external pooler owns the connections; don't hold any here.
+        _engine_kwargs["poolclass"] = NullPool
+    else:
+        _engine_kwargs.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": 3600,
+        })
 
 engine = create_engine(settings.DATABASE_URL, **_engine_kwargs)
 
@@ -51,10 +61,98 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def init_db() -> None:
+def check_mapper_registry() -> None:
+    """
+    Configure every mapper once and fail fast on duplicate table mappings
+
+    A stale copy of a model module (two classes mapped onto the same
+    table) doubles mapper configuration and relationship bookkeeping and
+    makes class resolution by name ambiguous. Configuring eagerly here
+    also moves that one-off cost to startup instead of the first query.
+
+    Raises:
+        RuntimeError: If more than one base mapper targets the same table
+    """
+    Base.registry.configure()
+    seen = {}
+    duplicates = []
+    for mapper in Base.registry.mappers:
+        if mapper.inherits is not None:
+            continue
+        table_name = mapper.local_table.name
+        if table_name in seen:
+            duplicates.append(
+                f"{table_name} ({seen[table_name]}, {mapper.class_.__module__})"
+            )
+        else:
+            seen[table_name] = mapper.class_.__module__
+    if duplicates:
+        raise RuntimeError(
+            "Duplicate ORM mappings for table(s): " + ", ".join(duplicates)
+        )
+
+
+def check_statement_caching() -> None:
+    """
+    Fail fast if a mapped column uses a type that opts out of statement caching
+
+    A `TypeDecorator` without `cache_ok = True` makes SQLAlchemy skip the
+    compiled-statement cache (with only a one-time warning) for every
+    statement touching that column, silently re-compiling on each request.
+
+    Raises:
+        RuntimeError: If any mapped column's type is not cache-safe
+    """
+    uncached = [
+        f"{mapper.class_.__name__}.{column.key} ({type(column.type).__name__})"
+        for mapper in Base.registry.mappers
+        for column in mapper.columns
+        if isinstance(column.type, TypeDecorator) and not column.type.cache_ok
+    ]
+    if uncached:
+        raise RuntimeError(
+            "Column types without cache_ok=True: " + ", ".join(uncached)
+        )
+
+
+# Compiled-statement cache outcomes ("CACHE_HIT", "CACHE_MISS", ...), only
+# populated once `track_statement_cache()` has been called (DEBUG builds).
+statement_cache_stats: Counter = Counter()
+
+
+def _count_statement_cache(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        outcome = context.cache_hit
+        statement_cache_stats[getattr(outcome, "name", str(outcome))] += 1
+
+
+def track_statement_cache() -> None:
+    """Start counting compiled-statement cache hits/misses on the engine"""
+    if not event.contains(engine, "before_cursor_execute", _count_statement_cache):
+        event.listen(engine, "before_cursor_execute", _count_statement_cache)
+
+
+def init_db_dev_only() -> None:
     """
-    Initialize database tables
-    Creates all tables defined in models
+    Create any missing tables straight from the models
+
+    Local convenience only: `create_all` probes information_schema once
+    per table, and it cannot alter existing tables anyway.
     """
     from app.db import models  # noqa: F401
+    check_mapper_registry()
     Base.metadata.create_all(bind=engine)
+
+
+def init_db() -> None:
+    """
+    Initialize the database layer at startup
+
+    Outside development the schema is owned by Alembic (`alembic upgrade
+    head` runs from the deploy/start scripts), so startup issues no schema
+    queries. The mapper and statement-cache checks are run by the app
+    lifespan itself, outside its best-effort error handling, so that they
+    stop startup.
+    """
+    if settings.APP_ENV == "development":
+        init_db_dev_only()
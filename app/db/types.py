@@ -0,0 +1,121 @@
+"""
+Custom SQLAlchemy column types
+"""
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+def enum_values(enum_cls: Type[Enum]) -> List[str]:
+    """
+    `values_callable` for `SQLEnum` columns: persist each member's value
+    (e.g. "active") rather than its name ("ACTIVE").
+
+    Shared by every enum column so the MySQL ENUM definitions stay in step
+    with the Python enums without a per-column lambda.
+    """
+    return [member.value for member in enum_cls]
+
+
+class Vector(TypeDecorator):
+    """
+    Dense embedding vector stored as packed little-endian float32 bytes.
+
+    Replaces the old JSON-array storage: a 1536-dim embedding is 6KB of
+    raw floats instead of ~20KB of UTF-8 JSON, and loading it is a single
+    `np.frombuffer` instead of a JSON parse that allocates one Python float
+    per dimension. Values are returned as read-only `np.ndarray[float32]`
+    so the similarity code can feed them straight into NumPy.
+
+    Bind values may be any sequence of numbers (the OpenAI client returns
+    `list[float]`) or an ndarray.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    _dtype = np.dtype("<f4")
+
+    def __init__(self, dim: Optional[int] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dim = dim
+
+    def process_bind_param(
+        self, value: Optional[Union[Sequence[float], np.ndarray]], dialect
+    ) -> Optional[bytes]:
+        if value is None:
+            return None
+        arr = np.asarray(value, dtype=self._dtype)
+        if arr.ndim != 1:
+            raise ValueError(f"Vector expects a 1-D sequence, got shape {arr.shape}")
+        if self.dim is not None and arr.shape[0] != self.dim:
+            raise ValueError(f"Vector expects {self.dim} dimensions, got {arr.shape[0]}")
+        return arr.tobytes()
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype=self._dtype)
+
+    def compare_values(self, x, y) -> bool:
+        # The default `x == y` is elementwise for ndarrays, which breaks the
+        # unit-of-work's "did this attribute change" check.
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(
+            np.asarray(x, dtype=self._dtype), np.asarray(y, dtype=self._dtype)
+        )
+
+
+def quantize_int8(value: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, float]:
+    """
+    Symmetric per-vector int8 quantization.
+
+    Returns `(codes, scale)` with `codes * scale ≈ value`. An all-zero vector
+    gets scale 1.0 so dequantization never divides by zero.
+    """
+    arr = np.asarray(value, dtype=np.float32)
+    peak = float(np.max(np.abs(arr))) if arr.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    codes = np.clip(np.rint(arr / scale), -127, 127).astype(np.int8)
+    return codes, scale
+
+
+class QuantizedVector(TypeDecorator):
+    """
+    Int8-quantized embedding: a float32 scale followed by one int8 code per
+    dimension, so a 1536-dim vector is ~1.5KB instead of 6KB.
+
+    Used as a compact first-stage recall copy alongside a full-precision
+    `Vector` column: search scores every candidate against this column and
+    only loads the float32 vectors of the best few for an exact rerank.
+    Reads return the dequantized `np.ndarray[float32]`.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    _scale_dtype = np.dtype("<f4")
+
+    def process_bind_param(
+        self, value: Optional[Union[Sequence[float], np.ndarray]], dialect
+    ) -> Optional[bytes]:
+        if value is None:
+            return None
+        codes, scale = quantize_int8(value)
+        return np.array([scale], dtype=self._scale_dtype).tobytes() + codes.tobytes()
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        scale = np.frombuffer(value, dtype=self._scale_dtype, count=1)[0]
+        codes = np.frombuffer(value, dtype=np.int8, offset=self._scale_dtype.itemsize)
+        return codes.astype(np.float32) * scale
+
+    def compare_values(self, x, y) -> bool:
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(np.asarray(x), np.asarray(y))
@@ -2,26 +2,30 @@
 Main FastAPI application entry point
 AI Coaching Lounges Platform 
 """
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
 from contextlib import asynccontextmanager
 from pathlib import Path
+import secrets
 import time
-import uuid
 
+import orjson
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
 from app.core.exceptions import AppException
+from app.core.responses import ORJSONResponse
 from app.core.logging import setup_logging, get_logger, log_api_request, log_error
 from app.core.rate_limit import limiter
-from app.db.session import init_db
+from app.db.session import (
+    init_db, check_mapper_registry, check_statement_caching,
+    track_statement_cache, statement_cache_stats,
+)
 
 # Setup logging
 setup_logging(
@@ -59,6 +63,12 @@ async def lifespan(app: FastAPI):
             raise
         logger.warning(f"KMS master key unavailable (dev mode): {e}")
 
+    # Duplicate table mappings and column types that disable the statement
+    # cache are deploy bugs, not transient DB errors: checked outside the
+    # try below so startup stops instead of logging
+    check_mapper_registry()
+    check_statement_caching()
+
     # Initialize database
     try:
         init_db()
@@ -66,6 +76,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Database initialization failed: {e}", exc_info=True)
 
+    if settings.DEBUG:
+        track_statement_cache()
+
     # Reconcile the in-code support-style catalogue with the DB tables
     # (Security Standard §15 — Task S1/S19/S20). Any new snippet text
     # deployed in this release is recorded as a new immutable version
@@ -106,12 +119,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Could not schedule KB document recovery: {e}")
 
+    # Batch audit-log inserts and FAQ view counts instead of one write each
+    from app.services.audit_log_service import audit_log_writer
+    from app.services.faq_view_counter import faq_view_counter
+    await audit_log_writer.start()
+    await faq_view_counter.start()
+
     logger.info("API startup complete - Ready to accept requests")
 
     yield
 
     # Shutdown
     logger.info("Shutting down AI Prompterly Platform API...")
+    await audit_log_writer.stop()
+    await faq_view_counter.stop()
+    if statement_cache_stats:
+        logger.info(f"SQL statement cache: {dict(statement_cache_stats)}")
 
 
 # Create FastAPI application
@@ -121,6 +144,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -149,8 +173,8 @@ app.add_middleware(
 )
 
 
-# Add GZip compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add response compression middleware (zstd/br/gzip, negotiated per request)
+app.add_middleware(CompressionMiddleware, minimum_size=1500)
 
 
 # Mount static files for local storage
@@ -161,23 +185,36 @@ if settings.STORAGE_TYPE.lower() == "local":
     logger.info(f"Local file storage mounted at /files -> {uploads_path.absolute()}")
 
 
+# Load-balancer/liveness probes and static files: no request ID, timing or
+# log lines (the probes alone would otherwise dominate the request log)
+_SKIP_LOG_PATHS = frozenset({"/health", "/", "/metrics"})
+_SKIP_LOG_PREFIXES = ("/files/",)
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests with timing and generate request ID"""
-    # Generate unique request ID
-    request_id = str(uuid.uuid4())[:8]
+    path = request.url.path
+    if path in _SKIP_LOG_PATHS or path.startswith(_SKIP_LOG_PREFIXES):
+        return await call_next(request)
+
+    # Generate unique request ID (8 hex chars, same shape as before)
+    request_id = secrets.token_hex(4)
     request.state.request_id = request_id
 
     # Get client IP
     client_ip = request.client.host if request.client else "unknown"
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        client_ip = forwarded_for.split(",")[0].strip()
+        if "," in forwarded_for:
+            forwarded_for = forwarded_for.split(",", 1)[0]
+        client_ip = forwarded_for.strip()
 
-    # Log incoming request
+    # Log incoming request (arguments are only formatted if INFO is enabled)
     logger.info(
-        f"[{request_id}] --> {request.method} {request.url.path} from {client_ip}",
+        "[%s] --> %s %s from %s",
+        request_id, request.method, request.url.path, client_ip,
         extra={
             'request_id': request_id,
             'method': request.method,
@@ -186,7 +223,7 @@ async def log_requests(request: Request, call_next):
         }
     )
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = None
     error_msg = None
 
@@ -195,14 +232,14 @@ async def log_requests(request: Request, call_next):
     except Exception as e:
         error_msg = str(e)
         logger.error(
-            f"[{request_id}] Unhandled error in middleware: {e}",
+            "[%s] Unhandled error in middleware: %s", request_id, e,
             exc_info=True,
             extra={'request_id': request_id}
         )
         raise
     finally:
         # Calculate processing time
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         status_code = response.status_code if response else 500
 
         # Log the completed request
@@ -220,7 +257,7 @@ async def log_requests(request: Request, call_next):
         # Add headers to response
         if response:
             response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{duration_ms:.2f}ms"
+            response.headers["X-Process-Time"] = format(duration_ms, ".2f") + "ms"
 
     return response
 
@@ -247,7 +284,7 @@ async def app_exception_handler(request: Request, exc: AppException):
         }
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict(),
         headers={"X-Request-ID": request_id}
@@ -286,7 +323,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": True,
@@ -326,7 +363,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     else:
         message = "An unexpected error occurred. Please try again later."
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": True,
@@ -342,18 +379,28 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Health & Root Endpoints
 # =============================================================================
 
+# Both bodies are constant for the life of the process, so serialise them
+# once instead of on every load-balancer probe.
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "environment": settings.APP_ENV
+})
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to AI Coaching Lounges API",
+    "version": "1.0.0",
+    "docs": "/docs" if settings.DEBUG else "Documentation disabled in production",
+    "health": "/health"
+})
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint
     Returns API status and version
     """
-    logger.debug("Health check requested")
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "environment": settings.APP_ENV
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
@@ -362,40 +409,22 @@ async def root():
     Root endpoint
     Returns welcome message and API information
     """
-    return {
-        "message": "Welcome to AI Coaching Lounges API",
-        "version": "1.0.0",
-        "docs": "/docs" if settings.DEBUG else "Documentation disabled in production",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # =============================================================================
 # API Routers
 # =============================================================================
 
-from app.api.v1 import auth, users, mentors, lounges, chat, notes, capsules, billing, notifications, cms, admin, knowledge_base, contact, public_chatbot, newsletter, landing, support_styles
+from app.api.v1 import register_routers
 
 # Include API v1 routers
-api_v1_prefix = settings.API_V1_PREFIX
-
-app.include_router(auth.router, prefix=f"{api_v1_prefix}/auth", tags=["Authentication"])
-app.include_router(users.router, prefix=f"{api_v1_prefix}/users", tags=["Users"])
-app.include_router(mentors.router, prefix=f"{api_v1_prefix}/mentors", tags=["Mentors"])
-app.include_router(lounges.router, prefix=f"{api_v1_prefix}/lounges", tags=["Lounges"])
-app.include_router(chat.router, prefix=f"{api_v1_prefix}/chat", tags=["Chat"])
-app.include_router(notes.router, prefix=f"{api_v1_prefix}/notes", tags=["Notes"])
-app.include_router(capsules.router, prefix=f"{api_v1_prefix}/capsules", tags=["Time Capsules"])
-app.include_router(billing.router, prefix=f"{api_v1_prefix}/billing", tags=["Billing"])
-app.include_router(notifications.router, prefix=f"{api_v1_prefix}/notifications", tags=["Notifications"])
-app.include_router(cms.router, prefix=f"{api_v1_prefix}/cms", tags=["CMS"])
-app.include_router(admin.router, prefix=f"{api_v1_prefix}/admin", tags=["Admin"])
-app.include_router(knowledge_base.router, prefix=f"{api_v1_prefix}/knowledge-base", tags=["Knowledge Base"])
-app.include_router(contact.router, prefix=f"{api_v1_prefix}/contact", tags=["Contact"])
-app.include_router(public_chatbot.router, prefix=api_v1_prefix, tags=["Public Chatbot"])
-app.include_router(newsletter.router, prefix=api_v1_prefix, tags=["Newsletter"])
-app.include_router(landing.router, prefix=f"{api_v1_prefix}/landing", tags=["Landing Page & Dashboard"])
-app.include_router(support_styles.router, prefix=f"{api_v1_prefix}/support-styles", tags=["Support Styles"])
+register_routers(app, settings.API_V1_PREFIX)
+
+# Each middleware class is registered once; a second registration (e.g.
+# from wiring the app twice) would run it twice on every request.
+assert len({m.cls for m in app.user_middleware}) == len(app.user_middleware), \
+    "duplicate middleware registration"
 
 logger.info(f"Registered {len(app.routes)} routes")
 
@@ -0,0 +1,69 @@
+"""
+Validation helpers shared by the request schemas
+"""
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+
+from pydantic import TypeAdapter
+
+
+# Slugs appear in URLs: ASCII letters, digits, hyphens and underscores only
+SLUG_RE = re.compile(r"^[A-Za-z0-9_-]+\Z")
+
+# "#RRGGBB"; the pattern also bounds the length
+HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}\Z")
+
+
+def normalize_tags(tags: Iterable[str]) -> List[str]:
+    """Strip and lowercase tags, dropping blanks and repeats (first one wins)"""
+    seen = set()
+    normalized = []
+    for tag in tags:
+        tag = tag.strip().lower()
+        if tag and tag not in seen:
+            seen.add(tag)
+            normalized.append(tag)
+    return normalized
+
+
+def page_count(total: int, limit: int) -> int:
+    """Number of pages for `total` rows; an empty list still has one page"""
+    return -(-total // limit) if total > 0 else 1
+
+
+@lru_cache(maxsize=None)
+def list_adapter(item_type: Type[Any]) -> TypeAdapter:
+    """
+    `TypeAdapter(List[item_type])`, built on first use
+
+    Building it at import time would force a full schema build of item models
+    marked `defer_build=True`.
+    """
+    return TypeAdapter(List[item_type])
+
+
+def paginated_json(
+    item_type: Type[Any],
+    items: List[Any],
+    *,
+    total: int,
+    page: int,
+    limit: int,
+    items_key: str = "items",
+    limit_key: str = "limit",
+    pages_key: str = "pages",
+) -> bytes:
+    """
+    JSON body for an `{items, total, page, limit, pages}` list response
+
+    pydantic-core writes the items straight to JSON bytes, skipping FastAPI's
+    model -> dict -> jsonable_encoder walk and its re-validation against
+    `response_model`. The key arguments rename the envelope fields for list
+    responses that use a different shape.
+    """
+    pages = page_count(total, limit)
+    return (
+        f'{{"{items_key}":'.encode() + list_adapter(item_type).dump_json(items)
+        + f',"total":{total},"page":{page},"{limit_key}":{limit},"{pages_key}":{pages}}}'.encode()
+    )
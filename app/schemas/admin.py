@@ -1,17 +1,53 @@
 """
 Pydantic schemas for admin dashboard
 """
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+from dataclasses import dataclass
+
+from pydantic import BaseModel, ConfigDict, computed_field
+from typing import Generic, Literal, Optional, List, Dict, Tuple, TypeVar
 from datetime import datetime
 
+from app.db.models.misc import ContactMessageStatus
+from app.db.models.user import UserRole
+from app.schemas._common import page_count
+
+# Roles and contact statuses are typed with the model enums themselves:
+# pydantic-core validates str-backed enums on its enum fast path and
+# serialises them as their values, so the JSON is unchanged.
+#
+# Schemas used by a single, rarely-hit admin route are built lazily
+# (`defer_build=True`) so importing this module doesn't pay for their
+# validators up front. The paginated list schemas stay eager so the first
+# page load isn't penalised.
+
+
+T = TypeVar("T")
+
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """
+    Pagination envelope shared by the admin list responses
+
+    Each list is a parametrisation (`PaginatedResponse[UserManagementResponse]`);
+    pydantic caches the specialised class, so the envelope is defined once.
+    """
+    items: List[T]
+    total: int
+    page: int
+    limit: int
+
+    @computed_field
+    @property
+    def pages(self) -> int:
+        return page_count(self.total, self.limit)
+
 
 class UserManagementResponse(BaseModel):
     """Schema for user in admin panel"""
     id: int
     email: str
     name: str
-    role: str
+    role: UserRole
     avatar_url: Optional[str] = None
     email_verified_at: Optional[datetime]
     created_at: datetime
@@ -21,12 +57,13 @@ class UserManagementResponse(BaseModel):
     note_count: int = 0
     subscription_status: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SystemStatsResponse(BaseModel):
     """Schema for system statistics"""
+    model_config = ConfigDict(defer_build=True)
+
     total_users: int
     total_mentors: int
     total_lounges: int
@@ -42,6 +79,8 @@ class SystemStatsResponse(BaseModel):
 
 class PlatformHealthResponse(BaseModel):
     """Schema for platform health"""
+    model_config = ConfigDict(defer_build=True)
+
     status: str
     uptime_seconds: int
     database_status: str
@@ -50,12 +89,14 @@ class PlatformHealthResponse(BaseModel):
     api_response_time_ms: float
     
     # Resource usage
-    cpu_usage_percent: Optional[float] = None
-    memory_usage_percent: Optional[float] = None
+    cpu_usage_percent: float
+    memory_usage_percent: float
 
 
 class UserActivityResponse(BaseModel):
     """Schema for user activity"""
+    model_config = ConfigDict(defer_build=True)
+
     user_id: int
     user_name: str
     user_email: str
@@ -67,6 +108,8 @@ class UserActivityResponse(BaseModel):
 
 class RevenueReportResponse(BaseModel):
     """Schema for revenue report"""
+    model_config = ConfigDict(defer_build=True)
+
     period: str
     total_revenue_cents: int
     total_subscriptions: int
@@ -77,35 +120,35 @@ class RevenueReportResponse(BaseModel):
 
 class ContentModerationResponse(BaseModel):
     """Schema for content moderation"""
+    model_config = ConfigDict(defer_build=True)
+
     id: int
-    content_type: str  # note, message, lounge
+    content_type: Literal["note", "message", "lounge"]
     content_id: int
     user_id: int
     user_name: str
     content_preview: str
     flagged_at: datetime
     reason: Optional[str]
-    status: str  # pending, approved, rejected
+    status: Literal["pending", "approved", "rejected"]
 
 
 class UpdateUserRoleRequest(BaseModel):
     """Schema for updating user role"""
-    role: str
+    model_config = ConfigDict(defer_build=True)
+
+    role: UserRole
 
 
 class BanUserRequest(BaseModel):
     """Schema for banning user"""
+    model_config = ConfigDict(defer_build=True)
+
     reason: str
     duration_days: Optional[int] = None
 
 
-class PaginatedUsersResponse(BaseModel):
-    """Paginated response for users list"""
-    items: List[UserManagementResponse]
-    total: int
-    page: int
-    limit: int
-    pages: int
+PaginatedUsersResponse = PaginatedResponse[UserManagementResponse]
 
 
 # =============================================================================
@@ -114,18 +157,22 @@ class PaginatedUsersResponse(BaseModel):
 
 class CreateUserRequest(BaseModel):
     """Schema for creating a new user"""
+    model_config = ConfigDict(defer_build=True)
+
     email: str
     password: str
     name: str
-    role: str = "member"
+    role: UserRole = UserRole.MEMBER
     email_verified: bool = False
 
 
 class UpdateUserRequest(BaseModel):
     """Schema for updating a user"""
+    model_config = ConfigDict(defer_build=True)
+
     email: Optional[str] = None
     name: Optional[str] = None
-    role: Optional[str] = None
+    role: Optional[UserRole] = None
     email_verified: Optional[bool] = None
     avatar_url: Optional[str] = None
 
@@ -135,7 +182,7 @@ class UserDetailResponse(BaseModel):
     id: int
     email: str
     name: str
-    role: str
+    role: UserRole
     avatar_url: Optional[str]
     email_verified_at: Optional[datetime]
     created_at: datetime
@@ -144,8 +191,7 @@ class UserDetailResponse(BaseModel):
     note_count: int = 0
     subscription_status: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # =============================================================================
@@ -154,6 +200,8 @@ class UserDetailResponse(BaseModel):
 
 class CreateMentorRequest(BaseModel):
     """Schema for creating a mentor profile"""
+    model_config = ConfigDict(defer_build=True)
+
     user_id: int
     headline: Optional[str] = None
     bio: Optional[str] = None
@@ -185,6 +233,8 @@ class CreateMentorRequest(BaseModel):
 
 class UpdateMentorRequest(BaseModel):
     """Schema for updating a mentor"""
+    model_config = ConfigDict(defer_build=True)
+
     headline: Optional[str] = None
     bio: Optional[str] = None
     intro_video_url: Optional[str] = None
@@ -250,24 +300,22 @@ class MentorDetailResponse(BaseModel):
     # Quick prompts
     quick_prompts: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class PaginatedMentorsResponse(BaseModel):
-    """Paginated response for mentors list"""
-    items: List[MentorDetailResponse]
-    total: int
-    page: int
-    limit: int
-    pages: int
+PaginatedMentorsResponse = PaginatedResponse[MentorDetailResponse]
 
 
 # =============================================================================
 # Subscription Management Schemas
 # =============================================================================
 
-class LoungeInfo(BaseModel):
+# Row-like response structs that handlers build field by field are
+# slotted dataclasses rather than BaseModels: no per-instance __dict__, and
+# pydantic (TypeAdapter / response_model) still validates and serialises
+# them as before.
+@dataclass(slots=True, kw_only=True)
+class LoungeInfo:
     """Schema for lounge info in subscription context"""
     id: int
     title: str
@@ -276,9 +324,6 @@ class LoungeInfo(BaseModel):
     mentor_name: Optional[str] = None
     profile_image_url: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class UserSubscriptionResponse(BaseModel):
     """Schema for lounge subscription details"""
@@ -290,64 +335,54 @@ class UserSubscriptionResponse(BaseModel):
     # Plan info for frontend compatibility
     plan_name: str  # e.g. "Leadership Lounge - Monthly"
     plan_price_cents: int
-    billing_interval: str  # 'month' or 'year'
+    billing_interval: Literal["month", "year"]
     # Lounge details
     lounge_id: int
     lounge_title: str
     lounge_slug: str
-    lounges: List[LoungeInfo] = []  # For frontend compatibility
+    # For frontend compatibility. An immutable () default is shared, not
+    # copied per instance like a [] default; still serialises as a JSON array.
+    lounges: Tuple[LoungeInfo, ...] = ()
     # Subscription details
-    plan_type: str  # 'monthly' or 'yearly'
+    plan_type: Literal["monthly", "yearly"]
     status: str
     stripe_subscription_id: str
     started_at: datetime
     renews_at: Optional[datetime] = None
     canceled_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class PaginatedSubscriptionsResponse(BaseModel):
-    """Paginated response for subscriptions list"""
-    items: List[UserSubscriptionResponse]
-    total: int
-    page: int
-    limit: int
-    pages: int
+PaginatedSubscriptionsResponse = PaginatedResponse[UserSubscriptionResponse]
 
 
 # =============================================================================
 # Contact Message Management Schemas
 # =============================================================================
 
-class ContactMessageResponse(BaseModel):
-    """Schema for contact message in admin panel"""
+@dataclass(slots=True, kw_only=True)
+class ContactMessageResponse:
+    """Schema for contact message in admin panel (see LoungeInfo)"""
     id: int
     name: str
     email: str
     subject: str
     message: str
-    status: str
+    status: ContactMessageStatus
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
     created_at: datetime
     read_at: Optional[datetime] = None
     replied_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
-class PaginatedContactMessagesResponse(BaseModel):
-    """Paginated response for contact messages list"""
-    items: List[ContactMessageResponse]
-    total: int
-    page: int
-    limit: int
-    pages: int
+PaginatedContactMessagesResponse = PaginatedResponse[ContactMessageResponse]
 
 
 class UpdateContactMessageStatusRequest(BaseModel):
     """Request to update contact message status"""
-    status: str  # 'new', 'read', 'replied', 'archived'
+    model_config = ConfigDict(defer_build=True)
+
+    status: ContactMessageStatus
+
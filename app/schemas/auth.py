@@ -1,7 +1,7 @@
 """
 Pydantic schemas for authentication and user management
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.db.models.user import UserRole
@@ -14,7 +14,8 @@ class UserRegister(BaseModel):
     password: str = Field(..., min_length=8, max_length=100)
     name: str = Field(..., min_length=2, max_length=255)
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         # Check byte length for bcrypt compatibility
         if len(v.encode('utf-8')) > 72:
@@ -65,7 +66,8 @@ class PasswordReset(BaseModel):
     token: str
     new_password: str = Field(..., min_length=8, max_length=100)
 
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
         if not any(char.isdigit() for char in v):
             raise ValueError('Password must contain at least one digit')
@@ -81,7 +83,8 @@ class OTPVerification(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
     password: str = Field(..., min_length=8, max_length=100)
 
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         if len(v.encode('utf-8')) > 72:
             raise ValueError('Password cannot be longer than 72 bytes')
@@ -98,7 +101,8 @@ class PasswordResetOTPVerification(BaseModel):
     otp: str = Field(..., min_length=6, max_length=6)
     new_password: str = Field(..., min_length=8, max_length=100)
 
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
         if len(v.encode('utf-8')) > 72:
             raise ValueError('Password cannot be longer than 72 bytes')
@@ -148,8 +152,7 @@ class UserResponse(UserBase):
     is_payment_locked: bool = False
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
@@ -163,7 +166,8 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8, max_length=100)
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
         if not any(char.isdigit() for char in v):
             raise ValueError('Password must contain at least one digit')
@@ -179,8 +183,7 @@ class UserActivity(BaseModel):
     timestamp: datetime
     details: Optional[dict]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Email Change Schemas
@@ -287,8 +290,7 @@ class NotificationPreferencesResponse(BaseModel):
     notify_subscription_updates: bool
     notify_mentor_approved: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PrivacyAcceptance(BaseModel):
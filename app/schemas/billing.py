@@ -1,8 +1,8 @@
 """
 Pydantic schemas for billing and subscriptions
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, ConfigDict, computed_field
+from typing import Any, Optional, List, Dict
 from datetime import datetime
 
 
@@ -16,12 +16,13 @@ class SubscriptionPlanResponse(BaseModel):
     billing_interval: str
     features: List[str]
     is_active: bool
-    
-    # Computed
-    price_display: str = ""
-    
-    class Config:
-        from_attributes = True
+
+    @computed_field
+    @property
+    def price_display(self) -> str:
+        return f"${self.price_cents / 100:.2f}/{self.billing_interval}"
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CheckoutSessionCreate(BaseModel):
@@ -59,8 +60,7 @@ class SubscriptionResponse(BaseModel):
     is_active: bool = False
     days_until_renewal: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentResponse(BaseModel):
@@ -73,12 +73,13 @@ class PaymentResponse(BaseModel):
     currency: str
     status: str
     created_at: datetime
-    
-    # Computed
-    amount_display: str = ""
-    
-    class Config:
-        from_attributes = True
+
+    @computed_field
+    @property
+    def amount_display(self) -> str:
+        return f"${self.amount_cents / 100:.2f} {self.currency}"
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PortalSessionResponse(BaseModel):
@@ -89,7 +90,7 @@ class PortalSessionResponse(BaseModel):
 class WebhookEvent(BaseModel):
     """Schema for Stripe webhook event"""
     type: str
-    data: Dict
+    data: Dict[str, Any]
 
 
 class CancelSubscriptionRequest(BaseModel):
@@ -137,8 +138,7 @@ class LoungeSubscriptionResponse(BaseModel):
     is_active: bool = False
     days_until_renewal: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CancelLoungeSubscriptionRequest(BaseModel):
@@ -152,10 +152,18 @@ class LoungePricing(BaseModel):
     """Schema for lounge pricing information"""
     monthly_price_cents: int = 2500   # $25
     yearly_price_cents: int = 24000   # $240
-    monthly_price_display: str = "$25/month"
-    yearly_price_display: str = "$240/year"
     yearly_savings_percent: int = 20
 
+    @computed_field
+    @property
+    def monthly_price_display(self) -> str:
+        return f"${self.monthly_price_cents / 100:g}/month"
+
+    @computed_field
+    @property
+    def yearly_price_display(self) -> str:
+        return f"${self.yearly_price_cents / 100:g}/year"
+
 
 class UpgradeLoungeSubscriptionRequest(BaseModel):
     """Schema for upgrading lounge subscription from monthly to yearly"""
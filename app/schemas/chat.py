@@ -1,7 +1,7 @@
 """
 Pydantic schemas for chat system
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, computed_field
 from typing import Optional, List
 from datetime import datetime
 from app.db.models.chat import ThreadStatus, SenderType
@@ -40,8 +40,7 @@ class ChatThreadResponse(BaseModel):
     # 'analytical' | 'empathetic'). NULL means the user's account default.
     support_style: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SupportStyleUpdate(BaseModel):
@@ -69,7 +68,7 @@ class SupportStyleCatalogueResponse(BaseModel):
 class MessageCreate(BaseModel):
     """Schema for creating message"""
     content: str = Field(..., min_length=1, max_length=10000)
-    attachment_ids: List[int] = []
+    attachment_ids: List[int] = Field(default_factory=list)
     reply_to_id: Optional[int] = None  # ID of message being replied to
 
 
@@ -109,8 +108,7 @@ class MessageResponse(BaseModel):
     has_attachments: bool = False
     attachment_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FileUploadResponse(BaseModel):
@@ -119,7 +117,6 @@ class FileUploadResponse(BaseModel):
     storage_path: str
     mime_type: str
     size_bytes: int
-    size_mb: float
     created_at: datetime
     
     # File type flags
@@ -127,9 +124,13 @@ class FileUploadResponse(BaseModel):
     is_video: bool = False
     is_audio: bool = False
     is_document: bool = False
-    
-    class Config:
-        from_attributes = True
+
+    @computed_field
+    @property
+    def size_mb(self) -> float:
+        return self.size_bytes / (1024 * 1024)
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AIResponseRequest(BaseModel):
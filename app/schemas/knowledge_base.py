@@ -2,9 +2,11 @@
 Pydantic schemas for Knowledge Base module
 Handles validation for prompts, documents, FAQs, and search
 """
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Literal, Optional, List, Tuple
 from datetime import datetime
+from app.core.config import settings
+from app.schemas._common import normalize_tags
 
 
 # ============== Category Schemas ==============
@@ -48,8 +50,38 @@ class KBCategoryResponse(KBCategoryBase):
     document_count: int = 0
     faq_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+
+# ============== Shared Item Response Fields ==============
+
+class KBItemResponseBase(BaseModel):
+    """Category, lounge and author fields common to prompt, document and FAQ responses"""
+    created_at: datetime
+    updated_at: datetime
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+    lounge_id: Optional[int] = None
+    lounge_name: Optional[str] = None
+    lounge_image: Optional[str] = None  # Lounge profile image URL
+    mentor_name: Optional[str] = None  # Mentor who owns the lounge
+    mentor_image: Optional[str] = None  # Mentor profile image URL
+    created_by_name: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, **fields):
+        """
+        Build from values read straight off ORM rows, skipping validation.
+
+        The columns already have the declared types, so `model_construct`
+        only sets attributes. With `VALIDATE_TRUSTED_RESPONSES` on, this
+        validates like the normal constructor.
+        """
+        if settings.VALIDATE_TRUSTED_RESPONSES:
+            return cls(**fields)
+        return cls.model_construct(**fields)
 
 
 # ============== Prompt Schemas ==============
@@ -82,7 +114,7 @@ class KBPromptBase(BaseModel):
         if v is not None:
             if len(v) > 20:
                 raise ValueError('Maximum 20 tags allowed')
-            return [tag.lower().strip() for tag in v if tag.strip()]
+            return normalize_tags(v)
         return v
 
 
@@ -105,30 +137,17 @@ class KBPromptUpdate(BaseModel):
     lounge_id: Optional[int] = None
 
 
-class KBPromptResponse(BaseModel):
+class KBPromptResponse(KBItemResponseBase):
     """Schema for KB prompt response"""
     id: int
     title: str
     content: str
     description: Optional[str] = None
-    tags: Optional[List[str]] = None
+    tags: Tuple[str, ...] = ()
     is_active: bool
     is_included_in_rag: bool
     usage_count: int
     has_embedding: bool = False
-    created_at: datetime
-    updated_at: datetime
-    category_id: Optional[int] = None
-    category_name: Optional[str] = None
-    lounge_id: Optional[int] = None
-    lounge_name: Optional[str] = None
-    lounge_image: Optional[str] = None  # Lounge profile image URL
-    mentor_name: Optional[str] = None  # Mentor who owns the lounge
-    mentor_image: Optional[str] = None  # Mentor profile image URL
-    created_by_name: Optional[str] = None
-
-    class Config:
-        from_attributes = True
 
 
 class PaginatedPromptsResponse(BaseModel):
@@ -140,6 +159,7 @@ class PaginatedPromptsResponse(BaseModel):
     pages: int
 
 
+
 # ============== Document Schemas ==============
 
 class KBDocumentBase(BaseModel):
@@ -167,7 +187,7 @@ class KBDocumentUpdate(BaseModel):
     lounge_id: Optional[int] = None
 
 
-class KBDocumentResponse(BaseModel):
+class KBDocumentResponse(KBItemResponseBase):
     """Schema for KB document response"""
     id: int
     title: str
@@ -175,31 +195,18 @@ class KBDocumentResponse(BaseModel):
     original_filename: str
     file_type: str
     file_size_bytes: int
-    tags: Optional[List[str]] = None
+    tags: Tuple[str, ...] = ()
     is_active: bool
     is_processed: bool
     processing_error: Optional[str] = None
     summary: Optional[str] = None
     has_embedding: bool = False
     chunk_count: int = 0
-    created_at: datetime
-    updated_at: datetime
-    category_id: Optional[int] = None
-    category_name: Optional[str] = None
-    lounge_id: Optional[int] = None
-    lounge_name: Optional[str] = None
-    lounge_image: Optional[str] = None  # Lounge profile image URL
-    mentor_name: Optional[str] = None  # Mentor who owns the lounge
-    mentor_image: Optional[str] = None  # Mentor profile image URL
-    created_by_name: Optional[str] = None
     download_url: Optional[str] = None
     # Set on upload — the background processing job. The FE polls
     # /knowledge-base/jobs/{id} for progress while is_processed is False.
     job_id: Optional[int] = None
 
-    class Config:
-        from_attributes = True
-
 
 class PaginatedDocumentsResponse(BaseModel):
     """Paginated response for documents list"""
@@ -210,6 +217,7 @@ class PaginatedDocumentsResponse(BaseModel):
     pages: int
 
 
+
 # ============== FAQ Schemas ==============
 
 class KBFaqBase(BaseModel):
@@ -241,12 +249,12 @@ class KBFaqUpdate(BaseModel):
     lounge_id: Optional[int] = None
 
 
-class KBFaqResponse(BaseModel):
+class KBFaqResponse(KBItemResponseBase):
     """Schema for KB FAQ response"""
     id: int
     question: str
     answer: str
-    tags: Optional[List[str]] = None
+    tags: Tuple[str, ...] = ()
     sort_order: int
     is_active: bool
     is_included_in_rag: bool
@@ -254,19 +262,6 @@ class KBFaqResponse(BaseModel):
     helpful_count: int
     not_helpful_count: int
     has_embedding: bool = False
-    created_at: datetime
-    updated_at: datetime
-    category_id: Optional[int] = None
-    category_name: Optional[str] = None
-    lounge_id: Optional[int] = None
-    lounge_name: Optional[str] = None
-    lounge_image: Optional[str] = None  # Lounge profile image URL
-    mentor_name: Optional[str] = None  # Mentor who owns the lounge
-    mentor_image: Optional[str] = None  # Mentor profile image URL
-    created_by_name: Optional[str] = None
-
-    class Config:
-        from_attributes = True
 
 
 class PaginatedFaqsResponse(BaseModel):
@@ -278,38 +273,37 @@ class PaginatedFaqsResponse(BaseModel):
     pages: int
 
 
+
 # ============== Search Schemas ==============
 
+# Collection names a search can be limited to
+KBEntityType = Literal['prompts', 'documents', 'faqs']
+# Kind of a single search hit / RAG source (singular, as the service emits it)
+KBResultType = Literal['prompt', 'document', 'faq']
+
+
 class KBSearchRequest(BaseModel):
     """Schema for KB search request"""
     query: str = Field(..., min_length=1)
-    entity_types: Optional[List[str]] = None  # ["prompts", "documents", "faqs"]
+    entity_types: Optional[List[KBEntityType]] = None
     category_ids: Optional[List[int]] = None
     lounge_id: Optional[int] = None  # Filter by lounge (NULL = include global only)
     include_global: bool = True  # Include global KB items when lounge_id is set
     limit: int = Field(10, ge=1, le=50)
     use_semantic: bool = True
 
-    @field_validator('entity_types')
-    @classmethod
-    def validate_entity_types(cls, v):
-        if v is not None:
-            allowed = {'prompts', 'documents', 'faqs'}
-            for t in v:
-                if t not in allowed:
-                    raise ValueError(f"Invalid entity type: {t}. Allowed: {allowed}")
-        return v
-
 
 class KBSearchResultItem(BaseModel):
     """Schema for a single search result item"""
-    entity_type: str
+    entity_type: KBResultType
     entity_id: int
     title: str
     content_preview: str
     similarity_score: float
     category_name: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class KBSearchResponse(BaseModel):
     """Schema for KB search response"""
@@ -331,10 +325,12 @@ class KBRAGContextRequest(BaseModel):
 
 class KBRAGContextSource(BaseModel):
     """Schema for RAG context source"""
-    type: str
+    type: KBResultType
     id: int
     title: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class KBRAGContextResponse(BaseModel):
     """Schema for RAG context response"""
@@ -1,10 +1,11 @@
 """
 Pydantic schemas for lounge management
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict, ValidationInfo
 from typing import Optional, List
 from datetime import datetime
 from app.db.models.lounge import AccessType, MembershipRole
+from app.schemas._common import HEX_COLOR_RE, SLUG_RE
 
 
 class LoungeCreate(BaseModel):
@@ -18,24 +19,27 @@ class LoungeCreate(BaseModel):
     max_members: Optional[int] = Field(None, ge=1, le=10000)
     is_public_listing: bool = True
     about: Optional[str] = None  # JSON array of bullet points
-    brand_color: Optional[str] = Field(None, max_length=7)  # Hex color code
+    brand_color: Optional[str] = None  # Hex color code
 
-    @validator('slug')
+    @field_validator('slug')
+    @classmethod
     def validate_slug(cls, v):
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not SLUG_RE.match(v):
             raise ValueError('Slug must contain only letters, numbers, hyphens, and underscores')
         return v.lower()
 
-    @validator('plan_id')
-    def validate_plan(cls, v, values):
-        if values.get('access_type') == AccessType.PAID and not v:
+    @field_validator('plan_id')
+    @classmethod
+    def validate_plan(cls, v, info: ValidationInfo):
+        if info.data.get('access_type') == AccessType.PAID and not v:
             raise ValueError('plan_id is required for paid lounges')
         return v
 
-    @validator('brand_color')
+    @field_validator('brand_color')
+    @classmethod
     def validate_brand_color(cls, v):
-        if v and not v.startswith('#'):
-            raise ValueError('Brand color must be a valid hex color code starting with #')
+        if v and not HEX_COLOR_RE.match(v):
+            raise ValueError('Brand color must be a hex color code like #1A2B3C')
         return v
 
 
@@ -49,12 +53,13 @@ class LoungeUpdate(BaseModel):
     max_members: Optional[int] = Field(None, ge=1, le=10000)
     is_public_listing: Optional[bool] = None
     about: Optional[str] = None  # JSON array of bullet points
-    brand_color: Optional[str] = Field(None, max_length=7)  # Hex color code
+    brand_color: Optional[str] = None  # Hex color code
 
-    @validator('brand_color')
+    @field_validator('brand_color')
+    @classmethod
     def validate_brand_color(cls, v):
-        if v and not v.startswith('#'):
-            raise ValueError('Brand color must be a valid hex color code starting with #')
+        if v and not HEX_COLOR_RE.match(v):
+            raise ValueError('Brand color must be a hex color code like #1A2B3C')
         return v
 
 
@@ -92,8 +97,7 @@ class LoungeResponse(BaseModel):
     is_full: bool = False
     is_member: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class LoungeListResponse(BaseModel):
@@ -116,8 +120,7 @@ class LoungeListResponse(BaseModel):
     member_count: int = 0
     is_full: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class LoungeMemberResponse(BaseModel):
@@ -134,8 +137,7 @@ class LoungeMemberResponse(BaseModel):
     user_avatar: Optional[str]
     user_email: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class JoinLoungeRequest(BaseModel):
@@ -1,9 +1,10 @@
 """
 Pydantic schemas for lounge resources
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
 from datetime import datetime
+from app.schemas._common import paginated_json
 
 
 class LoungeResourceCreate(BaseModel):
@@ -33,8 +34,7 @@ class LoungeResourceResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class LoungeResourceListResponse(BaseModel):
@@ -49,8 +49,7 @@ class LoungeResourceListResponse(BaseModel):
     file_name: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class LoungeResourcesListResponse(BaseModel):
@@ -60,3 +59,14 @@ class LoungeResourcesListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+
+
+def resources_page_json(
+    items: List[LoungeResourceListResponse], *, total: int, page: int, page_size: int
+) -> bytes:
+    """JSON body with the shape of `LoungeResourcesListResponse`, items dumped in one call"""
+    return paginated_json(
+        LoungeResourceListResponse, items,
+        total=total, page=page, limit=page_size,
+        items_key="resources", limit_key="page_size", pages_key="total_pages",
+    )
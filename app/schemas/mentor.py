@@ -1,10 +1,11 @@
 """
 Pydantic schemas for mentor management
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from app.db.models.mentor import MentorStatus
+from app.schemas._common import SLUG_RE
 
 
 class MentorApplication(BaseModel):
@@ -14,7 +15,8 @@ class MentorApplication(BaseModel):
     intro_video_url: Optional[str] = None
     experience_years: int = Field(..., ge=0, le=100)
     
-    @validator('intro_video_url')
+    @field_validator('intro_video_url')
+    @classmethod
     def validate_video_url(cls, v):
         if v and not (v.startswith('http://') or v.startswith('https://')):
             raise ValueError('Video URL must be a valid HTTP(S) URL')
@@ -50,8 +52,7 @@ class MentorResponse(BaseModel):
     total_lounges: int = 0
     total_members: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class MentorListResponse(BaseModel):
@@ -65,8 +66,7 @@ class MentorListResponse(BaseModel):
     user_avatar: Optional[str]
     total_lounges: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class MentorApproval(BaseModel):
@@ -81,8 +81,7 @@ class CategoryResponse(BaseModel):
     name: str
     slug: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class CategoryCreate(BaseModel):
@@ -90,9 +89,10 @@ class CategoryCreate(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
     slug: str = Field(..., min_length=2, max_length=255)
 
-    @validator('slug')
+    @field_validator('slug')
+    @classmethod
     def validate_slug(cls, v):
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not SLUG_RE.match(v):
             raise ValueError('Slug must contain only letters, numbers, hyphens, and underscores')
         return v.lower()
 
@@ -102,8 +102,9 @@ class CategoryUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=255)
     slug: Optional[str] = Field(None, min_length=2, max_length=255)
 
-    @validator('slug')
+    @field_validator('slug')
+    @classmethod
     def validate_slug(cls, v):
-        if v is not None and not v.replace('-', '').replace('_', '').isalnum():
+        if v is not None and not SLUG_RE.match(v):
             raise ValueError('Slug must contain only letters, numbers, hyphens, and underscores')
         return v.lower() if v else v
@@ -1,9 +1,11 @@
 """
 Pydantic schemas for notes and time capsules
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Optional, List, Tuple
 from datetime import datetime, timezone
+from app.db.models.note import CapsuleStatus
+from app.schemas._common import normalize_tags
 
 
 class NoteCreate(BaseModel):
@@ -14,13 +16,14 @@ class NoteCreate(BaseModel):
     content: str = Field(..., min_length=1, max_length=50000)
     is_pinned: bool = False
     is_included_in_rag: bool = True
-    tags: List[str] = []
+    tags: List[str] = Field(default_factory=list)
 
-    @validator('tags')
+    @field_validator('tags')
+    @classmethod
     def validate_tags(cls, v):
         if len(v) > 20:
             raise ValueError('Maximum 20 tags allowed')
-        return [tag.lower().strip() for tag in v if tag.strip()]
+        return normalize_tags(v)
 
 
 class NoteUpdate(BaseModel):
@@ -43,15 +46,14 @@ class NoteResponse(BaseModel):
     content: str
     is_pinned: bool
     is_included_in_rag: bool
-    tags: List[str]
+    tags: Tuple[str, ...] = ()
     created_at: datetime
     updated_at: datetime
 
     # Computed fields
     word_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class NoteListResponse(BaseModel):
@@ -63,7 +65,7 @@ class NoteListResponse(BaseModel):
     title: str
     is_pinned: bool
     is_included_in_rag: bool
-    tags: List[str]
+    tags: Tuple[str, ...] = ()
     created_at: datetime
     updated_at: datetime
 
@@ -71,8 +73,7 @@ class NoteListResponse(BaseModel):
     content_preview: str = ""
     word_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TimeCapsuleCreate(BaseModel):
@@ -82,7 +83,8 @@ class TimeCapsuleCreate(BaseModel):
     content: str = Field(..., min_length=1, max_length=10000)
     unlock_at: datetime
 
-    @validator('unlock_at')
+    @field_validator('unlock_at')
+    @classmethod
     def validate_unlock_date(cls, v):
         # Make comparison timezone-aware
         now = datetime.now(timezone.utc)
@@ -110,7 +112,7 @@ class TimeCapsuleResponse(BaseModel):
     title: str
     content: Optional[str]  # Only shown if unlocked
     unlock_at: datetime
-    status: str
+    status: CapsuleStatus
     created_at: datetime
     updated_at: datetime
 
@@ -119,8 +121,7 @@ class TimeCapsuleResponse(BaseModel):
     days_until_unlock: Optional[int] = None
     can_view_content: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NoteSearchRequest(BaseModel):
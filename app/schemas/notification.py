@@ -1,9 +1,11 @@
 """
 Pydantic schemas for notifications and CMS
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Any, Optional, List, Dict
 from datetime import datetime
+from app.db.models.misc import NotificationChannel
+from app.schemas._common import SLUG_RE
 
 
 class NotificationResponse(BaseModel):
@@ -11,7 +13,7 @@ class NotificationResponse(BaseModel):
     id: int
     user_id: int
     type: str
-    data: Dict
+    data: Dict[str, Any]
     channel: str
     status: str
     sent_at: Optional[datetime]
@@ -22,15 +24,14 @@ class NotificationResponse(BaseModel):
     is_read: bool = False
     is_sent: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NotificationCreate(BaseModel):
     """Schema for creating notification"""
     type: str = Field(..., min_length=1, max_length=100)
-    data: Dict = {}
-    channel: str = "in_app"
+    data: Dict[str, Any] = Field(default_factory=dict)
+    channel: NotificationChannel = NotificationChannel.IN_APP
 
 
 class MarkAsReadRequest(BaseModel):
@@ -47,8 +48,7 @@ class StaticPageResponse(BaseModel):
     is_published: bool
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StaticPageCreate(BaseModel):
@@ -58,9 +58,10 @@ class StaticPageCreate(BaseModel):
     content: str = Field(..., min_length=1)
     is_published: bool = True
     
-    @validator('slug')
+    @field_validator('slug')
+    @classmethod
     def validate_slug(cls, v):
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not SLUG_RE.match(v):
             raise ValueError('Slug must contain only letters, numbers, hyphens, and underscores')
         return v.lower()
 
@@ -80,8 +81,7 @@ class FAQResponse(BaseModel):
     answer: str
     sort_order: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FAQCreate(BaseModel):
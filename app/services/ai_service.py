@@ -19,16 +19,20 @@ Operators must additionally confirm in the provider consoles:
   - OpenAI: data sharing disabled + ZDR enabled if available
   - Anthropic: Zero Data Retention enabled for the workspace
 """
-from typing import List, Dict, Optional, Tuple, AsyncGenerator
+from typing import List, Dict, Optional, Tuple, AsyncGenerator, Union
 import hashlib
 import hmac
+import asyncio
 import logging
 import json
+import threading
+from collections import OrderedDict
 from openai import AsyncOpenAI
 import numpy as np
 from anthropic import AsyncAnthropic
 
 from app.core.config import settings
+from app.services.rag_cache import EmbeddingMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +53,56 @@ def _safe_user_id(user_uuid: Optional[str]) -> Optional[str]:
     return f"prompterly:{digest[:32]}"
 
 
+class EmbeddingCache:
+    """
+    Bounded LRU of embeddings keyed by SHA-256 of (model, text)
+
+    Identical text is embedded again surprisingly often: a prompt re-saved
+    without edits, a re-processed document, the same chatbot system prompt,
+    a repeated search. A hit skips the OpenAI round-trip entirely. Vectors
+    are held as float32 arrays (6KB for 1536 dims) and handed out as fresh
+    lists so callers can't mutate the cached copy.
+    """
+
+    MAX_ENTRIES = 2048
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                return None
+            self._entries.move_to_end(key)
+        return vector.tolist()
+
+    def put(self, key: bytes, embedding: List[float]) -> None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class AIService:
     """AI Service for chat completions and embeddings. Claude is the default provider."""
 
+    # Per-request limits of the embeddings endpoint: input count, and total
+    # tokens (300k) estimated conservatively from characters
+    EMBEDDING_BATCH_MAX_INPUTS = 2048
+    EMBEDDING_BATCH_MAX_TOKENS = 250_000
+    CHARS_PER_TOKEN_ESTIMATE = 3
+    # Batch embedding requests allowed in flight at once, across all callers
+    EMBEDDING_CONCURRENCY = 5
+
     def __init__(self):
         """Initialize AI clients — Claude primary, OpenAI for embeddings"""
         self._assert_data_posture()
@@ -71,6 +122,9 @@ class AIService:
             organization=settings.OPENAI_ORG_ID,
         )
 
+        self.embedding_cache = EmbeddingCache()
+        self._embedding_requests = asyncio.Semaphore(self.EMBEDDING_CONCURRENCY)
+
     @staticmethod
     def _assert_data_posture() -> None:
         """Refuse to start in production without the no-training posture set."""
@@ -327,13 +381,20 @@ class AIService:
         try:
             if not model:
                 model = settings.OPENAI_EMBEDDING_MODEL
+
+            key = self.embedding_cache.key(model, text)
+            cached = self.embedding_cache.get(key)
+            if cached is not None:
+                return cached
             
             response = await self.openai_client.embeddings.create(
                 model=model,
                 input=text
             )
             
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            self.embedding_cache.put(key, embedding)
+            return embedding
         
         except Exception as e:
             logger.error(f"Error creating embedding: {str(e)}")
@@ -357,35 +418,80 @@ class AIService:
         try:
             if not model:
                 model = settings.OPENAI_EMBEDDING_MODEL
+
+            keys = [self.embedding_cache.key(model, text) for text in texts]
+            embeddings = [self.embedding_cache.get(key) for key in keys]
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if not missing:
+                return embeddings
             
-            response = await self.openai_client.embeddings.create(
-                model=model,
-                input=texts
-            )
-            
-            return [item.embedding for item in response.data]
+            groups = self._group_for_requests(texts, missing)
+            results = await asyncio.gather(*(
+                self._embed_group([texts[i] for i in group], model) for group in groups
+            ))
+
+            for group, group_embeddings in zip(groups, results):
+                for i, embedding in zip(group, group_embeddings):
+                    embeddings[i] = embedding
+                    self.embedding_cache.put(keys[i], embedding)
+            return embeddings
         
         except Exception as e:
             logger.error(f"Error creating embeddings batch: {str(e)}")
             raise
     
+    def _group_for_requests(self, texts: List[str], indices: List[int]) -> List[List[int]]:
+        """
+        Split `indices` into request-sized groups, in order, so that no
+        group exceeds the endpoint's input-count or total-token limit.
+        """
+        groups: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i in indices:
+            tokens = len(texts[i]) // self.CHARS_PER_TOKEN_ESTIMATE + 1
+            if current and (
+                len(current) >= self.EMBEDDING_BATCH_MAX_INPUTS
+                or current_tokens + tokens > self.EMBEDDING_BATCH_MAX_TOKENS
+            ):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _embed_group(self, texts: List[str], model: str) -> List[List[float]]:
+        """
+        One embeddings request, bounded by `EMBEDDING_CONCURRENCY`.
+
+        Rate-limit (429) retries with exponential backoff happen inside the
+        OpenAI client, per request, so a throttled group doesn't hold up
+        the others.
+        """
+        async with self._embedding_requests:
+            response = await self.openai_client.embeddings.create(model=model, input=texts)
+        return [item.embedding for item in response.data]
+
     def cosine_similarity(
         self,
-        embedding1: List[float],
-        embedding2: List[float]
+        embedding1: Union[List[float], np.ndarray],
+        embedding2: Union[List[float], np.ndarray]
     ) -> float:
         """
         Calculate cosine similarity between two embeddings
         
         Args:
-            embedding1: First embedding
+            embedding1: First embedding (list, or ndarray as read from a
+                `Vector` column — float32 arrays are used without a copy)
             embedding2: Second embedding
             
         Returns:
             Similarity score (0-1)
         """
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
         
         dot_product = np.dot(vec1, vec2)
         norm1 = np.linalg.norm(vec1)
@@ -413,16 +519,10 @@ class AIService:
         Returns:
             List of (id, similarity_score) tuples, sorted by similarity
         """
-        similarities = []
-        
-        for item_id, embedding in candidate_embeddings:
-            similarity = self.cosine_similarity(query_embedding, embedding)
-            similarities.append((item_id, similarity))
-        
-        # Sort by similarity score (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        return similarities[:top_k]
+        # One normalised (N, D) matrix and a single matrix-vector product
+        # instead of a cosine_similarity call per candidate
+        matrix = EmbeddingMatrix.from_rows(candidate_embeddings)
+        return matrix.top_k(query_embedding, top_k)
     
     async def summarize_text(
         self,
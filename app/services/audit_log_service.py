@@ -6,19 +6,32 @@ sink is intentionally separate from the application log file so the two
 have independent retention (audit_logs: 12 months, system logs: 60 days)
 and can be queried independently for compliance evidence.
 
-Callers should NEVER block on this. We open a fresh session per write so a
-caller's transaction rollback doesn't lose the audit entry, and we swallow
-exceptions so an audit-write failure does not break the user-facing flow.
-The exception is logged via the standard logger so it's still investigable.
+Callers should NEVER block on this. Entries without an explicit session are
+written independently of the caller's transaction, so a rollback doesn't
+lose them, and we swallow exceptions so an audit-write failure does not
+break the user-facing flow. The exception is logged via the standard logger
+so it's still investigable.
+
+While the API is running, those independent entries go through
+`audit_log_writer`: they are queued in memory and inserted in batches (one
+executemany INSERT every second, or as soon as 1000 are pending) by a
+background task started in the app lifespan. Outside the API (workers,
+scripts) or before the writer is started, each entry is committed
+immediately in its own session as before.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from fastapi import Request
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
+from app.core.timezone import now_naive
 from app.db.models.misc import AuditLog
 from app.db.models.user import User
 from app.db.session import SessionLocal
@@ -80,6 +93,181 @@ def _extract_request_context(request: Optional[Request]) -> dict:
     }
 
 
+class AuditLogWriter:
+    """
+    Buffers audit rows and inserts them in batches from a background task.
+
+    `enqueue` is safe to call from the event loop and from the threadpool
+    that runs sync endpoints. The batch INSERT itself runs in a worker
+    thread so the event loop never waits on MySQL.
+
+    When an INSERT fails and the database doesn't answer a probe either,
+    the rows go back to the head of the queue for the next flush (up to
+    `MAX_PENDING` rows are held). Otherwise the batch is retried one row at
+    a time, so one bad row costs only itself; rows that still fail are
+    logged and dropped.
+    """
+
+    FLUSH_INTERVAL_SECONDS = 1.0
+    MAX_BATCH = 1000
+    # Rows held while the database is unreachable before the newest are dropped
+    MAX_PENDING = 100 * MAX_BATCH
+
+    def __init__(self):
+        self._pending: Deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, row: dict) -> None:
+        """Queue one row of `AuditLog` attribute values"""
+        with self._lock:
+            self._pending.append(row)
+            full = len(self._pending) >= self.MAX_BATCH
+        if full and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def flush(self) -> int:
+        """Insert everything queued so far; returns the number of rows written"""
+        written = 0
+        while True:
+            with self._lock:
+                batch: List[dict] = [
+                    self._pending.popleft()
+                    for _ in range(min(len(self._pending), self.MAX_BATCH))
+                ]
+            if not batch:
+                return written
+
+            try:
+                self._insert(batch)
+                written += len(batch)
+            except Exception as exc:
+                if not self._database_reachable():
+                    self._requeue(batch, exc)
+                    return written
+                logger.warning(
+                    "Batch insert of %d audit log entries failed, retrying one by one: %s",
+                    len(batch), exc,
+                )
+                inserted, requeued = self._insert_each(batch)
+                written += inserted
+                if requeued:
+                    return written
+
+    def _insert(self, rows: List[dict]) -> None:
+        """INSERT `rows` in one transaction of a fresh session; raises on failure"""
+        session: Session = SessionLocal()
+        try:
+            session.execute(insert(AuditLog), rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _insert_each(self, batch: List[dict]) -> Tuple[int, bool]:
+        """
+        Insert `batch` row by row, dropping (and logging) rows that fail.
+
+        Returns the number of rows written and whether the rest of the batch
+        was re-queued because the database became unreachable.
+        """
+        written = 0
+        dropped = []
+        requeued = False
+        for position, row in enumerate(batch):
+            try:
+                self._insert([row])
+                written += 1
+            except Exception as exc:
+                if not self._database_reachable():
+                    self._requeue(batch[position:], exc)
+                    requeued = True
+                    break
+                dropped.append(row)
+                logger.error(
+                    "Failed to write audit log entry action=%s entity=%s/%s: %s",
+                    row["action"], row["entity_type"], row["entity_id"], exc,
+                    exc_info=True,
+                )
+
+        if dropped:
+            logger.error(
+                "Dropped %d of %d audit log entries (actions=%s)",
+                len(dropped), len(batch), sorted({row["action"] for row in dropped}),
+            )
+        return written, requeued
+
+    @staticmethod
+    def _database_reachable() -> bool:
+        """Whether a trivial query succeeds, i.e. a failed INSERT was about its rows"""
+        try:
+            with SessionLocal() as session:
+                session.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    def _requeue(self, rows: List[dict], exc: Exception) -> None:
+        """Put `rows` back at the head of the queue for the next flush"""
+        with self._lock:
+            self._pending.extendleft(reversed(rows))
+            overflow = max(0, len(self._pending) - self.MAX_PENDING)
+            dropped = [self._pending.pop() for _ in range(overflow)]
+        logger.error(
+            "Audit log database unreachable, %d entries re-queued: %s", len(rows), exc
+        )
+        if dropped:
+            logger.error(
+                "Audit log queue full: dropped %d newest entries (actions=%s)",
+                len(dropped), sorted({row["action"] for row in dropped}),
+            )
+
+    async def start(self) -> None:
+        """Start the periodic flush task on the running event loop"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+        await asyncio.to_thread(self.flush)
+        with self._lock:
+            unwritten = len(self._pending)
+        if unwritten:
+            logger.error("Shutting down with %d audit log entries unwritten", unwritten)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await asyncio.to_thread(self.flush)
+
+
+# Singleton instance
+audit_log_writer = AuditLogWriter()
+
+
 def record(
     action: str,
     *,
@@ -101,25 +289,32 @@ def record(
         changes: JSON-serialisable dict of {field: {"old": ..., "new": ...}}.
         audit_metadata: Free-form context (avoid raw PII; use user_uuid).
         request: FastAPI Request — captures IP and user agent if provided.
-        db: Optional existing session. When omitted, opens a fresh session
-            so the audit row commits independently of the caller's tx.
+        db: Optional existing session. When omitted, the row is written
+            independently of the caller's tx (batched by `audit_log_writer`
+            when it is running, otherwise in a fresh session).
     """
     ctx = _extract_request_context(request)
+    row = {
+        "user_id": actor.id if actor else None,
+        "user_uuid": actor.user_uuid if actor else None,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "ip_address": ctx.get("ip_address"),
+        "user_agent": ctx.get("user_agent"),
+        "changes": changes,
+        "audit_metadata": audit_metadata,
+        # Stamped now, not when the batch is flushed
+        "created_at": now_naive(),
+    }
+    if db is None and audit_log_writer.running:
+        audit_log_writer.enqueue(row)
+        return
+
     own_session = db is None
     session: Session = db or SessionLocal()
     try:
-        entry = AuditLog(
-            user_id=actor.id if actor else None,
-            user_uuid=actor.user_uuid if actor else None,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            ip_address=ctx.get("ip_address"),
-            user_agent=ctx.get("user_agent"),
-            changes=changes,
-            audit_metadata=audit_metadata,
-        )
-        session.add(entry)
+        session.add(AuditLog(**row))
         if own_session:
             session.commit()
         else:
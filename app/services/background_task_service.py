@@ -4,56 +4,44 @@ Background Task Service for handling async jobs like embedding generation
 import asyncio
 import logging
 import re
-from html.parser import HTMLParser
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from app.core.timezone import now_naive
 from sqlalchemy.orm import Session
+import lxml.html
+from lxml import etree
 
 from app.db.models.background_job import BackgroundJob, JobStatus, JobType
-from app.db.models.knowledge_base import KBPrompt, KBDocument, KBDocumentChunk, KBFaq
+from app.db.models.knowledge_base import (
+    KBPrompt, KBDocument, KBDocumentChunk, KBDocumentChunkEmbedding, KBFaq
+)
 from app.services.ai_service import ai_service
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class HTMLTextExtractor(HTMLParser):
-    """Extract plain text from HTML content"""
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self.skip_data = False
-
-    def handle_starttag(self, tag, attrs):
-        # Add line breaks for block elements
-        if tag in ['p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr']:
-            self.text_parts.append('\n')
-        # Skip script and style content
-        if tag in ['script', 'style']:
-            self.skip_data = True
-
-    def handle_endtag(self, tag):
-        if tag in ['script', 'style']:
-            self.skip_data = False
-        # Add extra line break after headings and paragraphs
-        if tag in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            self.text_parts.append('\n')
-
-    def handle_data(self, data):
-        if not self.skip_data:
-            self.text_parts.append(data)
-
-    def get_text(self):
-        text = ''.join(self.text_parts)
-        # Clean up multiple newlines and spaces
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        return text.strip()
+# Block elements that start on a new line, and those also followed by one
+_BLOCK_TAGS = ('p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr')
+_SPACED_BLOCK_TAGS = frozenset(('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# lxml.html's own test for a whole document rather than a fragment
+_FULL_DOCUMENT_RE = re.compile(r'\s*<(?:html|!doctype)', re.I)
+
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SPACES_RE = re.compile(r' +')
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 def strip_html_tags(html_content: str) -> str:
-    """Strip HTML tags and return plain text"""
+    """
+    Strip HTML tags and return plain text
+
+    Matches the old `html.parser` extractor, except that a `<p>` or heading
+    closed implicitly (`<p>a<p>b`) is now followed by a blank line as if it
+    had an end tag.
+    """
     if not html_content:
         return ""
 
@@ -62,14 +50,27 @@ def strip_html_tags(html_content: str) -> str:
         return html_content
 
     try:
-        parser = HTMLTextExtractor()
-        parser.feed(html_content)
-        return parser.get_text()
+        # lxml's C parser; the old html.parser version ran a Python callback per tag
+        if _FULL_DOCUMENT_RE.match(html_content):
+            # Parsed as a fragment, a document would lose its <head> and title
+            root = lxml.html.document_fromstring(html_content)
+        else:
+            root = lxml.html.fragment_fromstring(html_content, create_parent='div')
+        etree.strip_elements(root, 'script', 'style', with_tail=False)
+        for element in root.iter(*_BLOCK_TAGS):
+            element.text = '\n' + (element.text or '')
+            if element.tag in _SPACED_BLOCK_TAGS:
+                element.tail = '\n' + (element.tail or '')
+        text = root.text_content()
+        # Clean up multiple newlines and spaces
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        text = _SPACES_RE.sub(' ', text)
+        return text.strip()
     except Exception as e:
         logger.warning(f"Error parsing HTML, falling back to regex: {e}")
         # Fallback to simple regex stripping
-        text = re.sub(r'<[^>]+>', ' ', html_content)
-        text = re.sub(r'\s+', ' ', text)
+        text = _TAG_RE.sub(' ', html_content)
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()
 
 # Store for active background tasks
@@ -79,6 +80,10 @@ _active_tasks: Dict[int, asyncio.Task] = {}
 class BackgroundTaskService:
     """Service for managing background tasks"""
 
+    # Chunks per embeddings request; matches KnowledgeBaseService so both
+    # document pipelines stay well under the API's per-request input limit
+    EMBEDDING_BATCH_SIZE = 100
+
     def create_job(
         self,
         db: Session,
@@ -237,26 +242,40 @@ class BackgroundTaskService:
                 KBDocumentChunk.document_id == document_id
             ).all()
 
-            total_steps = len(chunks) + 2  # chunks + document summary + final
+            batch_size = self.EMBEDDING_BATCH_SIZE
+            batch_count = (len(chunks) + batch_size - 1) // batch_size
+            total_steps = batch_count + 2  # chunk batches + document summary + final
             job.total_steps = total_steps
 
-            # Process each chunk
-            for i, chunk in enumerate(chunks):
-                job.update_progress(i + 1, total_steps, f"Processing chunk {i + 1}/{len(chunks)}...")
+            # One embeddings request per batch of chunks
+            for i, start in enumerate(range(0, len(chunks), batch_size)):
+                batch = chunks[start:start + batch_size]
+                job.update_progress(
+                    i + 1, total_steps,
+                    f"Processing chunks {start + 1}-{start + len(batch)}/{len(chunks)}..."
+                )
                 db.commit()
 
                 try:
-                    embedding = await ai_service.create_embedding(chunk.content)
-                    chunk.embedding = embedding
-                    chunk.embedding_model = settings.OPENAI_EMBEDDING_MODEL
+                    embeddings = await ai_service.create_embeddings_batch(
+                        [chunk.content for chunk in batch]
+                    )
+                    for chunk, embedding in zip(batch, embeddings):
+                        db.merge(KBDocumentChunkEmbedding(
+                            chunk_id=chunk.id,
+                            embedding=embedding,
+                            embedding_model=settings.OPENAI_EMBEDDING_MODEL
+                        ))
                     db.commit()
                 except Exception as e:
-                    logger.error(f"Error processing chunk {chunk.id}: {e}")
-
-                await asyncio.sleep(0.05)  # Rate limiting
+                    db.rollback()
+                    logger.error(
+                        f"Error processing chunks {batch[0].id}-{batch[-1].id} "
+                        f"of document {document_id}: {e}"
+                    )
 
             # Generate document-level embedding
-            job.update_progress(len(chunks) + 1, total_steps, "Generating document summary embedding...")
+            job.update_progress(batch_count + 1, total_steps, "Generating document summary embedding...")
             db.commit()
 
             text = f"{document.title}\n"
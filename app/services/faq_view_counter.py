@@ -0,0 +1,118 @@
+"""
+Buffered FAQ view counting
+
+A FAQ counts as viewed each time it is served as RAG context in a chat
+reply. Writing `view_count + 1` per reply would cost an UPDATE (and a row
+lock on a hot FAQ) per message. Instead, views are tallied in memory and
+written in one executemany of `view_count = view_count + :views WHERE
+id = :faq_id`. The statement text is the same for every batch, so it is
+compiled once and reused from the statement cache (a `CASE id WHEN ...`
+built from each batch's ids would compile anew on every flush). A
+background task started in the app lifespan does this every few seconds.
+
+The UPDATE pins `updated_at` to its current value. Without that, the
+column's `onupdate` would bump it, and every flush would change the
+FAQ's RAG-cache version (see `app.services.rag_cache`).
+"""
+import asyncio
+import logging
+import threading
+from collections import Counter
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, update
+
+from app.db.models.knowledge_base import KBFaq
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Core statement on the table so a list of parameter sets runs as a plain
+# executemany rather than an ORM bulk update by primary key
+_faqs = KBFaq.__table__
+_INCREMENT_VIEWS = (
+    update(_faqs)
+    .where(_faqs.c.id == bindparam("faq_id"))
+    .values(
+        view_count=_faqs.c.view_count + bindparam("views"),
+        updated_at=_faqs.c.updated_at,
+    )
+)
+
+
+class FaqViewCounter:
+    """In-process tally of FAQ views, flushed periodically in one executemany"""
+
+    FLUSH_INTERVAL_SECONDS = 5.0
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def record(self, faq_ids: Iterable[int]) -> None:
+        """Count one view for each id; written at the next flush"""
+        with self._lock:
+            self._counts.update(faq_ids)
+        if self.running:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (worker, script): write through
+            self.flush()
+        else:
+            # Async caller without the flush task: keep the UPDATE off the loop
+            loop.run_in_executor(None, self.flush)
+
+    def flush(self) -> int:
+        """Write pending counts; returns the number of FAQs updated"""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if not counts:
+            return 0
+
+        session = SessionLocal()
+        try:
+            session.execute(
+                _INCREMENT_VIEWS,
+                [{"faq_id": faq_id, "views": n} for faq_id, n in counts.items()],
+            )
+            session.commit()
+            return len(counts)
+        except Exception as exc:
+            session.rollback()
+            # View counts are advisory; drop the batch rather than retry
+            logger.warning("Failed to flush %d FAQ view counts: %s", len(counts), exc)
+            return 0
+        finally:
+            session.close()
+
+    async def start(self) -> None:
+        """Start the periodic flush task on the running event loop"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+            await asyncio.to_thread(self.flush)
+
+
+# Singleton instance
+faq_view_counter = FaqViewCounter()
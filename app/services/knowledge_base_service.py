@@ -3,15 +3,18 @@ Knowledge Base service for managing prompts, documents, FAQs and RAG integration
 """
 from typing import List, Optional, Tuple, Dict, Any
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, joinedload
 from sqlalchemy import func, or_
 from fastapi import UploadFile
 
 from app.db.models.knowledge_base import (
-    KBCategory, KBPrompt, KBDocument, KBDocumentChunk, KBFaq
+    KBCategory, KBPrompt, KBDocument, KBDocumentText, KBDocumentChunk,
+    KBDocumentChunkEmbedding, KBFaq
 )
 from app.db.models.file import File
 from app.services.ai_service import ai_service
+from app.services.rag_cache import rag_embedding_cache
+from app.services.faq_view_counter import faq_view_counter
 from app.services.file_service import file_service
 from app.core.config import settings
 
@@ -309,7 +312,9 @@ class KnowledgeBaseService:
                 db.commit()
                 return
 
-            document.extracted_text = extracted_text
+            # merge() upserts by primary key, so re-processing replaces the
+            # stored body without ever loading the old one.
+            db.merge(KBDocumentText(document_id=document.id, body=extracted_text))
 
             # Generate summary
             if len(extracted_text) > 500:
@@ -476,8 +481,11 @@ class KnowledgeBaseService:
                 )
 
             for chunk, embedding in zip(batch, embeddings):
-                chunk.embedding = embedding
-                chunk.embedding_model = settings.OPENAI_EMBEDDING_MODEL
+                db.merge(KBDocumentChunkEmbedding(
+                    chunk_id=chunk.id,
+                    embedding=embedding,
+                    embedding_model=settings.OPENAI_EMBEDDING_MODEL
+                ))
 
             db.commit()
 
@@ -579,7 +587,7 @@ class KnowledgeBaseService:
         file_record = db.query(File).filter(File.id == file_id).first()
         storage_path = file_record.storage_path if file_record else None
 
-        # Delete the document first (cascades to delete chunks)
+        # Delete the document first (the database cascades to its chunks)
         db.delete(document)
         db.commit()
 
@@ -662,7 +670,8 @@ class KnowledgeBaseService:
         search: Optional[str] = None,
         is_active: Optional[bool] = None,
         lounge_id: Optional[int] = None,
-        include_global: bool = True
+        include_global: bool = True,
+        sort_by: Optional[str] = None
     ) -> Tuple[List[KBFaq], int]:
         """Get paginated FAQs with filters"""
         query = db.query(KBFaq)
@@ -693,10 +702,43 @@ class KnowledgeBaseService:
 
         total = query.count()
         skip = (page - 1) * limit
-        faqs = query.order_by(KBFaq.sort_order, KBFaq.created_at.desc()).offset(skip).limit(limit).all()
+        if sort_by == "helpfulness":
+            query = query.order_by(KBFaq.helpfulness_ratio_cached.desc(), KBFaq.id)
+        else:
+            query = query.order_by(KBFaq.sort_order, KBFaq.created_at.desc())
+        faqs = query.offset(skip).limit(limit).all()
 
         return faqs, total
 
+    async def record_faq_feedback(
+        self, db: Session, faq_id: int, helpful: bool
+    ) -> bool:
+        """
+        Record a helpful / not-helpful vote in a single atomic UPDATE.
+
+        The cached ratio is assigned first and computed from the pre-update
+        counts (+1 for this vote): MySQL evaluates single-table SET clauses
+        left to right, so listing it first gives the same result on MySQL
+        and on databases where every SET sees the old row. `updated_at` is
+        pinned so a vote doesn't invalidate the FAQ's RAG-cache entry.
+        """
+        bump = 1 if helpful else 0
+        ratio = (KBFaq.helpful_count + bump) * 1.0 / (
+            KBFaq.helpful_count + KBFaq.not_helpful_count + 1
+        )
+        counter = KBFaq.helpful_count if helpful else KBFaq.not_helpful_count
+        updated = db.query(KBFaq).filter(KBFaq.id == faq_id).update(
+            [
+                (KBFaq.helpfulness_ratio_cached, ratio),
+                (counter, counter + 1),
+                (KBFaq.updated_at, KBFaq.updated_at),
+            ],
+            synchronize_session=False,
+            update_args={"preserve_parameter_order": True},
+        )
+        db.commit()
+        return updated > 0
+
     async def get_faq(self, db: Session, faq_id: int) -> Optional[KBFaq]:
         """Get a FAQ by ID"""
         return db.query(KBFaq).filter(KBFaq.id == faq_id).first()
@@ -736,6 +778,40 @@ class KnowledgeBaseService:
 
     # ============== RAG / Search Operations ==============
 
+    # Similarity search is two-stage: every candidate is scored against its
+    # int8 `embedding_q` copy (held in-process by `rag_embedding_cache`, so
+    # the float32 column never leaves the DB), then only this many survivors
+    # have their full-precision vector loaded for the exact rerank.
+    RERANK_POOL_MIN = 50
+
+    def _rank_two_stage(
+        self, db: Session, scope: Tuple, query, id_column, q_column, embedding_column,
+        version_columns: List[Any], query_embedding: List[float], limit: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Coarse int8 recall over the cached `q_column` matrix of `query`'s
+        rows, then exact float32 rerank of the best few.
+        """
+        version = tuple(query.with_entities(*version_columns).one())
+        matrix = rag_embedding_cache.get(
+            db, scope, version,
+            lambda session: query.with_session(session).with_entities(id_column, q_column).all()
+        )
+        pool = max(limit * 4, self.RERANK_POOL_MIN)
+        coarse = matrix.top_k(query_embedding, pool)
+        if not coarse:
+            return []
+
+        # Re-apply the scope's filters: a stale matrix still being rebuilt in
+        # the background may list rows deactivated or moved since
+        exact = query.with_entities(id_column, embedding_column).filter(
+            id_column.in_([item_id for item_id, _ in coarse]),
+            embedding_column.isnot(None)
+        ).all()
+        return ai_service.find_most_similar(
+            query_embedding, [(item_id, embedding) for item_id, embedding in exact], limit
+        )
+
     async def semantic_search(
         self,
         db: Session,
@@ -782,7 +858,7 @@ class KnowledgeBaseService:
         """Search prompts by embedding similarity"""
         query = db.query(KBPrompt).filter(
             KBPrompt.is_active == True,
-            KBPrompt.embedding.isnot(None)
+            KBPrompt.embedding_q.isnot(None)
         )
         if category_ids:
             query = query.filter(KBPrompt.category_id.in_(category_ids))
@@ -798,15 +874,16 @@ class KnowledgeBaseService:
         elif not include_global:
             query = query.filter(KBPrompt.lounge_id.is_(None))
 
-        prompts = query.all()
-        logger.info(f"_search_prompts: lounge_id={lounge_id}, include_global={include_global}, found {len(prompts)} prompts")
-
-        # Calculate similarities
-        candidates = [(p.id, p.embedding) for p in prompts if p.embedding]
-        if not candidates:
-            return []
-
-        similar = ai_service.find_most_similar(query_embedding, candidates, limit)
+        similar = self._rank_two_stage(
+            db, ("prompts", lounge_id, include_global, tuple(sorted(category_ids or ()))),
+            query, KBPrompt.id, KBPrompt.embedding_q, KBPrompt.embedding,
+            [func.count(KBPrompt.id), func.max(KBPrompt.updated_at)],
+            query_embedding, limit
+        )
+        prompts = db.query(KBPrompt).options(defer(KBPrompt.embedding)).filter(
+            KBPrompt.id.in_([prompt_id for prompt_id, _ in similar])
+        ).all() if similar else []
+        logger.info(f"_search_prompts: lounge_id={lounge_id}, include_global={include_global}, matched {len(prompts)} prompts")
 
         results = []
         for prompt_id, score in similar:
@@ -829,10 +906,16 @@ class KnowledgeBaseService:
         lounge_id: Optional[int], include_global: bool, limit: int
     ) -> List[Dict[str, Any]]:
         """Search documents by embedding similarity (using chunks)"""
-        # Search through document chunks for more granular results
-        query = db.query(KBDocumentChunk).join(KBDocument).filter(
+        # Search through document chunks for more granular results. Only the
+        # narrow (chunk_id, embedding_q) rows are scanned; chunk text is
+        # loaded for the ranked hits alone.
+        query = db.query(
+            KBDocumentChunkEmbedding.chunk_id, KBDocumentChunkEmbedding.embedding_q
+        ).join(
+            KBDocumentChunk, KBDocumentChunk.id == KBDocumentChunkEmbedding.chunk_id
+        ).join(KBDocument).filter(
             KBDocument.is_active == True,
-            KBDocumentChunk.embedding.isnot(None)
+            KBDocumentChunkEmbedding.embedding_q.isnot(None)
         )
         if category_ids:
             query = query.filter(KBDocument.category_id.in_(category_ids))
@@ -848,18 +931,27 @@ class KnowledgeBaseService:
         elif not include_global:
             query = query.filter(KBDocument.lounge_id.is_(None))
 
-        chunks = query.all()
-
-        candidates = [(c.id, c.embedding) for c in chunks if c.embedding]
-        if not candidates:
-            return []
-
-        similar = ai_service.find_most_similar(query_embedding, candidates, limit)
+        similar = self._rank_two_stage(
+            db, ("documents", lounge_id, include_global, tuple(sorted(category_ids or ()))),
+            query, KBDocumentChunkEmbedding.chunk_id, KBDocumentChunkEmbedding.embedding_q,
+            KBDocumentChunkEmbedding.embedding,
+            [
+                func.count(KBDocumentChunkEmbedding.chunk_id),
+                func.max(KBDocumentChunkEmbedding.chunk_id),
+                func.max(KBDocument.updated_at),
+            ],
+            query_embedding, limit
+        )
+        chunks = {
+            c.id: c for c in db.query(KBDocumentChunk).options(
+                joinedload(KBDocumentChunk.document)
+            ).filter(KBDocumentChunk.id.in_([chunk_id for chunk_id, _ in similar]))
+        }
 
         results = []
         seen_docs = set()
         for chunk_id, score in similar:
-            chunk = next((c for c in chunks if c.id == chunk_id), None)
+            chunk = chunks.get(chunk_id)
             if chunk and chunk.document_id not in seen_docs:
                 doc = chunk.document
                 seen_docs.add(doc.id)
@@ -882,7 +974,7 @@ class KnowledgeBaseService:
         """Search FAQs by embedding similarity"""
         query = db.query(KBFaq).filter(
             KBFaq.is_active == True,
-            KBFaq.embedding.isnot(None)
+            KBFaq.embedding_q.isnot(None)
         )
         if category_ids:
             query = query.filter(KBFaq.category_id.in_(category_ids))
@@ -898,13 +990,15 @@ class KnowledgeBaseService:
         elif not include_global:
             query = query.filter(KBFaq.lounge_id.is_(None))
 
-        faqs = query.all()
-
-        candidates = [(f.id, f.embedding) for f in faqs if f.embedding]
-        if not candidates:
-            return []
-
-        similar = ai_service.find_most_similar(query_embedding, candidates, limit)
+        similar = self._rank_two_stage(
+            db, ("faqs", lounge_id, include_global, tuple(sorted(category_ids or ()))),
+            query, KBFaq.id, KBFaq.embedding_q, KBFaq.embedding,
+            [func.count(KBFaq.id), func.max(KBFaq.updated_at)],
+            query_embedding, limit
+        )
+        faqs = db.query(KBFaq).options(defer(KBFaq.embedding)).filter(
+            KBFaq.id.in_([faq_id for faq_id, _ in similar])
+        ).all() if similar else []
 
         results = []
         for faq_id, score in similar:
@@ -976,9 +1070,15 @@ class KnowledgeBaseService:
         entity_types: Optional[List[str]] = None,
         lounge_id: Optional[int] = None,
         include_global: bool = True,
-        similarity_threshold: float = 0.7
+        similarity_threshold: float = 0.7,
+        record_views: bool = True
     ) -> Tuple[str, List[Dict[str, Any]]]:
-        """Get RAG context for AI chat"""
+        """
+        Get RAG context for AI chat
+
+        FAQs served as context count as viewed unless `record_views` is False
+        (admin test queries).
+        """
         logger.info(f"KB get_rag_context called - lounge_id={lounge_id}, include_global={include_global}")
 
         results = await self.semantic_search(
@@ -1007,6 +1107,11 @@ class KnowledgeBaseService:
                     "title": item["title"]
                 })
 
+        if record_views:
+            faq_ids = [source["id"] for source in sources if source["type"] == "faq"]
+            if faq_ids:
+                faq_view_counter.record(faq_ids)
+
         context = "\n\n---\n\n".join(context_parts)
         return context, sources
 
@@ -10,6 +10,7 @@ import logging
 import asyncio
 
 from app.db.models.note import Note, TimeCapsule, CapsuleStatus
+from app.db.expressions import json_array_has
 from app.core.timezone import now_naive, now
 from app.services.ai_service import ai_service
 from app.core.encryption import encrypt_content, decrypt_content
@@ -60,6 +61,7 @@ class NoteService:
             section=section,
             title=title,
             content=encrypt_content(content),
+            word_count=len(content.split()),
             is_pinned=is_pinned,
             is_included_in_rag=is_included_in_rag,
             tags=tags or []
@@ -133,6 +135,7 @@ class NoteService:
 
         if content is not None:
             note.content = encrypt_content(content)
+            note.word_count = len(content.split())
 
         if is_pinned is not None:
             note.is_pinned = is_pinned
@@ -178,7 +181,7 @@ class NoteService:
 
         if tags:
             for tag in tags:
-                base_query = base_query.filter(Note.tags.contains([tag]))
+                base_query = base_query.filter(json_array_has(Note.tags, tag))
 
         title_term = f"%{query}%"
 
@@ -254,7 +257,7 @@ class NoteService:
         query = db.query(Note).filter(Note.user_id == user_id)
         
         for tag in tags:
-            query = query.filter(Note.tags.contains([tag]))
+            query = query.filter(json_array_has(Note.tags, tag))
         
         return query.order_by(Note.updated_at.desc()).all()
     
@@ -372,12 +375,9 @@ class NoteService:
         Returns:
             List of newly unlocked capsules
         """
-        current_time = now_naive()
-
         # Find locked capsules ready to unlock
         capsules = db.query(TimeCapsule).filter(
-            TimeCapsule.status == CapsuleStatus.LOCKED,
-            TimeCapsule.unlock_at <= current_time
+            TimeCapsule.is_unlockable
         ).all()
 
         unlocked = []
@@ -3,6 +3,7 @@ Public Chatbot Service
 Handles the public website chatbot functionality with RAG support
 """
 from typing import List, Dict, Any, Optional, AsyncGenerator, Tuple
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 import logging
 import uuid
@@ -10,7 +11,8 @@ import uuid
 from app.db.models.public_chatbot import PublicChatbotConfig, PublicChatMessage
 from app.services.ai_service import ai_service
 from app.services.knowledge_base_service import knowledge_base_service
-from app.core.config import settings
+from app.services.settings_cache import get_chatbot_config
+from app.core.timezone import now_naive
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +35,7 @@ class PublicChatbotService:
         db: Session,
         data: Dict[str, Any]
     ) -> PublicChatbotConfig:
-        """Update or create chatbot configuration with embedding generation"""
+        """Update or create chatbot configuration"""
         config = await self.get_config(db)
 
         # Filter out empty strings for required fields (let DB defaults apply)
@@ -62,17 +64,6 @@ class PublicChatbotService:
                 if value is not None and hasattr(config, key):
                     setattr(config, key, value)
 
-        # Generate embedding for system prompt if it was updated
-        system_prompt = data.get('system_prompt') or (config.system_prompt if config else None)
-        if system_prompt:
-            try:
-                embedding = await self.ai_service.create_embedding(system_prompt)
-                config.system_prompt_embedding = embedding
-                config.embedding_model = settings.EMBEDDING_MODEL
-                logger.info("Generated embedding for public chatbot system prompt")
-            except Exception as e:
-                logger.error(f"Failed to generate embedding for system prompt: {e}")
-
         db.commit()
         db.refresh(config)
         return config
@@ -135,10 +126,15 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
         limit: int = 20
     ) -> List[Dict[str, str]]:
         """Get conversation history for a session"""
-        messages = db.query(PublicChatMessage).filter(
+        # Plain (role, content) rows: no ORM instances to build and track
+        messages = db.query(
+            PublicChatMessage.role, PublicChatMessage.content
+        ).filter(
             PublicChatMessage.session_id == session_id
         ).order_by(
-            PublicChatMessage.created_at.desc()
+            PublicChatMessage.created_at.desc(),
+            # A turn's two messages share one timestamp (see save_messages)
+            PublicChatMessage.id.desc()
         ).limit(limit).all()
 
         # Reverse to get chronological order
@@ -155,17 +151,37 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
         role: str,
         content: str,
         db: Session
-    ) -> PublicChatMessage:
-        """Save a message to the database"""
-        message = PublicChatMessage(
+    ) -> int:
+        """Save a message to the database and return its id"""
+        result = db.execute(insert(PublicChatMessage).values(
             session_id=session_id,
             role=role,
-            content=content
-        )
-        db.add(message)
+            content=content,
+            created_at=now_naive(),
+        ))
+        db.commit()
+        return result.inserted_primary_key[0]
+
+    async def save_messages(
+        self,
+        session_id: str,
+        messages: List[Tuple[str, str]],
+        db: Session
+    ) -> None:
+        """Save several (role, content) messages in one executemany INSERT"""
+        # One timestamp for the whole batch rather than a now_naive() call
+        # per row; insertion order is kept by the autoincrement id.
+        created_at = now_naive()
+        db.execute(insert(PublicChatMessage), [
+            {
+                "session_id": session_id,
+                "role": role,
+                "content": content,
+                "created_at": created_at,
+            }
+            for role, content in messages
+        ])
         db.commit()
-        db.refresh(message)
-        return message
 
     async def send_message(
         self,
@@ -175,15 +191,14 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
     ) -> Dict[str, Any]:
         """Send a message and get AI response with RAG"""
         # Get config
-        config = await self.get_config(db)
+        config = get_chatbot_config(db)
         if not config or not config.is_enabled:
             raise ValueError("Chatbot is currently disabled")
 
-        # Save user message
-        await self.save_message(session_id, "user", content, db)
-
-        # Get conversation history
-        history = await self.get_conversation_history(session_id, db)
+        # Get conversation history. The new user message is appended in
+        # memory and written together with the reply once the turn is done.
+        history = await self.get_conversation_history(session_id, db, limit=19)
+        history.append({"role": "user", "content": content})
 
         # Build base system prompt
         base_prompt = config.system_prompt or "You are a helpful assistant for Prompterly."
@@ -206,19 +221,22 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
                 messages=history,
                 context=system_prompt
             )
-
-            # Save AI response
-            await self.save_message(session_id, "assistant", ai_response, db)
-
-            return {
-                "response": ai_response,
-                "session_id": session_id,
-                "sources": sources if sources else None
-            }
         except Exception as e:
             logger.error(f"Error generating chatbot response: {str(e)}")
+            await self.save_message(session_id, "user", content, db)
             raise ValueError(f"Failed to generate response: {str(e)}")
 
+        # Save both sides of the turn in one round-trip
+        await self.save_messages(
+            session_id, [("user", content), ("assistant", ai_response)], db
+        )
+
+        return {
+            "response": ai_response,
+            "session_id": session_id,
+            "sources": sources if sources else None
+        }
+
     async def send_message_stream(
         self,
         session_id: str,
@@ -227,7 +245,7 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Send a message and stream AI response with RAG"""
         # Get config
-        config = await self.get_config(db)
+        config = get_chatbot_config(db)
         if not config or not config.is_enabled:
             yield {
                 "event": "error",
@@ -236,13 +254,13 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
             return
 
         # Save user message
-        user_msg = await self.save_message(session_id, "user", content, db)
+        user_msg_id = await self.save_message(session_id, "user", content, db)
 
         # Yield user message event
         yield {
             "event": "user_message",
             "data": {
-                "id": user_msg.id,
+                "id": user_msg_id,
                 "role": "user",
                 "content": content
             }
@@ -287,13 +305,13 @@ Remember: Use the knowledge above when relevant, but also rely on your general c
                 }
 
             # Save AI response after streaming completes
-            ai_msg = await self.save_message(session_id, "assistant", full_response, db)
+            ai_msg_id = await self.save_message(session_id, "assistant", full_response, db)
 
             # Yield completion event
             yield {
                 "event": "ai_complete",
                 "data": {
-                    "id": ai_msg.id,
+                    "id": ai_msg_id,
                     "role": "assistant",
                     "content": full_response,
                     "sources": sources if sources else None
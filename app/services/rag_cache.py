@@ -0,0 +1,307 @@
+"""
+In-process cache of KB embedding matrices for RAG retrieval
+
+Each semantic search used to load every candidate row's embedding from
+MySQL and score it pair by pair. The cache keeps, per search scope (entity
+type + lounge/category filters), one contiguous L2-normalised float32
+matrix of the first-stage `embedding_q` vectors plus the parallel id array,
+so scoring is a single matrix-vector product.
+
+The cache is bounded by `settings.RAG_CACHE_MAX_MB` (matrix and index
+bytes, held once per worker process) as well as by entry count; least recently used
+scopes are evicted first.
+
+Entries carry a version tuple (row count / max id / max updated_at of the
+scope) that the caller reads with one aggregate query per search; a
+changed version rebuilds the entry, which keeps multiple worker processes
+consistent. ORM writes to KB models in this process also mark the scopes
+they can affect stale immediately (see the mapper listeners at the bottom).
+
+Scopes with at least `HNSW_MIN_ROWS` vectors also get a FAISS HNSW graph
+index when `faiss` is installed, so a search visits a few hundred graph
+nodes instead of scanning every row. The graph is built on a background
+thread: a stale indexed scope keeps answering from its previous matrix
+until the replacement is ready, and a scope seen for the first time is
+scanned exactly until its graph exists. Below that size, or without
+faiss, the exact scan is used; it is faster than building a graph for a
+matrix that gets rebuilt whenever the KB changes.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, Callable, Collection, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+)
+
+import numpy as np
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.knowledge_base import KBPrompt, KBDocument, KBDocumentChunkEmbedding, KBFaq
+
+logger = logging.getLogger(__name__)
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+    logger.info("faiss not installed — RAG search uses exact matrix scans only")
+
+# Scopes at least this large are searched through an HNSW index
+HNSW_MIN_ROWS = 50_000
+HNSW_NEIGHBOURS = 32
+HNSW_EF_SEARCH = 64
+
+
+class EmbeddingMatrix(NamedTuple):
+    """Row-aligned ids and unit-length embeddings for one search scope"""
+    ids: np.ndarray      # int64, shape (N,)
+    vectors: np.ndarray  # float32, shape (N, D)
+    index: Optional[Any] = None  # faiss.IndexHNSWFlat over `vectors`, large scopes only
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the arrays and the index, for the cache's byte budget"""
+        total = self.ids.nbytes + self.vectors.nbytes
+        if self.index is not None:
+            # IndexHNSWFlat keeps its own copy of the vectors, plus 2 * M
+            # int32 neighbour links per node on the base layer
+            total += self.vectors.nbytes + self.ids.shape[0] * 2 * HNSW_NEIGHBOURS * 4
+        return total
+
+    def top_k(self, query_embedding: Iterable[float], k: int) -> List[Tuple[int, float]]:
+        """Return the `k` best (id, cosine similarity) pairs, best first"""
+        n = self.ids.shape[0]
+        if n == 0 or k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query = query / norm
+
+        k = min(k, n)
+        if self.index is not None:
+            params = faiss.SearchParametersHNSW(efSearch=max(HNSW_EF_SEARCH, k))
+            scores, rows = self.index.search(query.reshape(1, -1), k, params=params)
+            return [
+                (int(self.ids[row]), float(score))
+                for row, score in zip(rows[0], scores[0]) if row >= 0
+            ]
+
+        scores = self.vectors @ query
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[i]), float(scores[i])) for i in top]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, Any]]) -> "EmbeddingMatrix":
+        """Build from (id, vector) rows, skipping rows without a vector"""
+        rows = [(row_id, vector) for row_id, vector in rows if vector is not None]
+        if not rows:
+            return cls(np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32))
+
+        ids = np.fromiter((row_id for row_id, _ in rows), dtype=np.int64, count=len(rows))
+        vectors = np.vstack([np.asarray(vector, dtype=np.float32) for _, vector in rows])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return cls(ids, np.ascontiguousarray(vectors / norms))
+
+    @property
+    def wants_index(self) -> bool:
+        """Whether this matrix is large enough for an HNSW index (and faiss is available)"""
+        return faiss is not None and self.index is None and self.ids.shape[0] >= HNSW_MIN_ROWS
+
+    def with_index(self) -> "EmbeddingMatrix":
+        """Copy of this matrix with an HNSW index over `vectors` (slow: seconds per 100k rows)"""
+        # Inner product of unit vectors is cosine similarity
+        index = faiss.IndexHNSWFlat(self.vectors.shape[1], HNSW_NEIGHBOURS, faiss.METRIC_INNER_PRODUCT)
+        index.add(self.vectors)
+        return self._replace(index=index)
+
+
+class RagEmbeddingCache:
+    """Bounded LRU of `EmbeddingMatrix` entries keyed by search scope"""
+
+    MAX_ENTRIES = 128
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._bytes = 0
+        # scope -> (version, matrix); version None marks an entry stale
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[Tuple], EmbeddingMatrix]]" = OrderedDict()
+        # Bumped on every store/invalidate so a background build can tell
+        # whether the scope changed while it was running
+        self._generations: Dict[Hashable, int] = {}
+        self._building: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        # One builder thread: HNSW construction is CPU-bound
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-index")
+
+    def get(
+        self,
+        db: Session,
+        scope: Hashable,
+        version: Tuple,
+        loader: Callable[[Session], Iterable[Tuple[int, Any]]]
+    ) -> EmbeddingMatrix:
+        """
+        Return the matrix for `scope`, rebuilding it via `loader` when the
+        cached entry is missing or was built for a different `version`.
+
+        `loader(session)` returns the scope's (id, vector) rows; it is called
+        with `db` on the request path, or with a fresh session on the
+        background thread. A stale entry that has an HNSW index is returned
+        as is while its replacement is built in the background.
+        """
+        with self._lock:
+            entry = self._entries.get(scope)
+            if entry is not None:
+                cached_version, matrix = entry
+                if cached_version == version or matrix.index is not None:
+                    self._entries.move_to_end(scope)
+                    if cached_version != version:
+                        self._schedule(scope, version, loader)
+                    return matrix
+
+        matrix = EmbeddingMatrix.from_rows(loader(db))
+        logger.info(f"RAG cache rebuilt scope={scope}: {matrix.ids.shape[0]} vectors")
+
+        with self._lock:
+            self._store(scope, version, matrix)
+            if matrix.wants_index:
+                self._schedule(scope, version, loader, matrix)
+        return matrix
+
+    def invalidate(
+        self, entity_type: Optional[str] = None, lounge_ids: Optional[Collection[Optional[int]]] = None
+    ) -> None:
+        """
+        Mark the entries that rows of `entity_type` in `lounge_ids` can
+        belong to as stale (every entry when `entity_type` is None; every
+        entry of that type when `lounge_ids` is None).
+        """
+        with self._lock:
+            for scope, (_, matrix) in list(self._entries.items()):
+                if entity_type is None or _scope_covers(scope, entity_type, lounge_ids):
+                    self._entries[scope] = (None, matrix)
+                    self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def _store(self, scope: Hashable, version: Optional[Tuple], matrix: EmbeddingMatrix) -> None:
+        """
+        Insert or replace an entry and evict least recently used ones past
+        `max_entries` / `max_bytes`; caller holds the lock. The new entry
+        itself is kept even if it alone exceeds the byte budget.
+        """
+        replaced = self._entries.pop(scope, None)
+        if replaced is not None:
+            self._bytes -= replaced[1].nbytes
+        self._entries[scope] = (version, matrix)
+        self._bytes += matrix.nbytes
+        self._generations[scope] = self._generations.get(scope, 0) + 1
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            evicted, (_, evicted_matrix) = self._entries.popitem(last=False)
+            self._bytes -= evicted_matrix.nbytes
+            self._generations.pop(evicted, None)
+
+    def _schedule(
+        self, scope: Hashable, version: Tuple, loader: Callable[[Session], Iterable[Tuple[int, Any]]],
+        matrix: Optional[EmbeddingMatrix] = None
+    ) -> None:
+        """Queue a background (re)build of `scope`, at most one at a time; caller holds the lock"""
+        if scope in self._building:
+            return
+        self._building.add(scope)
+        self._executor.submit(
+            self._build, scope, version, loader, matrix, self._generations.get(scope, 0)
+        )
+
+    def _build(
+        self, scope: Hashable, version: Tuple, loader: Callable[[Session], Iterable[Tuple[int, Any]]],
+        matrix: Optional[EmbeddingMatrix], generation: int
+    ) -> None:
+        """Load `scope` (unless `matrix` is given), index it if large, and swap it in"""
+        try:
+            if matrix is None:
+                from app.db.session import SessionLocal
+                with SessionLocal() as session:
+                    matrix = EmbeddingMatrix.from_rows(loader(session))
+            if matrix.wants_index:
+                matrix = matrix.with_index()
+            logger.info(f"RAG cache indexed scope={scope}: {matrix.ids.shape[0]} vectors")
+
+            with self._lock:
+                # Written to (or rebuilt) meanwhile: serve this matrix, but stale
+                if self._generations.get(scope, 0) != generation:
+                    version = None
+                self._store(scope, version, matrix)
+        except Exception as e:
+            logger.error(f"RAG cache background build failed scope={scope}: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._building.discard(scope)
+
+
+def _scope_covers(scope: Tuple, entity_type: str, lounge_ids: Optional[Collection[Optional[int]]]) -> bool:
+    """
+    Whether rows of `entity_type` in any of `lounge_ids` (None = global) can
+    be part of `scope`, an (entity type, lounge_id, include_global, ...) key
+    """
+    scope_type, lounge_id, include_global = scope[:3]
+    if scope_type != entity_type:
+        return False
+    if lounge_ids is None:
+        return True
+    if lounge_id is None:
+        # No lounge filter: every row, or only global rows
+        return include_global or None in lounge_ids
+    return lounge_id in lounge_ids or (include_global and None in lounge_ids)
+
+
+# Singleton instance
+rag_embedding_cache = RagEmbeddingCache(max_bytes=settings.RAG_CACHE_MAX_MB * 1024 * 1024)
+
+# Search scope entity type of each cached model
+_ENTITY_TYPES = {
+    KBPrompt: "prompts",
+    KBDocument: "documents",
+    KBDocumentChunkEmbedding: "documents",
+    KBFaq: "faqs",
+}
+
+
+def _affected_lounges(mapper, target, updating: bool) -> Optional[Set[Optional[int]]]:
+    """
+    Lounges whose scopes a write to `target` can change, or None for every
+    scope of its type. Read from attribute history only: loading an
+    expired attribute in the middle of a flush is not an option.
+    """
+    # Chunk embeddings don't carry their document's lounge
+    if "lounge_id" not in mapper.attrs:
+        return None
+    history = inspect(target).attrs.lounge_id.history
+    if updating and history.added and not history.deleted:
+        # Moved, but the previous lounge was never loaded (expired on commit)
+        return None
+    return {*history.added, *history.unchanged, *history.deleted} or None
+
+
+def _invalidate_on_write(mapper, connection, target):
+    rag_embedding_cache.invalidate(_ENTITY_TYPES[type(target)], _affected_lounges(mapper, target, False))
+
+
+def _invalidate_on_update(mapper, connection, target):
+    rag_embedding_cache.invalidate(_ENTITY_TYPES[type(target)], _affected_lounges(mapper, target, True))
+
+
+for _model in _ENTITY_TYPES:
+    event.listen(_model, "after_insert", _invalidate_on_write)
+    event.listen(_model, "after_update", _invalidate_on_update)
+    event.listen(_model, "after_delete", _invalidate_on_write)
@@ -0,0 +1,87 @@
+"""
+Per-process TTL cache for rarely-changing configuration rows
+
+The public chatbot reads its single `PublicChatbotConfig` row on every
+message and every page load of the marketing site, although it only
+changes when an admin saves the settings form. Reads are served from a
+short-lived in-process snapshot instead; writes through the ORM in this
+process invalidate it immediately and the TTL bounds staleness in the
+other workers.
+"""
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.db.models.public_chatbot import PublicChatbotConfig
+
+
+class TTLCache:
+    """Small thread-safe mapping whose entries expire `ttl` seconds after load"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, calling `loader` on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        value = loader()
+
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._entries.clear()
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or everything when `key` is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+# Singleton instance
+settings_cache = TTLCache()
+
+_CHATBOT_CONFIG_KEY = ("public_chatbot_config",)
+
+
+def get_chatbot_config(db: Session) -> Optional[SimpleNamespace]:
+    """
+    Get a read-only snapshot of the public chatbot configuration
+
+    Returns a plain namespace with the row's column values (not an ORM
+    instance, so it is safe to share across sessions and threads), or
+    None when no configuration exists yet.
+    """
+    def _load() -> Optional[SimpleNamespace]:
+        config = db.query(PublicChatbotConfig).first()
+        if config is None:
+            return None
+        return SimpleNamespace(**{
+            attr.key: getattr(config, attr.key)
+            for attr in inspect(PublicChatbotConfig).column_attrs
+        })
+
+    return settings_cache.get(_CHATBOT_CONFIG_KEY, _load)
+
+
+def _invalidate_chatbot_config(mapper, connection, target):
+    settings_cache.invalidate(_CHATBOT_CONFIG_KEY)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(PublicChatbotConfig, _event_name, _invalidate_chatbot_config)
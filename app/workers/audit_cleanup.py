@@ -1,6 +1,7 @@
 """
 Audit log cleanup worker.
-Deletes audit log entries older than 12 months per security doc.
+Deletes audit log entries older than 12 months per security doc, and
+prunes short-lived idempotency / OTP rows.
 Run monthly via cron.
 """
 import logging
@@ -62,6 +63,33 @@ def cleanup_processed_stripe_events():
         db.close()
 
 
+def cleanup_expired_email_otps():
+    """
+    Delete email OTP rows that expired more than a day ago.
+
+    Codes are only valid for minutes, and superseded codes are marked
+    verified rather than deleted, so without pruning every lookup index
+    probe for an address walks its whole OTP history.
+    """
+    db = SessionLocal()
+    cutoff = now_naive() - timedelta(days=1)
+
+    try:
+        result = db.execute(
+            text("DELETE FROM email_otps WHERE expires_at < :cutoff"),
+            {"cutoff": cutoff}
+        )
+        deleted = result.rowcount
+        db.commit()
+        logger.info(f"Email OTP cleanup: deleted {deleted} rows expired before {cutoff}")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Email OTP cleanup failed: {e}", exc_info=True)
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     cleanup_audit_logs()
     cleanup_processed_stripe_events()
+    cleanup_expired_email_otps()
@@ -154,6 +154,33 @@ def auth_headers():
     return _headers
 
 
+@pytest.fixture()
+def count_queries(test_engine):
+    """Context-manager factory counting SQL statements sent to the test DB.
+
+        with count_queries() as queries:
+            client.get(...)
+        assert queries["n"] <= 3
+    """
+    from contextlib import contextmanager
+    from sqlalchemy import event
+
+    @contextmanager
+    def _count():
+        queries = {"n": 0}
+
+        def _before_cursor_execute(*args, **kwargs):
+            queries["n"] += 1
+
+        event.listen(test_engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _count
+
+
 @pytest.fixture()
 def synced_support_styles(db_session):
     """Ensure the support-style catalogue is mirrored to the test DB.
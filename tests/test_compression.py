@@ -0,0 +1,222 @@
+"""
+Response compression middleware tests.
+
+A small FastAPI app wrapped in `CompressionMiddleware` covers negotiation,
+the size threshold and the rewritten headers. Streamed responses are driven
+at the ASGI level so the test can see what reaches the client before the
+app has finished sending.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+BIG_PAYLOAD = {"items": [{"id": i, "title": f"Prompt {i}"} for i in range(200)]}
+SMALL_PAYLOAD = {"ok": True}
+
+
+def _decoders():
+    decoders = {"gzip": gzip.decompress}
+    try:
+        import zstandard
+        decoders["zstd"] = zstandard.ZstdDecompressor().decompress
+    except ImportError:
+        pass
+    try:
+        import brotli
+        decoders["br"] = brotli.decompress
+    except ImportError:
+        pass
+    return decoders
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/big")
+    def big():
+        return JSONResponse(BIG_PAYLOAD)
+
+    @app.get("/small")
+    def small():
+        return JSONResponse(SMALL_PAYLOAD)
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(b"x" * 4000, headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a" * 2000, b"b" * 2000]), media_type="text/plain")
+
+    @app.get("/sse")
+    def sse():
+        return StreamingResponse(
+            iter([f"data: {'t' * 2000}\n\n".encode()]), media_type="text/event-stream"
+        )
+
+    return TestClient(app)
+
+
+def _get_raw(client, path, accept_encoding):
+    """Status, headers and the body bytes as sent, before httpx decodes them"""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response.status_code, response.headers, b"".join(response.iter_raw())
+
+
+# ---------------------------------------------------------------------------
+# Negotiation
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, zstd;q=0.1", "zstd"),  # server order beats q-values
+        ("gzip, br", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("gzip", "gzip"),
+        ("zstd;q=0, br;q=0.0, gzip", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("", None),
+    ],
+)
+def test_choose_encoding_prefers_zstd_then_br_then_gzip(monkeypatch, accept_encoding, expected):
+    monkeypatch.setattr(compression, "_PREFERENCE", ["zstd", "br", "gzip"])
+    assert choose_encoding(accept_encoding) == expected
+
+
+def test_choose_encoding_skips_encoders_that_are_not_installed(monkeypatch):
+    monkeypatch.setattr(compression, "_PREFERENCE", ["gzip"])
+    assert choose_encoding("zstd, br, gzip") == "gzip"
+    assert choose_encoding("zstd, br") is None
+
+
+@pytest.mark.parametrize("encoding", ["zstd", "br", "gzip"])
+def test_large_body_is_compressed_with_negotiated_encoding(client, encoding):
+    decode = _decoders().get(encoding)
+    if decode is None or encoding not in compression._ENCODERS:
+        pytest.skip(f"{encoding} support not installed")
+
+    status, headers, raw = _get_raw(client, "/big", f"{encoding}, identity")
+
+    assert status == 200
+    assert headers["content-encoding"] == encoding
+    assert json.loads(decode(raw)) == BIG_PAYLOAD
+
+
+def test_identity_only_client_gets_uncompressed_body(client):
+    status, headers, raw = _get_raw(client, "/big", "identity")
+
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert json.loads(raw) == BIG_PAYLOAD
+
+
+# ---------------------------------------------------------------------------
+# Headers and size threshold
+# ---------------------------------------------------------------------------
+
+def test_compressed_response_headers(client):
+    _, headers, raw = _get_raw(client, "/big", "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert int(headers["content-length"]) == len(raw)
+    assert len(raw) < len(json.dumps(BIG_PAYLOAD))
+    assert "accept-encoding" in headers["vary"].lower()
+
+
+def test_body_below_minimum_size_passes_through(client):
+    _, headers, raw = _get_raw(client, "/small", "gzip")
+
+    assert len(raw) < compression.DEFAULT_MINIMUM_SIZE
+    assert "content-encoding" not in headers
+    assert int(headers["content-length"]) == len(raw)
+    assert json.loads(raw) == SMALL_PAYLOAD
+
+
+def test_already_encoded_body_is_not_compressed_twice(client):
+    _, headers, raw = _get_raw(client, "/encoded", "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert raw == b"x" * 4000
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("path", ["/stream", "/sse"])
+def test_streamed_responses_pass_through_uncompressed(client, path):
+    _, headers, raw = _get_raw(client, path, "gzip")
+
+    assert "content-encoding" not in headers
+    assert len(raw) >= 2000
+
+
+async def _drive(inner_app, sent, accept_encoding="gzip"):
+    """Run `inner_app` behind the middleware, appending downstream messages to `sent`"""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    await CompressionMiddleware(inner_app)(scope, receive, send)
+
+
+async def test_streamed_chunks_are_forwarded_before_the_response_ends():
+    sent = []
+    forwarded_before_last_chunk = []
+
+    async def inner_app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain")],
+        })
+        await send({"type": "http.response.body", "body": b"a" * 4000, "more_body": True})
+        forwarded_before_last_chunk.extend(sent)
+        await send({"type": "http.response.body", "body": b"b", "more_body": False})
+
+    await _drive(inner_app, sent)
+
+    assert [m["type"] for m in forwarded_before_last_chunk] == [
+        "http.response.start", "http.response.body",
+    ]
+    assert b"content-encoding" not in dict(forwarded_before_last_chunk[0]["headers"])
+    assert forwarded_before_last_chunk[1]["body"] == b"a" * 4000
+    assert sent[-1]["body"] == b"b"
+
+
+async def test_complete_sse_body_is_not_compressed():
+    async def inner_app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream; charset=utf-8")],
+        })
+        await send({"type": "http.response.body", "body": b"data: " + b"t" * 4000 + b"\n\n"})
+
+    sent = []
+    await _drive(inner_app, sent)
+
+    assert b"content-encoding" not in dict(sent[0]["headers"])
+    assert sent[1]["body"] == b"data: " + b"t" * 4000 + b"\n\n"
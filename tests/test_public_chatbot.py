@@ -0,0 +1,37 @@
+"""
+Public chatbot config endpoint tests.
+
+The config is served from the per-process settings cache, so each test
+starts from an empty cache: row cleanup between tests bypasses the ORM
+events that would otherwise invalidate it.
+"""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _empty_settings_cache():
+    from app.services.settings_cache import settings_cache
+    settings_cache.invalidate()
+    yield
+    settings_cache.invalidate()
+
+
+def test_config_returns_public_fields(client, db_session):
+    from app.db.models.public_chatbot import PublicChatbotConfig
+
+    db_session.add(PublicChatbotConfig(name="Helper", welcome_message="Hello"))
+    db_session.commit()
+
+    response = client.get("/api/v1/public-chatbot/config")
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["name"] == "Helper"
+    assert body["welcome_message"] == "Hello"
+    assert "system_prompt" not in body
+
+
+def test_config_missing_returns_404(client):
+    response = client.get("/api/v1/public-chatbot/config")
+    assert response.status_code == 404, response.text
@@ -0,0 +1,200 @@
+"""
+RAG embedding cache tests.
+
+Exercise `RagEmbeddingCache` directly with in-memory rows; the loader is
+called with whatever session `get` receives, so no database is needed.
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+
+def _rows(n, dim=4):
+    return [(i, [float(i + 1)] + [1.0] * (dim - 1)) for i in range(n)]
+
+
+def _scope(lounge_id, include_global=False):
+    return ("prompts", lounge_id, include_global, ())
+
+
+def _wait_for_builds(cache):
+    # One builder thread, FIFO: this returns once earlier builds are done
+    cache._executor.submit(lambda: None).result(timeout=5)
+
+
+def _cache_with_indexed_entry(scope, n=3):
+    from app.services.rag_cache import EmbeddingMatrix, RagEmbeddingCache
+
+    cache = RagEmbeddingCache()
+    indexed = EmbeddingMatrix.from_rows(_rows(n))._replace(index=object())
+    with cache._lock:
+        cache._store(scope, (n,), indexed)
+    return cache, indexed
+
+
+def test_byte_budget_evicts_least_recently_used_scope():
+    from app.services.rag_cache import EmbeddingMatrix, RagEmbeddingCache
+
+    entry_bytes = EmbeddingMatrix.from_rows(_rows(10)).nbytes
+    cache = RagEmbeddingCache(max_bytes=2 * entry_bytes)
+
+    cache.get(None, _scope(1), (10,), lambda session: _rows(10))
+    cache.get(None, _scope(2), (10,), lambda session: _rows(10))
+    cache.get(None, _scope(1), (10,), lambda session: _rows(10))  # touch 1
+    cache.get(None, _scope(3), (10,), lambda session: _rows(10))
+
+    assert list(cache._entries) == [_scope(1), _scope(3)]
+    assert cache._bytes == 2 * entry_bytes
+
+
+def test_entry_larger_than_budget_is_still_cached():
+    from app.services.rag_cache import RagEmbeddingCache
+
+    cache = RagEmbeddingCache(max_bytes=1)
+    cache.get(None, _scope(1), (10,), lambda session: _rows(10))
+    cache.get(None, _scope(2), (10,), lambda session: _rows(10))
+
+    assert list(cache._entries) == [_scope(2)]
+
+
+def test_stale_indexed_scope_is_served_while_its_rebuild_runs():
+    cache, indexed = _cache_with_indexed_entry(_scope(1))
+    release = threading.Event()
+
+    def slow_loader(session):
+        release.wait(5)
+        return _rows(5)
+
+    assert cache.get(None, _scope(1), (5,), slow_loader) is indexed
+    assert cache.get(None, _scope(1), (5,), slow_loader) is indexed
+    release.set()
+    _wait_for_builds(cache)
+
+    rebuilt = cache.get(
+        None, _scope(1), (5,), lambda session: pytest.fail("reloaded on the request path")
+    )
+    assert rebuilt.ids.shape[0] == 5
+
+
+def test_write_during_build_leaves_the_entry_stale():
+    cache, _ = _cache_with_indexed_entry(_scope(1))
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader(session):
+        started.set()
+        release.wait(5)
+        return _rows(5)
+
+    cache.get(None, _scope(1), (5,), slow_loader)
+    assert started.wait(5)
+    cache.invalidate("prompts", {1})
+    release.set()
+    _wait_for_builds(cache)
+
+    version, matrix = cache._entries[_scope(1)]
+    assert version is None
+    assert matrix.ids.shape[0] == 5
+
+
+@pytest.mark.parametrize("scope, lounge_ids, covered", [
+    # No lounge filter, globals included: every row
+    (_scope(None, True), {5}, True),
+    (_scope(None, True), {None}, True),
+    # No lounge filter, globals excluded: global rows only
+    (_scope(None, False), {5}, False),
+    (_scope(None, False), {None}, True),
+    # One lounge, with or without globals
+    (_scope(5, True), {5}, True),
+    (_scope(5, True), {None}, True),
+    (_scope(5, True), {6}, False),
+    (_scope(5, False), {5}, True),
+    (_scope(5, False), {None}, False),
+    # Moved between lounges: either side counts
+    (_scope(5, False), {6, 5}, True),
+    # Unknown lounge: every scope of the type
+    (_scope(5, False), None, True),
+    # Other entity type
+    (("faqs", None, True, ()), {5}, False),
+])
+def test_scope_covers(scope, lounge_ids, covered):
+    from app.services.rag_cache import _scope_covers
+
+    assert _scope_covers(scope, "prompts", lounge_ids) is covered
+
+
+@pytest.fixture()
+def lounge_scoped_cache(monkeypatch):
+    """A fresh module cache holding one fresh entry per lounge 1-3"""
+    import app.services.rag_cache as rag_cache_mod
+
+    cache = rag_cache_mod.RagEmbeddingCache()
+    monkeypatch.setattr(rag_cache_mod, "rag_embedding_cache", cache)
+
+    def _fill():
+        for lounge_id in (1, 2, 3):
+            cache.get(None, _scope(lounge_id), (1,), lambda session: _rows(1))
+
+    def _stale():
+        return {scope[1] for scope, (version, _) in cache._entries.items() if version is None}
+
+    return _fill, _stale
+
+
+def _add_prompt(db_session, lounge_id):
+    from app.db.models.knowledge_base import KBPrompt
+
+    prompt = KBPrompt(title="P", content="body", lounge_id=lounge_id)
+    db_session.add(prompt)
+    db_session.commit()
+    return prompt
+
+
+def test_update_marks_old_and_new_lounge_stale(db_session, lounge_scoped_cache):
+    fill, stale = lounge_scoped_cache
+    prompt = _add_prompt(db_session, 1)
+    fill()
+
+    assert prompt.lounge_id == 1  # previous value loaded
+    prompt.lounge_id = 2
+    db_session.commit()
+
+    assert stale() == {1, 2}
+
+
+def test_update_with_unloaded_previous_lounge_marks_every_scope_stale(
+    db_session, lounge_scoped_cache,
+):
+    fill, stale = lounge_scoped_cache
+    prompt = _add_prompt(db_session, 1)  # commit expired lounge_id
+    fill()
+
+    prompt.lounge_id = 2
+    db_session.commit()
+
+    assert stale() == {1, 2, 3}
+
+
+def test_update_in_place_marks_only_its_lounge_stale(db_session, lounge_scoped_cache):
+    fill, stale = lounge_scoped_cache
+    prompt = _add_prompt(db_session, 1)
+    fill()
+
+    assert prompt.lounge_id == 1
+    prompt.title = "Renamed"
+    db_session.commit()
+
+    assert stale() == {1}
+
+
+def test_delete_marks_its_lounge_stale(db_session, lounge_scoped_cache):
+    fill, stale = lounge_scoped_cache
+    prompt = _add_prompt(db_session, 3)
+    fill()
+
+    assert prompt.lounge_id == 3
+    db_session.delete(prompt)
+    db_session.commit()
+
+    assert stale() == {3}
@@ -0,0 +1,63 @@
+"""
+Startup model checks.
+
+`check_mapper_registry` and `check_statement_caching` run outside the
+lifespan's best-effort error handling, so a broken model registry or a
+column type that disables the statement cache must stop the app from
+starting rather than being logged and ignored.
+"""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import Column, Integer
+from sqlalchemy.orm import declarative_base
+
+
+def _registry_with_duplicate_mapping():
+    base = declarative_base()
+
+    class First(base):
+        __tablename__ = "duplicated"
+        id = Column(Integer, primary_key=True)
+
+    class Second(base):  # stale copy of First mapped onto the same table
+        __table__ = First.__table__
+
+    # The registry only holds its classes weakly: the caller keeps them alive
+    return base, (First, Second)
+
+
+def test_duplicate_mapping_stops_startup(test_engine, monkeypatch):
+    from fastapi.testclient import TestClient
+    import app.db.session as session_mod
+    from app.main import app
+
+    base, _mapped = _registry_with_duplicate_mapping()
+    monkeypatch.setattr(session_mod, "Base", base)
+
+    with pytest.raises(RuntimeError, match="Duplicate ORM mappings"):
+        with TestClient(app):
+            pass
+
+
+def test_uncacheable_column_type_stops_startup(test_engine, monkeypatch):
+    from fastapi.testclient import TestClient
+    from sqlalchemy.types import TypeDecorator
+    import app.db.session as session_mod
+    from app.main import app
+
+    class Uncached(TypeDecorator):  # no cache_ok = True
+        impl = Integer
+
+    base = declarative_base()
+
+    class Row(base):
+        __tablename__ = "uncached"
+        id = Column(Integer, primary_key=True)
+        value = Column(Uncached())
+
+    monkeypatch.setattr(session_mod, "Base", base)
+
+    with pytest.raises(RuntimeError, match="cache_ok"):
+        with TestClient(app):
+            pass
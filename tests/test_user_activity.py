@@ -0,0 +1,45 @@
+"""
+User relationship loading tests.
+
+`User` collections are `lazy="raise_on_sql"`, so any endpoint still
+reaching through `current_user.<collection>` fails loudly. The activity
+feed must query each collection explicitly, with a statement count that
+doesn't grow with the number of rows.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+
+
+def _add_notes_and_capsules(db_session, user, n):
+    from app.core.timezone import now_naive
+    from app.db.models.note import Note, TimeCapsule
+
+    for i in range(n):
+        db_session.add(Note(user_id=user.id, title=f"Note {i}", content="body"))
+        db_session.add(TimeCapsule(
+            user_id=user.id, title=f"Capsule {i}", content="body",
+            unlock_at=now_naive() + timedelta(days=30),
+        ))
+    db_session.commit()
+
+
+def test_activity_feed_does_not_lazy_load_user_collections(
+    client, make_user, auth_headers, db_session, count_queries,
+):
+    user = make_user()
+    headers = auth_headers(user)
+
+    _add_notes_and_capsules(db_session, user, 1)
+    with count_queries() as few:
+        response = client.get("/api/v1/users/me/activity", headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 2
+
+    _add_notes_and_capsules(db_session, user, 5)
+    with count_queries() as many:
+        response = client.get("/api/v1/users/me/activity", headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 12
+
+    assert many["n"] == few["n"]